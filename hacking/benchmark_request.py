@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# Copyright 2017, Ansible by Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure how much time tower-cli's API client adds to each request.
+
+The transport is stubbed out below the client: `Client._send_now`, which hands
+the request to requests, answers at once with a canned response. One arm calls
+that stub directly, the other makes the request through `client.get`, so both
+share the same transport and what differs is only the client's own work. The
+arms run interleaved, and the median of the paired differences is reported
+with its spread.
+
+usage: python hacking/benchmark_request.py [-n REQUESTS] [-r ROUNDS]
+"""
+
+from __future__ import print_function
+
+import argparse
+import os
+import sys
+import timeit
+
+from requests.structures import CaseInsensitiveDict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from tower_cli.api import APIResponse, Client, client  # NOQA
+from tower_cli.conf import settings  # NOQA
+
+
+def stub_send(self, method, url, args, kwargs, verify_ssl):
+    """Answer every request with an empty JSON object."""
+    response = APIResponse()
+    response.status_code = 200
+    response.headers = CaseInsensitiveDict({'Content-Type': 'application/json'})
+    response._content = b'{}'
+    response.url = url
+    return response
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(fraction * (len(values) - 1))))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('-n', '--requests', type=int, default=2000, help='requests per timing run')
+    parser.add_argument('-r', '--rounds', type=int, default=21, help='interleaved timing runs of each arm')
+    args = parser.parse_args()
+
+    url = 'https://tower.example.com/api/v2/hosts/'
+    real_client = client._get_current_object()
+
+    def transport():
+        stub_send(real_client, 'GET', url, [], {'params': {'page': 2}}, True).json()
+
+    def through_client():
+        client.get('/hosts/', params={'page': 2}).json()
+
+    with settings.runtime_values(host='tower.example.com', username='admin', password='password',
+                                 verbose=False, http_cache=False, rate_limit=0):
+        send_now = Client._send_now
+        Client._send_now = stub_send
+        try:
+            through_client()
+            baseline, total = [], []
+            for i in range(args.rounds):
+                # Alternate which arm goes first, so that neither always runs on a warmer cache.
+                arms = [(transport, baseline), (through_client, total)]
+                for func, times in (arms if i % 2 == 0 else arms[::-1]):
+                    times.append(timeit.timeit(func, number=args.requests) / args.requests * 1e6)
+        finally:
+            Client._send_now = send_now
+
+    overhead = [t - b for b, t in zip(baseline, total)]
+    print('stub transport:    %8.2f us/request (median)' % percentile(baseline, 0.5))
+    print('tower_cli client:  %8.2f us/request (median)' % percentile(total, 0.5))
+    print('client overhead:   %8.2f us/request (median; 25th-75th percentile %.2f-%.2f, %d rounds)' % (
+        percentile(overhead, 0.5), percentile(overhead, 0.25), percentile(overhead, 0.75), len(overhead)))
+
+
+if __name__ == '__main__':
+    main()
@@ -158,6 +158,10 @@ setup(
 
     # How to do the install
     install_requires=parse_requirements('requirements.txt'),
+    extras_require={
+        # The asyncio client, tower_cli.aio.AsyncClient (Python 3.5 and later).
+        'async': ['aiohttp>=3.3'],
+    },
     provides=[
         pkg_name,
     ],
@@ -0,0 +1,283 @@
+# Copyright 2017, Ansible by Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import threading
+
+from six import StringIO
+from six.moves import BaseHTTPServer
+from six.moves.urllib.parse import parse_qsl, urlparse
+
+import tower_cli
+from tower_cli import exceptions as exc
+from tower_cli.conf import settings
+
+from tests.compat import unittest, mock
+
+try:
+    import asyncio
+    import aiohttp  # noqa
+    from tower_cli.aio import AsyncClient, current_client
+except (ImportError, SyntaxError):
+    aiohttp = None
+
+
+class StubHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """Answer each request with the response registered on the server for
+    its method and path, and record it.
+    """
+    def _answer(self):
+        url = urlparse(self.path)
+        length = int(self.headers.get('Content-Length', 0) or 0)
+        body = self.rfile.read(length).decode('utf8') if length else ''
+        self.server.requests.append((self.command, url.path, dict(parse_qsl(url.query)), body,
+                                     self.headers.get('Authorization', None)))
+        answers = self.server.responses.get((self.command, url.path), [(404, {'detail': 'Not found.'})])
+        status, data = answers.pop(0) if len(answers) > 1 else answers[0]
+        content = data.encode('utf8') if isinstance(data, str) else json.dumps(data).encode('utf8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_PATCH = do_DELETE = _answer
+
+    def log_message(self, *args):
+        pass
+
+
+@unittest.skipIf(aiohttp is None, 'The asyncio client needs Python 3.5 or later and aiohttp.')
+class AsyncTests(unittest.TestCase):
+    """A set of tests to establish that the asyncio client and resource
+    methods behave as their synchronous counterparts, against a stub Tower
+    server.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.server = BaseHTTPServer.HTTPServer(('127.0.0.1', 0), StubHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever)
+        cls.thread.daemon = True
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.requests = []
+        self.server.responses = {}
+        self.settings = settings.runtime_values(host='http://127.0.0.1:%d' % self.server.server_port,
+                                                username='alice', password='secret', verify_ssl=False,
+                                                retries=0, verbose=False)
+        self.settings.__enter__()
+
+    def tearDown(self):
+        self.settings.__exit__(None, None, None)
+
+    def register(self, method, path, *answers):
+        self.server.responses[(method, '/api/v2' + path)] = list(answers)
+
+    def run_async(self, coroutine_function, *args, **kwargs):
+        """Run the coroutine with an active AsyncClient on a new event loop."""
+        loop = asyncio.new_event_loop()
+        client = AsyncClient()
+        try:
+            with client.activate():
+                return loop.run_until_complete(coroutine_function(*args, **kwargs))
+        finally:
+            loop.run_until_complete(client.close())
+            loop.close()
+
+    def test_request_key_order_and_auth(self):
+        """Establish that responses keep the key order of Tower and that
+        requests are authenticated from settings.
+        """
+        self.register('GET', '/config/', (200, '{"zeta": 1, "alpha": 2, "mu": 3}'))
+        r = self.run_async(lambda: current_client().get('/config/'))
+        self.assertEqual(list(r.json().keys()), ['zeta', 'alpha', 'mu'])
+        self.assertTrue(self.server.requests[0][4].startswith('Basic '))
+
+    def test_status_errors(self):
+        """Establish that error statuses raise the same exceptions as the
+        synchronous client.
+        """
+        for status, error in ((400, exc.BadRequest), (401, exc.AuthError), (403, exc.Forbidden),
+                              (404, exc.NotFound), (405, exc.MethodNotAllowed), (500, exc.ServerError)):
+            self.register('GET', '/thing/', (status, {'detail': 'no'}))
+            with self.assertRaises(error):
+                self.run_async(lambda: current_client().get('/thing/'))
+
+    def test_retry(self):
+        """Establish that idempotent requests turned away as overloaded are
+        sent again.
+        """
+        self.register('GET', '/ping/', (503, {}), (200, {'ok': True}))
+        with settings.runtime_values(retries=1):
+            with mock.patch('tower_cli.utils.throttle.backoff', return_value=0):
+                r = self.run_async(lambda: current_client().get('/ping/'))
+        self.assertEqual(r.json(), {'ok': True})
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_no_active_client(self):
+        """Establish that the async methods need an active client."""
+        loop = asyncio.new_event_loop()
+        try:
+            with self.assertRaises(exc.TowerCLIError):
+                loop.run_until_complete(tower_cli.get_resource('user').async_get(1))
+        finally:
+            loop.close()
+
+    def test_get_and_list(self):
+        """Establish that async_get and async_list read as get and list do,
+        reading the later pages of a listing at the same time.
+        """
+        res = tower_cli.get_resource('user')
+        self.register('GET', '/users/1/', (200, {'id': 1, 'username': 'alice'}))
+        self.assertEqual(self.run_async(res.async_get, 1)['username'], 'alice')
+
+        self.register('GET', '/users/', (200, {'count': 3, 'next': '/api/v2/users/?page=2', 'previous': None,
+                                               'results': [{'id': 1}]}),
+                      (200, {'count': 3, 'next': '/api/v2/users/?page=3', 'previous': None, 'results': [{'id': 2}]}),
+                      (200, {'count': 3, 'next': None, 'previous': None, 'results': [{'id': 3}]}))
+        with settings.runtime_values(max_page_size=''):
+            result = self.run_async(res.async_list, all_pages=True)
+        self.assertEqual(sorted(r['id'] for r in result['results']), [1, 2, 3])
+        self.assertEqual(result['next'], None)
+        self.assertEqual(sorted(r[2].get('page', '1') for r in self.server.requests[1:]), ['1', '2', '3'])
+
+    def test_list_bounded_by_pool(self):
+        """Establish that async_list reads no more pages at once than the
+        pool_maxsize setting allows.
+        """
+        res = tower_cli.get_resource('user')
+        self.register('GET', '/users/', (200, {'count': 4, 'next': '/api/v2/users/?page=2', 'previous': None,
+                                               'results': [{'id': 1}]}))
+        reading = []
+        most = []
+
+        async def read_page(kwargs, page):
+            reading.append(page)
+            most.append(len(reading))
+            await asyncio.sleep(0.01)
+            reading.remove(page)
+            return {'count': 4, 'next': None, 'previous': None, 'results': [{'id': page}]}
+        with settings.runtime_values(max_page_size='', pool_maxsize=2):
+            with mock.patch.object(res, '_async_read_page', side_effect=read_page):
+                result = self.run_async(res.async_list, all_pages=True)
+        self.assertEqual(sorted(r['id'] for r in result['results']), [1, 2, 3, 4])
+        self.assertEqual(max(most), 2)
+
+    def test_list_options(self):
+        """Establish that async_list takes the concurrency and pagination
+        of list rather than sending them as filters, and walks the pages
+        by primary key if asked to.
+        """
+        res = tower_cli.get_resource('user')
+        self.register('GET', '/users/', (200, {'count': 3, 'next': '/api/v2/users/?page=2', 'previous': None,
+                                               'results': [{'id': 1}, {'id': 2}]}),
+                      (200, {'count': 3, 'next': None, 'previous': None, 'results': [{'id': 3}]}))
+        with settings.runtime_values(max_page_size=''):
+            result = self.run_async(res.async_list, all_pages=True, concurrency=1, pagination='keyset')
+        self.assertEqual([r['id'] for r in result['results']], [1, 2, 3])
+        self.assertEqual(result['next'], None)
+        self.assertEqual([r[2] for r in self.server.requests], [
+            {'order_by': 'id'}, {'order_by': 'id', 'id__gt': '2'},
+        ])
+
+    def test_ssl_context_made_once(self):
+        """Establish that the SSL context for a certificate bundle is made
+        once per client rather than for every request.
+        """
+        client = AsyncClient()
+        with settings.runtime_values(verify_ssl=True, certificate='/tmp/ca.pem'):
+            with mock.patch('ssl.create_default_context') as create_default_context:
+                self.assertIs(client._ssl(), client._ssl())
+        create_default_context.assert_called_once_with(cafile='/tmp/ca.pem')
+        self.assertIs(client._ssl(), False)
+
+    def test_write_and_delete(self):
+        """Establish that async_write creates or modifies objects and
+        async_delete removes them, as write and delete do.
+        """
+        res = tower_cli.get_resource('team')
+        self.register('GET', '/teams/', (200, {'count': 0, 'results': []}))
+        self.register('POST', '/teams/', (201, {'id': 5, 'name': 'ops', 'organization': 1}))
+        result = self.run_async(res.async_write, name='ops', organization=1, create_on_missing=True)
+        self.assertEqual(list(result.items())[:2], [('changed', True), ('id', 5)])
+        self.assertEqual(json.loads(self.server.requests[-1][3]), {'name': 'ops', 'organization': 1})
+
+        self.register('GET', '/teams/5/', (200, {'id': 5, 'name': 'ops', 'organization': 1}))
+        result = self.run_async(res.async_write, 5, name='ops')
+        self.assertFalse(result['changed'])
+
+        self.register('DELETE', '/teams/5/', (204, ''))
+        self.assertEqual(self.run_async(res.async_delete, 5), {'changed': True})
+        self.register('DELETE', '/teams/6/', (404, {}))
+        self.assertEqual(self.run_async(res.async_delete, 6), {'changed': False})
+
+    def test_wait(self):
+        """Establish that async_wait polls the job until it finishes, and
+        raises if it fails.
+        """
+        res = tower_cli.get_resource('job')
+        self.register('GET', '/jobs/42/', (200, {'id': 42, 'status': 'running', 'failed': False}),
+                      (200, {'id': 42, 'status': 'successful', 'failed': False}))
+        result = self.run_async(res.async_wait, 42, min_interval=0.01)
+        self.assertEqual(result['status'], 'successful')
+
+        self.register('GET', '/jobs/43/', (200, {'id': 43, 'status': 'failed', 'failed': True}))
+        with self.assertRaises(exc.JobFailure):
+            self.run_async(res.async_wait, 43, min_interval=0.01)
+
+    def test_monitor(self):
+        """Establish that async_monitor writes the standard out of the job
+        as it runs.
+        """
+        res = tower_cli.get_resource('job')
+        self.register('GET', '/jobs/42/', (200, {'id': 42, 'status': 'running', 'failed': False}),
+                      (200, {'id': 42, 'status': 'running', 'failed': False}),
+                      (200, {'id': 42, 'status': 'successful', 'failed': False}))
+        self.register('GET', '/jobs/42/stdout/', (200, {'content': 'UExBWSBbYWxsXQo='}))
+        outfile = StringIO()
+        result = self.run_async(res.async_monitor, 42, interval=0.01, outfile=outfile)
+        self.assertEqual(result['id'], 42)
+        self.assertIn('PLAY [all]', outfile.getvalue())
+
+    def test_monitor_events(self):
+        """Establish that async_monitor follows the events of a job as
+        monitor does, asking again for an event that Tower saved late.
+        """
+        res = tower_cli.get_resource('job')
+        self.register('GET', '/jobs/42/', (200, {'id': 42, 'status': 'running', 'failed': False}),
+                      (200, {'id': 42, 'status': 'successful', 'failed': False}))
+        self.register('GET', '/jobs/42/job_events/',
+                      (200, {'next': None, 'results': [{'counter': 1, 'stdout': 'one'},
+                                                       {'counter': 3, 'stdout': 'three'}]}),
+                      (200, {'next': None, 'results': [{'counter': 2, 'stdout': 'two'}]}),
+                      (200, {'next': None, 'results': [{'counter': 4, 'stdout': 'four',
+                                                        'event': 'playbook_on_stats'}]}),
+                      (200, {'next': None, 'results': []}))
+        outfile = StringIO()
+        with settings.runtime_values(max_page_size=''):
+            result = self.run_async(res.async_monitor, 42, interval=0.01, outfile=outfile)
+        self.assertEqual(result['status'], 'successful')
+        self.assertIn('one\nthree\ntwo\nfour\n', outfile.getvalue())
+        queries = [r[2] for r in self.server.requests if r[1].endswith('/job_events/')]
+        self.assertEqual(queries[:3], [
+            {'counter__gt': '0', 'order_by': 'counter'},
+            {'counter__in': '2', 'order_by': 'counter'},
+            {'counter__gt': '3', 'order_by': 'counter'},
+        ])
@@ -14,17 +14,22 @@
 # limitations under the License.
 
 import json
+import os
+import shutil
+import tempfile
+import threading
 import warnings
 from datetime import datetime as dt, timedelta
 
 import requests
+from six.moves.urllib.parse import urlparse
 from requests.sessions import Session
 
 from tower_cli.api import APIResponse, client, BasicTowerAuth,\
         TOWER_DATETIME_FMT
-from tower_cli import exceptions as exc
+from tower_cli import api, context, exceptions as exc
 from tower_cli.conf import settings
-from tower_cli.utils import debug
+from tower_cli.utils import cache, debug, throttle
 from tower_cli.utils.data_structures import OrderedDict
 from tower_cli.constants import CUR_API_VERSION
 
@@ -66,6 +71,30 @@ class ClientTests(unittest.TestCase):
             with self.assertRaises(exc.ConnectionError):
                 client.get_prefix()
 
+    def test_prefix_cached(self):
+        """Establish that the URL prefix is worked out again only when the
+        host changes.
+        """
+        with settings.runtime_values(host='foo.co'):
+            with mock.patch('tower_cli.api.urlparse', wraps=urlparse) as parse:
+                client.get_prefix()
+                self.assertEqual(client.get_prefix(False), 'https://foo.co/api/')
+                self.assertEqual(parse.call_count, 1)
+                with settings.runtime_values(host='bar.co'):
+                    self.assertEqual(client.get_prefix(), 'https://bar.co/api/%s/' % CUR_API_VERSION)
+                self.assertEqual(parse.call_count, 2)
+
+    def test_auth_reused(self):
+        """Establish that requests share an auth object until the
+        credentials change.
+        """
+        with settings.runtime_values(username='alice', password='pass'):
+            auth = client.get_auth()
+            self.assertIs(client.get_auth(), auth)
+            self.assertEqual(auth.username, 'alice')
+            with settings.runtime_values(password='secret'):
+                self.assertEqual(client.get_auth().password, 'secret')
+
     def test_request_ok(self):
         """Establish that a request that returns a valid JSON response
         returns without incident and comes back as an APIResponse.
@@ -139,6 +168,127 @@ class ClientTests(unittest.TestCase):
                             client.get('/ping/')
                         self.assertEqual(dlog.call_count, 5)
 
+    def test_thread_session(self):
+        """Establish that requests from threads other than the one that
+        created the client are made with a session of their own.
+        """
+        sessions = []
+
+        def get_session():
+            sessions.append(client.thread_session)
+            sessions.append(client.thread_session)
+        self.assertIs(client.thread_session, client._get_current_object())
+        thread = threading.Thread(target=get_session)
+        thread.start()
+        thread.join()
+        self.assertIsNot(sessions[0], client._get_current_object())
+        self.assertIs(sessions[0], sessions[1])
+
+    def test_thread_session_test_mode(self):
+        """Establish that the sessions of other threads use the faux
+        adapter while the client is in test mode.
+        """
+        results = []
+
+        def ping():
+            results.append(client.get('/ping/').json())
+        with client.test_mode as t:
+            t.register_json('/ping/', {'status': 'ok'})
+            thread = threading.Thread(target=context.bind(ping))
+            thread.start()
+            thread.join()
+        self.assertEqual(results, [{'status': 'ok'}])
+        self.assertEqual(len(t.requests), 1)
+
+    def test_pool_size(self):
+        """Establish that the connection pools are sized by the pool
+        settings.
+        """
+        session = Session()
+        with settings.runtime_values(pool_connections=4, pool_maxsize=32):
+            client._mount_adapters(session)
+        adapter = session.adapters['https://']
+        self.assertEqual(adapter._pool_connections, 4)
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertEqual(adapter.max_retries.total, 3)
+
+    def test_timeout(self):
+        """Establish that the configured timeouts are sent with requests,
+        and that no timeout is sent if none is configured.
+        """
+        with settings.runtime_values(host='https://foo.co'):
+            with mock.patch.object(Session, 'request') as req:
+                req.return_value.status_code = 200
+                client.get('/ping/')
+                self.assertNotIn('timeout', req.call_args[1])
+                with settings.runtime_values(connect_timeout=3.5, read_timeout=30):
+                    client.get('/ping/')
+                self.assertEqual(req.call_args[1]['timeout'], (3.5, 30.0))
+
+    def test_retry_overloaded(self):
+        """Establish that idempotent requests that Tower turns away as
+        overloaded are sent again after a delay, as Tower asks if it does.
+        """
+        busy = mock.MagicMock(status_code=503, headers={})
+        slow_down = mock.MagicMock(status_code=429, headers={'Retry-After': '7'})
+        ok = mock.MagicMock(status_code=200, headers={})
+        with settings.runtime_values(host='foo.co'):
+            with mock.patch.object(client, '_send', side_effect=[busy, slow_down, ok]) as send:
+                with mock.patch('tower_cli.api.time.sleep') as sleep:
+                    self.assertIs(client.get('/ping/'), ok)
+                    self.assertEqual(send.call_count, 3)
+                    self.assertEqual(sleep.call_count, 2)
+                    self.assertTrue(0.25 <= sleep.call_args_list[0][0][0] <= 0.5)
+                    sleep.assert_called_with(7.0)
+
+    def test_retry_after_capped(self):
+        """Establish that a wait Tower asks for, in seconds or as a date,
+        is capped like backoff's, and that one that is neither falls back
+        to backoff.
+        """
+        def delay(retry_after):
+            response = mock.MagicMock(status_code=503, headers={'Retry-After': retry_after})
+            return client._retry_delay(response, 0)
+        self.assertEqual(delay('3600'), 30.0)
+        with mock.patch('tower_cli.api.time.time', return_value=784111777):
+            self.assertEqual(delay('Sun, 06 Nov 1994 08:49:47 GMT'), 10.0)
+            self.assertEqual(delay('Sun, 06 Nov 1994 09:49:47 GMT'), 30.0)
+            self.assertEqual(delay('Sun, 06 Nov 1994 08:48:47 GMT'), 0.0)
+        self.assertTrue(0.25 <= delay('soon') <= 0.5)
+
+    def test_retries_exhausted(self):
+        busy = mock.MagicMock(status_code=503, headers={})
+        with settings.runtime_values(host='foo.co', retries=1):
+            with mock.patch.object(client, '_send', return_value=busy) as send:
+                with mock.patch('tower_cli.api.time.sleep'):
+                    with self.assertRaises(exc.ServerError):
+                        client.get('/ping/')
+                    self.assertEqual(send.call_count, 2)
+
+    def test_no_retry_post(self):
+        """Establish that requests that are not safe to repeat are never
+        sent twice.
+        """
+        busy = mock.MagicMock(status_code=503, headers={})
+        with settings.runtime_values(host='foo.co'):
+            with mock.patch.object(client, '_send', return_value=busy) as send:
+                with self.assertRaises(exc.ServerError):
+                    client.post('/ping/', data={})
+                self.assertEqual(send.call_count, 1)
+
+    def test_rate_limit(self):
+        with settings.runtime_values(rate_limit=5):
+            bucket = client.rate_limiter
+            self.assertEqual(bucket.rate, 5)
+            self.assertIs(client.rate_limiter, bucket)
+        self.assertIsNone(client.rate_limiter)
+        with client.test_mode as t:
+            t.register_json('/ping/', {'status': 'ok'})
+            with settings.runtime_values(rate_limit=5):
+                with mock.patch.object(throttle.TokenBucket, 'acquire') as acquire:
+                    client.get('/ping/')
+                    self.assertEqual(acquire.call_count, 1)
+
     def test_server_error(self):
         """Establish that server errors raise the ServerError
         exception as expected.
@@ -200,6 +350,7 @@ class ClientTests(unittest.TestCase):
         with mock.patch('requests.sessions.Session.request') as g:
             mock_response = type('statobj', (), {})()  # placeholder object
             mock_response.status_code = 200
+            mock_response.headers = {}
             g.return_value = mock_response
             with client.test_mode as t:
                 t.register('/ping/', "I'm a teapot!", status_code=200)
@@ -231,6 +382,212 @@ class ClientTests(unittest.TestCase):
                     self.assertTrue(secho.called)
 
 
+class HostCacheTests(unittest.TestCase):
+    """A set of tests to establish that OPTIONS responses and capabilities
+    are read through the per-host caches.
+    """
+    def test_cached(self):
+        with client.test_mode as t:
+            t.register_json('/projects/', {'actions': {'POST': {}}}, method='OPTIONS')
+            self.assertEqual(client.get_options('/projects/'), {'actions': {'POST': {}}})
+            self.assertEqual(client.get_options('/projects/'), {'actions': {'POST': {}}})
+            self.assertEqual(len(t.requests), 1)
+
+    def test_cached_on_disk(self):
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        with client.test_mode as t:
+            t.register_json('/projects/', {'actions': {'POST': {}}}, method='OPTIONS')
+            with mock.patch.object(cache, 'CACHE_DIR', temp_dir):
+                cache.enabled = True
+                client.host_caches = {}
+                client.get_options('/projects/')
+                self.assertEqual(os.listdir(temp_dir), [])
+                with settings.runtime_values(cache_options=True):
+                    client.host_caches = {}
+                    client.get_options('/projects/')
+                    client.host_caches = {}
+                    self.assertEqual(client.get_options('/projects/'), {'actions': {'POST': {}}})
+            self.assertEqual(len(t.requests), 2)
+
+    def test_cached_per_user(self):
+        """Establish that schemas read by one user are not reused for
+        another, who may be allowed to do different things.
+        """
+        with client.test_mode as t:
+            t.register_json('/projects/', {'actions': {'POST': {}}}, method='OPTIONS')
+            with settings.runtime_values(username='alice', password='pass'):
+                client.get_options('/projects/')
+            with settings.runtime_values(username='bob', password='pass'):
+                client.get_options('/projects/')
+                client.get_options('/projects/')
+            self.assertEqual(len(t.requests), 2)
+
+    def test_expired(self):
+        with client.test_mode as t:
+            t.register_json('/projects/', {'actions': {'POST': {}}}, method='OPTIONS')
+            client.host_caches['options'] = {client.get_prefix(): {
+                'time': 0, 'version': None, 'values': {'%s /projects/' % client._user_digest(): {}},
+            }}
+            self.assertEqual(client.get_options('/projects/'), {'actions': {'POST': {}}})
+            self.assertEqual(len(t.requests), 1)
+
+    def test_tower_upgraded(self):
+        """Establish that schemas sent by another version of Tower are
+        fetched again.
+        """
+        with client.test_mode as t:
+            t.register_json('/ping/', {}, headers={'X-API-Product-Version': '3.3.0'})
+            t.register_json('/projects/', {'actions': {'POST': {}}}, method='OPTIONS')
+            client.host_caches['options'] = {client.get_prefix(): cache.stamp({
+                'version': '3.2.0', 'values': {'%s /projects/' % client._user_digest(): {}},
+            })}
+            client.get('/ping/')
+            self.assertEqual(client.server_versions, {client.get_prefix(): '3.3.0'})
+            self.assertEqual(client.get_options('/projects/'), {'actions': {'POST': {}}})
+            self.assertEqual(client.host_caches['options'][client.get_prefix()]['version'], '3.3.0')
+
+    def test_version_from_authtoken_probe(self):
+        """Establish that the version of Tower told by the authtoken probe,
+        which is made before any authenticated request, is noted, so that
+        what is cached then is kept once later requests tell the version.
+        """
+        with client.test_mode as t:
+            t.register_json('/authtoken/', {}, method='OPTIONS', headers={'X-API-Product-Version': '3.3.0'})
+            t.register_json('/ping/', {}, headers={'X-API-Product-Version': '3.3.0'})
+            self.assertTrue(client.get_capability('authtoken'))
+            self.assertEqual(client.server_versions, {client.get_prefix(): '3.3.0'})
+            self.assertEqual(client.host_caches['capabilities'][client.get_prefix()]['version'], '3.3.0')
+            client.get('/ping/')
+            self.assertTrue(client.get_capability('authtoken'))
+            self.assertEqual(len(t.requests), 2)
+
+    def test_name_index(self):
+        """Establish that the name index is kept on disk only if the
+        cache_names setting is on.
+        """
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        with client.test_mode:
+            with mock.patch.object(cache, 'CACHE_DIR', temp_dir):
+                cache.enabled = True
+                client.host_caches = {}
+                client.get_name_index('/foo/')['["name", "bar"]'] = 42
+                client.save_name_index()
+                self.assertEqual(os.listdir(temp_dir), [])
+                with settings.runtime_values(cache_names=True):
+                    client.save_name_index()
+                    client.host_caches = {}
+                    self.assertEqual(client.get_name_index('/foo/'), {'["name", "bar"]': 42})
+
+    def test_name_index_in_memory_expires(self):
+        """Establish that a name index kept only in memory is started
+        afresh after `NAME_INDEX_TTL` seconds.
+        """
+        with client.test_mode:
+            with mock.patch('tower_cli.utils.cache.time.time', return_value=1000.0):
+                client.get_name_index('/foo/')['["name", "bar"]'] = 42
+            with mock.patch('tower_cli.utils.cache.time.time', return_value=1000.0 + api.NAME_INDEX_TTL - 1):
+                self.assertEqual(client.get_name_index('/foo/'), {'["name", "bar"]': 42})
+            with mock.patch('tower_cli.utils.cache.time.time', return_value=1000.0 + api.NAME_INDEX_TTL):
+                self.assertEqual(client.get_name_index('/foo/'), {})
+
+    def test_capabilities(self):
+        """Establish that each capability is probed only once.
+        """
+        with client.test_mode as t:
+            t.register_json('/', {'ad_hoc_commands': '/api/v2/ad_hoc_commands/'})
+            t.register_json('/config/', {'version': '3.3.0'})
+            for _ in range(2):
+                self.assertTrue(client.get_capability('ad_hoc_commands'))
+                self.assertEqual(client.get_capability('version'), '3.3.0')
+            self.assertEqual(len(t.requests), 2)
+
+    def test_bulk_capability(self):
+        with client.test_mode as t:
+            t.register_json('/bulk/', {'job_launch': '/api/v2/bulk/job_launch/',
+                                       'host_create': '/api/v2/bulk/host_create/'})
+            self.assertEqual(client.get_capability('bulk'), ['host_create', 'job_launch'])
+        with client.test_mode as t:
+            t.register('/bulk/', '', status_code=404)
+            self.assertEqual(client.get_capability('bulk'), [])
+
+    def test_oauth2_capability(self):
+        with client.test_mode:
+            with mock.patch.object(client, 'head', side_effect=exc.NotFound('Not found.')):
+                self.assertFalse(client.get_capability('oauth2'))
+        with client.test_mode:
+            with mock.patch.object(client, 'head') as head:
+                head.return_value.ok = True
+                self.assertTrue(client.get_capability('oauth2'))
+                head.assert_called_once_with('/o/')
+
+
+class HTTPCacheTests(unittest.TestCase):
+    """A set of tests to establish that GET responses are kept and
+    revalidated when the HTTP cache is on.
+    """
+    def test_off(self):
+        with client.test_mode as t:
+            t.register_json('/config/', {'version': '3.2.0'}, headers={'ETag': '"abc"'})
+            client.get('/config/')
+            client.get('/config/')
+            self.assertNotIn('If-None-Match', t.requests[-1].headers)
+
+    def test_not_modified(self):
+        with client.test_mode as t:
+            with settings.runtime_values(http_cache=True):
+                t.register_json('/hosts/1/', {'id': 1}, headers={'ETag': '"abc"'})
+                self.assertEqual(client.get('/hosts/1/').json(), {'id': 1})
+                t.register('/hosts/1/', '', status_code=304)
+                r = client.get('/hosts/1/')
+                self.assertEqual(r.status_code, 200)
+                self.assertEqual(r.json(), {'id': 1})
+                self.assertEqual(t.requests[-1].headers['If-None-Match'], '"abc"')
+
+    def test_modified(self):
+        with client.test_mode as t:
+            with settings.runtime_values(http_cache=True):
+                t.register_json('/hosts/1/', {'id': 1, 'name': 'foo'},
+                                headers={'Last-Modified': 'Tue, 01 Aug 2017 00:00:00 GMT'})
+                client.get('/hosts/1/')
+                t.register_json('/hosts/1/', {'id': 1, 'name': 'bar'})
+                self.assertEqual(client.get('/hosts/1/').json()['name'], 'bar')
+                self.assertEqual(t.requests[-1].headers['If-Modified-Since'],
+                                 'Tue, 01 Aug 2017 00:00:00 GMT')
+
+    def test_fresh(self):
+        with client.test_mode as t:
+            with settings.runtime_values(http_cache=True, http_cache_fresh='config=60'):
+                t.register_json('/config/', {'version': '3.2.0'})
+                client.get('/config/')
+                self.assertEqual(client.get('/config/').json(), {'version': '3.2.0'})
+                self.assertEqual(len(t.requests), 1)
+
+    def test_params(self):
+        with client.test_mode as t:
+            with settings.runtime_values(http_cache=True, http_cache_fresh='hosts=60'):
+                t.register_json('/hosts/', {'results': []}, name='foo')
+                t.register_json('/hosts/', {'results': [{'id': 1}]}, name='bar')
+                client.get('/hosts/', params={'name': 'foo'})
+                self.assertEqual(client.get('/hosts/', params={'name': 'bar'}).json(),
+                                 {'results': [{'id': 1}]})
+                self.assertEqual(len(t.requests), 2)
+
+    def test_written(self):
+        with client.test_mode as t:
+            with settings.runtime_values(http_cache=True, http_cache_fresh='hosts=60'):
+                t.register_json('/hosts/', {'results': []})
+                t.register_json('/hosts/1/', {'id': 1})
+                t.register_json('/hosts/1/', {'id': 1}, method='PATCH')
+                client.get('/hosts/')
+                client.get('/hosts/1/')
+                client.patch('/hosts/1/', data={'name': 'foo'})
+                client.get('/hosts/')
+                client.get('/hosts/1/')
+                self.assertEqual(len(t.requests), 5)
+
+
 class TowerAuthTokenTests(unittest.TestCase):
     def setUp(self):
 
@@ -243,6 +600,72 @@ class TowerAuthTokenTests(unittest.TestCase):
         self.req = Req()
         self.expires = dt.utcnow()
 
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        patcher = mock.patch('tower_cli.api.TOKEN_FILENAME', os.path.join(temp_dir, 'token.json'))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_token_kept_in_memory(self):
+        """Establish that a token is acquired and the authtoken endpoint
+        probed only once, however many requests are made with it.
+        """
+        expires = (self.expires + timedelta(hours=1)).strftime(TOWER_DATETIME_FMT)
+        with client.test_mode as t:
+            t.register('/authtoken/', json.dumps({}), status_code=200, method='OPTIONS')
+            t.register('/authtoken/', json.dumps({'token': 'foobar', 'expires': expires}), status_code=200,
+                       method='POST')
+            with mock.patch.object(client, '_make_request', wraps=client._make_request) as make_request:
+                self.auth(self.req)
+                self.auth(self.req)
+                self.assertEqual(self.req.headers['Authorization'], 'Token foobar')
+                self.assertEqual([c[0][0] for c in make_request.call_args_list], ['OPTIONS', 'POST'])
+
+            # A second process finds the token in the file.
+            client.auth_tokens.clear()
+            with mock.patch.object(client, '_make_request') as make_request:
+                self.req.headers = {}
+                self.auth(self.req)
+                self.assertEqual(self.req.headers['Authorization'], 'Token foobar')
+                self.assertFalse(make_request.called)
+
+    def test_token_with_one_slot(self):
+        """Establish that a request can acquire an auth token while it
+        holds the only slot that the governor allows.
+        """
+        expires = (self.expires + timedelta(hours=1)).strftime(TOWER_DATETIME_FMT)
+        results = []
+
+        def ping():
+            results.append(client.get('/ping/').json())
+        with client.test_mode as t:
+            t.register('/authtoken/', json.dumps({}), status_code=200, method='OPTIONS')
+            t.register('/authtoken/', json.dumps({'token': 'foobar', 'expires': expires}), status_code=200,
+                       method='POST')
+            t.register_json('/ping/', {'status': 'ok'})
+            with settings.runtime_values(username='alice', password='pass', use_token=True, pool_maxsize=1):
+                thread = threading.Thread(target=context.bind(ping))
+                thread.daemon = True
+                thread.start()
+                thread.join(5)
+        self.assertEqual(results, [{'status': 'ok'}])
+        self.assertEqual(t.requests[-1].headers['Authorization'], 'Token foobar')
+
+    def test_expired_token_in_memory(self):
+        """Establish that a token held in memory is replaced once it
+        expires.
+        """
+        expires = (self.expires + timedelta(hours=1)).strftime(TOWER_DATETIME_FMT)
+        with client.test_mode as t:
+            t.register('/authtoken/', json.dumps({}), status_code=200, method='OPTIONS')
+            t.register('/authtoken/', json.dumps({'token': 'barfoo', 'expires': expires}), status_code=200,
+                       method='POST')
+            client.auth_tokens[(client.get_prefix(), 'alice')] = {
+                'header': 'Token foobar', 'expires': self.expires - timedelta(seconds=1),
+            }
+            self.auth(self.req)
+            self.assertEqual(self.req.headers['Authorization'], 'Token barfoo')
+
     def test_reading_valid_token(self):
         self.expires += timedelta(hours=1)
         expires = self.expires.strftime(TOWER_DATETIME_FMT)
@@ -15,7 +15,9 @@
 
 import json
 import os.path
+import shutil
 import stat
+import tempfile
 import warnings
 
 import click
@@ -27,8 +29,9 @@ import six.moves.urllib.parse as urlparse
 
 import tower_cli
 from tower_cli.api import client, Client
-from tower_cli.cli.misc import config, version, login, _echo_setting
+from tower_cli.cli.misc import cache, config, version, login, _echo_setting
 from tower_cli.conf import settings
+from tower_cli.utils import cache as disk_cache
 from tower_cli.constants import CUR_API_VERSION
 
 from tests.compat import unittest, mock
@@ -457,6 +460,48 @@ class LoginTests(unittest.TestCase):
                       mock_open.mock_calls)
 
 
+class CacheTests(unittest.TestCase):
+    """A set of tests to establish that the cache command works in the way
+    that we expect.
+    """
+    def setUp(self):
+        self.runner = CliRunner()
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        patcher = mock.patch.object(disk_cache, 'CACHE_DIR', self.cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_clear(self):
+        disk_cache.save('options', {})
+        result = self.runner.invoke(cache, ['clear'])
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn('Removed cached options', result.output)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_clear_empty(self):
+        result = self.runner.invoke(cache, ['clear'])
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn('There is nothing cached', result.output)
+
+    def test_warm(self):
+        with client.test_mode as t:
+            t.register_json('/organizations/?page_size=200', {'count': 1, 'results': [
+                {'id': 1, 'name': 'Default'},
+            ], 'next': None, 'previous': None})
+            result = self.runner.invoke(cache, ['warm', 'organization'])
+            self.assertEqual(result.exit_code, 0)
+            self.assertIn('Indexed 1 organization objects.', result.output)
+            self.assertIn('cache_names', result.output)
+            self.assertEqual(tower_cli.get_resource('organization').resolve(name='Default'), 1)
+            self.assertEqual(len(t.requests), 1)
+
+    def test_warm_unknown(self):
+        result = self.runner.invoke(cache, ['warm', 'bogus'])
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn('There is no bogus resource.', result.output)
+
+
 class SupportTests(unittest.TestCase):
     """Establish that support functions in this module work in the way
     that we expect.
@@ -55,6 +55,16 @@ class SubcommandTests(unittest.TestCase):
         self.assertEqual(list_command.params[0].name, 'name')
         self.assertIn('--name', list_command.params[0].opts)
 
+    def test_list_concurrency_range(self):
+        """Establish that the list command rejects a concurrency of less
+        than one, rather than quietly reading pages one at a time.
+        """
+        list_command = self.command.get_command(None, 'list')
+        concurrency = [param for param in list_command.params if param.name == 'concurrency'][0]
+        with self.assertRaises(click.BadParameter):
+            concurrency.type.convert('0', concurrency, None)
+        self.assertEqual(concurrency.type.convert('4', concurrency, None), 4)
+
     def test_get_command_error(self):
         """Establish that if `get_command` is called against a command that
         does not actually exist on the resource, that null value is returned.
@@ -276,6 +286,37 @@ class SubcommandTests(unittest.TestCase):
                                           allow_unicode=True,
                                           default_flow_style=False))
 
+    def test_echo_method_jsonl_formatted(self):
+        """Establish that the `_echo_method` writes one JSON line for each
+        record when it gets back a list of objects.
+        """
+        func = self.command._echo_method(lambda: {'results': [
+            {'id': 1, 'name': 'foo'},
+            {'id': 2, 'name': 'bar'},
+        ]})
+        with mock.patch.object(click, 'secho') as secho:
+            with settings.runtime_values(format='jsonl'):
+                func()
+            secho.assert_called_once_with('\n'.join([
+                json.dumps({'id': 1, 'name': 'foo'}), json.dumps({'id': 2, 'name': 'bar'})
+            ]))
+
+    def test_echo_method_jsonl_streamed(self):
+        """Establish that the `_echo_method` writes each record from the
+        stream method as it arrives, without calling the method itself.
+        """
+        def inner_func(**kwargs):
+            raise AssertionError('The collated listing should not be read.')
+        inner_func.stream_method = 'iter_list'
+        func = self.command._echo_method(inner_func)
+        records = [{'id': 1}, {'id': 2}]
+        with mock.patch.object(type(self.resource), 'iter_list', return_value=iter(records)) as iter_list:
+            with mock.patch.object(click, 'secho') as secho:
+                with settings.runtime_values(format='jsonl'):
+                    func(all_pages=True)
+        iter_list.assert_called_once_with(all_pages=True)
+        self.assertEqual(secho.mock_calls, [mock.call(json.dumps(record)) for record in records])
+
     def test_echo_method_human_formatted(self):
         """Establish that the `_echo_method` properly returns human formatting
         when it gets back a list of objects.
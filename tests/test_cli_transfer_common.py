@@ -2,7 +2,7 @@ from tower_cli.api import client
 from tower_cli.cli.transfer import common
 from tower_cli.utils.data_structures import OrderedDict
 
-from tests.compat import unittest
+from tests.compat import unittest, mock
 
 
 class TransferCommonTests(unittest.TestCase):
@@ -102,3 +102,28 @@ class TransferCommonTests(unittest.TestCase):
         del result_asset['local_path']
         common.remove_local_path_from_scm_project(asset)
         self.assertEqual(asset, result_asset, "Failed to remove the local path for git project")
+
+    def test_load_all_assets_concurrent(self):
+        with client.test_mode as t:
+            t.register_json('/inventories/1/hosts/', {
+                'count': 2, 'results': [{'id': 1}], 'next': '/api/v2/inventories/1/hosts/?page=2'
+            })
+            t.register_json('/inventories/1/hosts/?page=2', {
+                'count': 2, 'results': [{'id': 2}], 'next': None
+            })
+            assets = common.load_all_assets('/api/v2/inventories/1/hosts/', concurrency=2)
+            self.assertEqual([asset['id'] for asset in assets['results']], [1, 2])
+            self.assertEqual(assets['count'], 2)
+            self.assertEqual(len(t.requests), 2)
+            self.assertEqual(common.load_all_assets('/api/v2/inventories/1/hosts/'), assets)
+
+    def test_extract_roles_concurrency(self):
+        asset = {'related': {'object_roles': '/api/v2/teams/1/object_roles/'}}
+        roles = {'results': [{'name': 'Admin', 'id': 5, 'related': {'users': '/api/v2/roles/5/users/'}}]}
+        users = {'results': [{'id': 7, 'username': 'bob'}]}
+        with mock.patch.object(common, 'load_all_assets', side_effect=[roles, users]) as load_all_assets:
+            result = common.extract_roles(asset, concurrency=4)
+        self.assertEqual(result['items'][0]['user'], ['bob'])
+        load_all_assets.assert_has_calls([
+            mock.call('/api/v2/teams/1/object_roles/', 4), mock.call('/api/v2/roles/5/users/', 4)
+        ])
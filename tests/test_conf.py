@@ -18,10 +18,12 @@ import click
 import os
 import os.path
 import stat
+import threading
 import warnings
 
 from six.moves import StringIO
 
+from tower_cli import context
 from tower_cli.conf import Parser, Settings
 
 from tests.compat import unittest, mock
@@ -51,6 +53,44 @@ class SettingsTests(unittest.TestCase):
                             RuntimeWarning,
                         )
 
+    def test_empty_number(self):
+        """Establish that a number setting that is set to an empty value
+        is read as None, rather than failing to parse.
+        """
+        settings = Settings()
+        with settings.runtime_values(max_page_size=''):
+            self.assertIsNone(settings.max_page_size)
+        with settings.runtime_values(max_page_size='50'):
+            self.assertEqual(settings.max_page_size, 50)
+
+    def test_runtime_values_nested(self):
+        """Establish that nested runtime values keep those of the enclosing
+        context manager, and put them back on exit.
+        """
+        settings = Settings()
+        with settings.runtime_values(host='outer', username='alice'):
+            with settings.runtime_values(host='inner'):
+                self.assertEqual(settings.host, 'inner')
+                self.assertEqual(settings.username, 'alice')
+            self.assertEqual(settings.host, 'outer')
+
+    def test_runtime_values_thread_local(self):
+        """Establish that runtime values are only seen by the thread that
+        gives them, unless they are bound to another thread.
+        """
+        settings = Settings()
+        seen = {}
+
+        def read(name):
+            seen[name] = settings.host
+        with settings.runtime_values(host='main'):
+            for name, target in (('plain', read), ('bound', context.bind(read))):
+                thread = threading.Thread(target=target, args=(name,))
+                thread.start()
+                thread.join()
+            self.assertEqual(settings.host, 'main')
+        self.assertEqual(seen, {'plain': '127.0.0.1', 'bound': 'main'})
+
 
 class ParserTests(unittest.TestCase):
     """A set of tests to establish that our Parser subclass works in the
@@ -19,6 +19,7 @@ from six.moves import StringIO
 
 from tower_cli import models, resources, exceptions as exc
 from tower_cli.api import client
+from tower_cli.conf import settings
 from tower_cli.utils import debug
 from tower_cli.constants import CUR_API_VERSION
 
@@ -74,7 +75,7 @@ class ResourceMetaTests(unittest.TestCase):
 
         # Establish it has the commands we expect.
         self.assertEqual(set(MyResource.commands),
-                         set(['create', 'copy', 'modify', 'list', 'get',
+                         set(['apply', 'bulk_delete', 'bulk_modify', 'create', 'copy', 'modify', 'list', 'get',
                               'delete']))
 
     def test_subclassed_commands(self):
@@ -236,13 +237,13 @@ class ResourceTests(unittest.TestCase):
         """
         with client.test_mode as t:
             # Register the first, second, and third page.
-            t.register_json('/foo/', {'count': 3, 'results': [
+            t.register_json('/foo/?page_size=200', {'count': 3, 'results': [
                 {'id': 1, 'name': 'foo', 'description': 'bar'},
             ], 'next': '/foo/?page=2', 'previous': None})
-            t.register_json('/foo/?page=2', {'count': 3, 'results': [
+            t.register_json('/foo/?page=2&page_size=200', {'count': 3, 'results': [
                 {'id': 2, 'name': 'spam', 'description': 'eggs'},
             ], 'next': '/foo/?page=3', 'previous': None})
-            t.register_json('/foo/?page=3', {'count': 3, 'results': [
+            t.register_json('/foo/?page=3&page_size=200', {'count': 3, 'results': [
                 {'id': 3, 'name': 'bacon', 'description': 'cheese'},
             ], 'next': None, 'previous': None})
 
@@ -252,6 +253,206 @@ class ResourceTests(unittest.TestCase):
             # Assert that there are three results, and three requests.
             self.assertEqual(len(t.requests), 3)
             self.assertEqual(len(result['results']), 3)
+            self.assertEqual(result['count'], 3)
+
+    def test_list_all_pages_concurrent(self):
+        """Establish that the Resource class' `list` method reads the
+        remaining pages concurrently when asked to, keeping their order.
+        """
+        with client.test_mode as t:
+            t.register_json('/foo/?page_size=200', {'count': 3, 'results': [
+                {'id': 1, 'name': 'foo', 'description': 'bar'},
+            ], 'next': '/foo/?page=2', 'previous': None})
+            t.register_json('/foo/?page=2&page_size=200', {'count': 3, 'results': [
+                {'id': 2, 'name': 'spam', 'description': 'eggs'},
+            ], 'next': '/foo/?page=3', 'previous': None})
+            t.register_json('/foo/?page=3&page_size=200', {'count': 3, 'results': [
+                {'id': 3, 'name': 'bacon', 'description': 'cheese'},
+            ], 'next': None, 'previous': None})
+
+            result = self.res.list(all_pages=True, concurrency=2)
+
+            self.assertEqual(len(t.requests), 3)
+            self.assertEqual([i['id'] for i in result['results']], [1, 2, 3])
+            self.assertEqual(result['count'], 3)
+            self.assertIsNone(result['next'])
+
+    def test_list_all_pages_concurrent_sessions(self):
+        """Establish that the pages read concurrently are read through
+        sessions of the worker threads, rather than the shared client.
+        """
+        with client.test_mode as t:
+            t.register_json('/foo/?page_size=200', {'count': 3, 'results': [
+                {'id': 1, 'name': 'foo', 'description': 'bar'},
+            ], 'next': '/foo/?page=2', 'previous': None})
+            t.register_json('/foo/?page=2&page_size=200', {'count': 3, 'results': [
+                {'id': 2, 'name': 'spam', 'description': 'eggs'},
+            ], 'next': '/foo/?page=3', 'previous': None})
+            t.register_json('/foo/?page=3&page_size=200', {'count': 3, 'results': [
+                {'id': 3, 'name': 'bacon', 'description': 'cheese'},
+            ], 'next': None, 'previous': None})
+
+            with mock.patch.object(client, '_mount_adapters', wraps=client._mount_adapters) as mount:
+                result = self.res.list(all_pages=True, concurrency=2)
+
+            self.assertEqual([i['id'] for i in result['results']], [1, 2, 3])
+            self.assertTrue(mount.called)
+            self.assertNotIn(client, [call[0][0] for call in mount.call_args_list])
+
+    def test_list_all_pages_concurrent_late_records(self):
+        """Establish that records created while the pages are read
+        concurrently are still collected from the extra pages.
+        """
+        with client.test_mode as t:
+            t.register_json('/foo/?page_size=200', {'count': 2, 'results': [
+                {'id': 1, 'name': 'foo', 'description': 'bar'},
+            ], 'next': '/foo/?page=2', 'previous': None})
+            t.register_json('/foo/?page=2&page_size=200', {'count': 3, 'results': [
+                {'id': 2, 'name': 'spam', 'description': 'eggs'},
+            ], 'next': '/foo/?page=3', 'previous': None})
+            t.register_json('/foo/?page=3&page_size=200', {'count': 3, 'results': [
+                {'id': 3, 'name': 'bacon', 'description': 'cheese'},
+            ], 'next': None, 'previous': None})
+
+            result = self.res.list(all_pages=True, concurrency=4)
+
+            self.assertEqual([i['id'] for i in result['results']], [1, 2, 3])
+
+    def test_iter_list_all_pages(self):
+        """Establish that the Resource class' `iter_list` method yields
+        the records of every page, reading each page only when needed.
+        """
+        with client.test_mode as t:
+            t.register_json('/foo/?page_size=200', {'count': 2, 'results': [
+                {'id': 1, 'name': 'foo', 'description': 'bar'},
+            ], 'next': '/foo/?page=2', 'previous': None})
+            t.register_json('/foo/?page=2&page_size=200', {'count': 2, 'results': [
+                {'id': 2, 'name': 'spam', 'description': 'eggs'},
+            ], 'next': None, 'previous': '/foo/'})
+
+            records = self.res.iter_list()
+            self.assertEqual(next(records)['id'], 1)
+            self.assertEqual(len(t.requests), 1)
+            self.assertEqual([i['id'] for i in records], [2])
+            self.assertEqual(len(t.requests), 2)
+
+    def test_iter_list_single_page(self):
+        """Establish that the Resource class' `iter_list` method only
+        reads the requested page if all_pages is off.
+        """
+        with client.test_mode as t:
+            t.register_json('/foo/?page=2', {'count': 3, 'results': [
+                {'id': 2, 'name': 'spam', 'description': 'eggs'},
+            ], 'next': '/foo/?page=3', 'previous': '/foo/'})
+            records = list(self.res.iter_list(all_pages=False, page=2))
+            self.assertEqual([i['id'] for i in records], [2])
+            self.assertEqual(len(t.requests), 1)
+
+    def test_list_all_pages_keyset(self):
+        """Establish that a resource paginated by keyset walks all pages
+        ordered by ID, asking for the records after the last one seen.
+        """
+        self.res.pagination = 'keyset'
+        with client.test_mode as t:
+            t.register_json('/foo/?order_by=id&page_size=200', {'count': 3, 'results': [
+                {'id': 1, 'name': 'foo'}, {'id': 4, 'name': 'spam'},
+            ], 'next': '/foo/?order_by=id&page=2', 'previous': None})
+            t.register_json('/foo/?order_by=id&id__gt=4&page_size=200', {'count': 1, 'results': [
+                {'id': 9, 'name': 'bacon'},
+            ], 'next': None, 'previous': None})
+
+            result = self.res.list(all_pages=True)
+
+            self.assertEqual(len(t.requests), 2)
+            self.assertEqual([i['id'] for i in result['results']], [1, 4, 9])
+            self.assertEqual(result['count'], 3)
+            self.assertIsNone(result['next'])
+
+    def test_iter_list_keyset_descending(self):
+        """Establish that keyset pagination follows a descending ID order."""
+        with client.test_mode as t:
+            t.register_json('/foo/?order_by=-id&page_size=200', {'count': 2, 'results': [
+                {'id': 9, 'name': 'foo'},
+            ], 'next': '/foo/?order_by=-id&page=2', 'previous': None})
+            t.register_json('/foo/?order_by=-id&id__lt=9&page_size=200', {'count': 1, 'results': [
+                {'id': 3, 'name': 'spam'},
+            ], 'next': None, 'previous': None})
+            records = self.res.iter_list(query=[('order_by', '-id')], pagination='keyset')
+            self.assertEqual([i['id'] for i in records], [9, 3])
+
+    def test_list_all_pages_keyset_other_order(self):
+        """Establish that a listing ordered by anything other than ID is
+        read by page number even if keyset pagination is preferred.
+        """
+        self.res.pagination = 'keyset'
+        with client.test_mode as t:
+            t.register_json('/foo/?order_by=name&page_size=200', {'count': 2, 'results': [
+                {'id': 4, 'name': 'bar'},
+            ], 'next': '/foo/?order_by=name&page=2', 'previous': None})
+            t.register_json('/foo/?order_by=name&page=2&page_size=200', {'count': 2, 'results': [
+                {'id': 1, 'name': 'foo'},
+            ], 'next': None, 'previous': '/foo/?order_by=name'})
+            result = self.res.list(all_pages=True, query=[('order_by', 'name')])
+            self.assertEqual([i['id'] for i in result['results']], [4, 1])
+
+    def test_list_all_pages_max_page_size(self):
+        """Establish that the --all-pages flag asks for pages of the
+        configured maximum size, ignoring any page size given.
+        """
+        with client.test_mode as t:
+            t.register_json('/foo/?page_size=50', {'count': 1, 'results': [
+                {'id': 1, 'name': 'foo', 'description': 'bar'},
+            ], 'next': None, 'previous': None})
+            with settings.runtime_values(max_page_size=50):
+                self.res.list(all_pages=True, page_size=5)
+            self.assertEqual(t.requests[0].url,
+                             'https://20.12.4.21/api/%s/foo/?page_size=50' % CUR_API_VERSION)
+
+    def test_list_all_pages_no_max_page_size(self):
+        """Establish that the --all-pages flag leaves the page size to
+        the server if no maximum page size is configured.
+        """
+        with client.test_mode as t:
+            t.register_json('/foo/', {'count': 1, 'results': [
+                {'id': 1, 'name': 'foo', 'description': 'bar'},
+            ], 'next': None, 'previous': None})
+            with settings.runtime_values(max_page_size=0):
+                self.res.list(all_pages=True)
+            self.assertEqual(t.requests[0].url,
+                             'https://20.12.4.21/api/%s/foo/' % CUR_API_VERSION)
+
+    def test_list_all_pages_learns_page_size_limit(self):
+        """Establish that if the server returns smaller pages than were
+        asked for, later listings ask for pages of that size.
+        """
+        with client.test_mode as t:
+            t.register_json('/foo/?page_size=200', {'count': 3, 'results': [
+                {'id': 1, 'name': 'foo', 'description': 'bar'},
+                {'id': 2, 'name': 'spam', 'description': 'eggs'},
+            ], 'next': '/foo/?page=2', 'previous': None})
+            t.register_json('/foo/?page=2&page_size=200', {'count': 3, 'results': [
+                {'id': 3, 'name': 'bacon', 'description': 'cheese'},
+            ], 'next': None, 'previous': '/foo/'})
+            self.res.list(all_pages=True)
+            self.assertEqual(client.get_page_size_limit(), 2)
+
+            t.register_json('/foo/?page_size=2', {'count': 1, 'results': [
+                {'id': 1, 'name': 'foo', 'description': 'bar'},
+            ], 'next': None, 'previous': None})
+            self.res.list(all_pages=True)
+            self.assertEqual(t.requests[-1].url,
+                             'https://20.12.4.21/api/%s/foo/?page_size=2' % CUR_API_VERSION)
+
+    def test_list_all_pages_full_last_page(self):
+        """Establish that a short page with no next page is not taken
+        for a limit on the page size.
+        """
+        with client.test_mode as t:
+            t.register_json('/foo/?page_size=200', {'count': 1, 'results': [
+                {'id': 1, 'name': 'foo', 'description': 'bar'},
+            ], 'next': None, 'previous': None})
+            self.res.list(all_pages=True)
+            self.assertIsNone(client.get_page_size_limit())
 
     def test_list_with_page_1_special_case(self):
         """Establish that the list function works even if the server gives
@@ -576,6 +777,43 @@ class ResourceTests(unittest.TestCase):
                              {'disassociate': True, 'id': 84})
             self.assertTrue(result['changed'])
 
+    def test_assoc_many(self):
+        """Establish that _assoc_many lists the related records once and
+        only posts those that are not associated already.
+        """
+        with client.test_mode as t:
+            t.register_json('/foo/42/bar/?page_size=200', {'count': 2, 'results': [
+                {'id': 84}, {'id': 85},
+            ], 'next': None, 'previous': None})
+            t.register_json('/foo/42/bar/', {}, method='POST')
+            result = self.res._assoc_many('bar', 42, [84, '86', 86, 87], 'bar', concurrency=2)
+            self.assertEqual(result, {'changed': True, 'count': 2})
+            posted = sorted(json.loads(r.body)['id'] for r in t.requests if r.method == 'POST')
+            self.assertEqual(posted, [86, 87])
+
+    def test_disassoc_many_nothing_to_do(self):
+        with client.test_mode as t:
+            t.register_json('/foo/42/bar/?page_size=200', {'count': 1, 'results': [
+                {'id': 84},
+            ], 'next': None, 'previous': None})
+            result = self.res._disassoc_many('bar', 42, [85], 'bar')
+            self.assertEqual(result, {'changed': False, 'count': 0})
+            self.assertEqual(len(t.requests), 1)
+
+    def test_sync_assoc(self):
+        """Establish that _sync_assoc associates the missing records and
+        disassociates the others.
+        """
+        with client.test_mode as t:
+            t.register_json('/foo/42/bar/?page_size=200', {'count': 2, 'results': [
+                {'id': 84}, {'id': 85},
+            ], 'next': None, 'previous': None})
+            t.register_json('/foo/42/bar/', {}, method='POST')
+            result = self.res._sync_assoc('bar', 42, [85, 86], 'bar')
+            self.assertEqual(result, {'changed': True, 'associated': 1, 'disassociated': 1})
+            self.assertEqual([json.loads(r.body) for r in t.requests[1:]],
+                             [{'associate': True, 'id': 86}, {'disassociate': True, 'id': 84}])
+
     def test_lookup_with_unique_field_not_present(self):
         """Establish that a if _lookup is invoked without any unique
         field specified, that BadRequest is raised.
@@ -595,6 +833,245 @@ class ResourceTests(unittest.TestCase):
             with self.assertRaises(exc.Found):
                 self.res._lookup(name='bar', fail_on_found=True)
 
+    def test_resolve(self):
+        """Establish that names resolved once are answered from the name
+        index afterwards.
+        """
+        with client.test_mode as t:
+            t.register_json('/foo/?name=bar', {'count': 1, 'results': [
+                {'id': 42, 'name': 'bar'},
+            ], 'next': None, 'previous': None})
+            self.assertEqual(self.res.resolve(name='bar'), 42)
+            self.assertEqual(self.res.resolve(name='bar'), 42)
+            self.assertEqual(len(t.requests), 1)
+
+    def test_resolve_forgotten_on_write(self):
+        """Establish that writing or deleting an object through tower-cli
+        removes the index entries that it made stale.
+        """
+        with client.test_mode as t:
+            t.register_json('/foo/?name=bar', {'count': 1, 'results': [
+                {'id': 42, 'name': 'bar'},
+            ], 'next': None, 'previous': None})
+            t.register_json('/foo/42/', {'id': 42, 'name': 'bar'})
+            t.register_json('/foo/42/', {'id': 42, 'name': 'baz'}, method='PATCH')
+            t.register('/foo/42/', '', method='DELETE')
+            self.res.resolve(name='bar')
+            self.res.modify(42, name='baz')
+            self.assertEqual(client.get_name_index('/foo/'), {})
+            self.res.resolve(name='bar')
+            self.res.delete(42)
+            self.assertEqual(client.get_name_index('/foo/'), {})
+
+    def test_lookup_indexed(self):
+        """Establish that _lookup reads an indexed object by primary key,
+        and searches again if the object no longer matches.
+        """
+        with client.test_mode as t:
+            t.register_json('/foo/?name=bar', {'count': 1, 'results': [
+                {'id': 43, 'name': 'bar'},
+            ], 'next': None, 'previous': None})
+            t.register_json('/foo/42/', {'id': 42, 'name': 'bar'})
+            t.register_json('/foo/41/', {'id': 41, 'name': 'renamed'})
+            index = client.get_name_index('/foo/')
+            index[self.res._index_key({'name': 'bar'})] = 42
+            self.assertEqual(self.res._lookup(name='bar')['id'], 42)
+            self.assertEqual(len(t.requests), 1)
+            index[self.res._index_key({'name': 'bar'})] = 41
+            self.assertEqual(self.res._lookup(name='bar')['id'], 43)
+            self.assertEqual(index, {self.res._index_key({'name': 'bar'}): 43})
+
+    def test_identity_map(self):
+        """Establish that objects read by primary key are read through the
+        identity map while it is on, and dropped from it when written to.
+        """
+        with client.test_mode as t:
+            t.register_json('/foo/42/', {'id': 42, 'name': 'bar', 'description': 'baz'})
+            t.register_json('/foo/42/', {'id': 42, 'name': 'bar', 'description': 'qux'}, method='PATCH')
+            with client.identity_map.active():
+                self.res.get(42)
+                self.res.modify(42, description='qux')
+                self.assertEqual(len(t.requests), 2)
+                self.res.get(42)
+                self.res.get(42)
+                self.assertEqual(len(t.requests), 3)
+                self.assertEqual(client.identity_map.stats, {'hits': 2, 'misses': 2, 'size': 1})
+            self.res.get(42)
+            self.assertEqual(len(t.requests), 4)
+
+    def test_get_many(self):
+        """Establish that get_many looks names up in chunks of `__in`
+        queries, and names with commas one at a time.
+        """
+        with client.test_mode as t:
+            t.register_json('/foo/', {'count': 2, 'results': [
+                {'id': 1, 'name': 'alpha'}, {'id': 3, 'name': 'gamma'},
+            ], 'next': None, 'previous': None}, name__in='gamma,alpha', page_size='200')
+            t.register_json('/foo/', {'count': 1, 'results': [
+                {'id': 2, 'name': 'beta'},
+            ], 'next': None, 'previous': None}, name__in='beta', page_size='200')
+            t.register_json('/foo/', {'count': 1, 'results': [
+                {'id': 4, 'name': 'a,b'},
+            ], 'next': None, 'previous': None}, name='a,b', page_size='200')
+            with mock.patch.object(models.base, 'MAX_IN_QUERY_LENGTH', 20):
+                result = self.res.get_many(['gamma', 'alpha', 'a,b', 'beta'])
+            self.assertEqual(list(result.keys()), ['gamma', 'alpha', 'a,b', 'beta'])
+            self.assertEqual([r['id'] for r in result.values()], [3, 1, 4, 2])
+            self.assertEqual(len(t.requests), 3)
+
+    def test_get_many_missing_or_ambiguous(self):
+        with client.test_mode as t:
+            t.register_json('/foo/', {'count': 3, 'results': [
+                {'id': 1, 'name': 'alpha'}, {'id': 2, 'name': 'beta'}, {'id': 3, 'name': 'beta'},
+            ], 'next': None, 'previous': None}, name__in='alpha,beta,gamma', page_size='200')
+            with self.assertRaises(exc.NotFound) as missing:
+                self.res.get_many(['alpha', 'beta', 'gamma'])
+            self.assertIn('"gamma"', str(missing.exception))
+            with self.assertRaises(exc.MultipleResults) as multiple:
+                self.res.get_many(['alpha', 'beta', 'gamma'], fail_on_missing=False)
+            self.assertIn('"beta"', str(multiple.exception))
+            result = self.res.get_many(['alpha', 'beta', 'gamma'], fail_on_missing=False, fail_on_multiple=False)
+            self.assertEqual(list(result.keys()), ['alpha'])
+
+    def test_resolve_many(self):
+        """Establish that resolve_many only asks Tower about names that
+        are not in the index.
+        """
+        with client.test_mode as t:
+            t.register_json('/foo/', {'count': 1, 'results': [
+                {'id': 2, 'name': 'beta'},
+            ], 'next': None, 'previous': None}, name__in='beta', page_size='200')
+            client.get_name_index('/foo/')[self.res._index_key({'name': 'alpha'})] = 1
+            self.assertEqual(self.res.resolve_many(['alpha', 'beta']), {'alpha': 1, 'beta': 2})
+            self.assertEqual(self.res.resolve(name='beta'), 2)
+            self.assertEqual(len(t.requests), 1)
+
+    def test_resolve_checks_kept_index(self):
+        """Establish that, with the index kept on disk, resolve and
+        resolve_many check the indexed objects before trusting them.
+        """
+        with client.test_mode as t:
+            t.register_json('/foo/42/', {'id': 42, 'name': 'bar'})
+            t.register('/foo/41/', '', status_code=404)
+            t.register_json('/foo/?name=baz', {'count': 1, 'results': [
+                {'id': 43, 'name': 'baz'},
+            ], 'next': None, 'previous': None})
+            t.register_json('/foo/', {'count': 1, 'results': [
+                {'id': 42, 'name': 'bar'},
+            ], 'next': None, 'previous': None}, id__in='41,42', page_size='200')
+            t.register_json('/foo/', {'count': 1, 'results': [
+                {'id': 43, 'name': 'baz'},
+            ], 'next': None, 'previous': None}, name__in='baz', page_size='200')
+            with settings.runtime_values(cache_names=True):
+                index = client.get_name_index('/foo/')
+                index[self.res._index_key({'name': 'bar'})] = 42
+                index[self.res._index_key({'name': 'baz'})] = 41
+                self.assertEqual(self.res.resolve(name='bar'), 42)
+                self.assertEqual(self.res.resolve(name='baz'), 43)
+                self.assertEqual(len(t.requests), 3)
+                index[self.res._index_key({'name': 'baz'})] = 41
+                self.assertEqual(self.res.resolve_many(['bar', 'baz']), {'bar': 42, 'baz': 43})
+                self.assertEqual(len(t.requests), 5)
+
+    def test_warm_index(self):
+        """Establish that warming the index fills it from one listing,
+        indexing names alone only where they are unique.
+        """
+        class HostResource(models.Resource):
+            endpoint = '/hosts/'
+            identity = ('inventory', 'name')
+            inventory = models.Field()
+            name = models.Field(unique=True)
+        res = HostResource()
+        with client.test_mode as t:
+            t.register_json('/hosts/?page_size=200', {'count': 3, 'results': [
+                {'id': 1, 'inventory': 1, 'name': 'web'},
+                {'id': 2, 'inventory': 2, 'name': 'web'},
+                {'id': 3, 'inventory': 2, 'name': 'db'},
+            ], 'next': None, 'previous': None})
+            self.assertEqual(res.warm_index(), 3)
+            self.assertEqual(res.resolve(inventory=2, name='web'), 2)
+            self.assertEqual(res.resolve(name='db'), 3)
+            self.assertEqual(len(t.requests), 1)
+            self.assertNotIn(res._index_key({'name': 'web'}), client.get_name_index('/hosts/'))
+
+    def test_bulk_write(self):
+        """Establish that bulk_write reads the existing objects with one
+        listing and only writes the records that change something.
+        """
+        with client.test_mode as t:
+            t.register_json('/foo/', {'count': 2, 'results': [
+                {'id': 1, 'name': 'alpha', 'description': 'same'},
+                {'id': 2, 'name': 'beta', 'description': 'old'},
+            ], 'next': None, 'previous': None}, name__in='alpha,beta,gamma', page_size='200')
+            t.register_json('/foo/2/', {'id': 2, 'name': 'beta', 'description': 'new'}, method='PATCH')
+            t.register_json('/foo/', {'id': 3, 'name': 'gamma'}, method='POST')
+            result = self.res.bulk_write([
+                {'name': 'gamma'},
+                {'name': 'alpha', 'description': 'same'},
+                {'name': 'beta', 'description': 'new'},
+            ], concurrency=2)
+            self.assertEqual([(r['id'], r['changed']) for r in result], [(3, True), (1, False), (2, True)])
+            self.assertEqual(sorted(r.method for r in t.requests), ['GET', 'PATCH', 'POST'])
+
+    def test_bulk_write_duplicate_or_missing(self):
+        with client.test_mode as t:
+            t.register_json('/foo/', {'count': 0, 'results': [], 'next': None, 'previous': None},
+                            name__in='alpha', page_size='200')
+            with self.assertRaises(exc.BadRequest):
+                self.res.bulk_write([{'name': 'alpha'}, {'name': 'alpha'}])
+            with self.assertRaises(exc.NotFound):
+                self.res.bulk_write([{'name': 'alpha'}], create_on_missing=False)
+
+    def test_apply(self):
+        """Establish that apply reads its records from a YAML file."""
+        with mock.patch.object(self.res, 'bulk_write') as bulk_write:
+            bulk_write.return_value = [{'changed': False, 'id': 1}, {'changed': True, 'id': 2}]
+            result = self.res.apply(StringIO('- name: alpha\n- name: beta\n'))
+            self.assertTrue(result['changed'])
+            self.assertEqual(bulk_write.call_args[0][0], [{'name': 'alpha'}, {'name': 'beta'}])
+            with self.assertRaises(exc.UsageError):
+                self.res.apply(StringIO('- alpha\n'))
+
+    def test_bulk_modify(self):
+        """Establish that bulk_modify walks the matching objects by ID and
+        only modifies those whose fields differ.
+        """
+        class HostResource(models.Resource):
+            endpoint = '/hosts/'
+            name = models.Field(unique=True)
+            enabled = models.Field(type=bool, required=False)
+        res = HostResource()
+        with client.test_mode as t:
+            t.register_json('/hosts/', {'count': 2, 'results': [
+                {'id': 1, 'name': 'old-a', 'enabled': True},
+                {'id': 2, 'name': 'old-b', 'enabled': False},
+            ], 'next': None, 'previous': None}, name__startswith='old-', order_by='id', page_size='200')
+            t.register_json('/hosts/1/', {'id': 1, 'name': 'old-a', 'enabled': False}, method='PATCH')
+            result = res.bulk_modify(filters=('name__startswith=old-',), values=('enabled=false',), concurrency=2)
+            self.assertEqual(result, {'changed': True, 'count': 1})
+            self.assertEqual(json.loads(t.requests[-1].body), {'enabled': False})
+
+    def test_bulk_delete(self):
+        with client.test_mode as t:
+            t.register_json('/foo/', {'count': 2, 'results': [
+                {'id': 1, 'name': 'a'}, {'id': 2, 'name': 'b'},
+            ], 'next': None, 'previous': None}, description='x', order_by='id', page_size='200')
+            t.register_json('/foo/1/', {}, method='DELETE')
+            t.register('/foo/2/', '', status_code=404, method='DELETE')
+            result = self.res.bulk_delete(filters={'description': 'x'})
+            self.assertEqual(result, {'changed': True, 'count': 1})
+
+    def test_bulk_delete_dry_run(self):
+        with client.test_mode as t:
+            t.register_json('/foo/', {'count': 7, 'results': [{'id': 1}], 'next': 2, 'previous': None},
+                            description='x', page_size='1')
+            self.assertEqual(self.res.bulk_delete(filters={'description': 'x'}, dry_run=True),
+                             {'changed': False, 'count': 7})
+            self.assertEqual(len(t.requests), 1)
+            with self.assertRaises(exc.UsageError):
+                self.res.bulk_delete()
+
     def test_copy_with_multiples(self):
         """
         A resource with fields marked `multiple` has those fields copied fully
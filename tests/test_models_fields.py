@@ -135,6 +135,19 @@ class ManyToManyFieldTests(unittest.TestCase):
             method(res, organization=1, user=2)
             mock_disassoc.assert_called_once_with('admins', 1, 2)
 
+    def test_sync_method(self):
+        f = models.ManyToManyField('user', res_name='organization', relationship='admins')
+        method = f.sync_method
+
+        class Resource:
+            def _sync_assoc(self):
+                pass
+
+        res = Resource()
+        with mock.patch.object(res, '_sync_assoc') as mock_sync:
+            method(res, organization=1, user=(2, 3))
+            mock_sync.assert_called_once_with('admins', 1, (2, 3), 'user', concurrency=None)
+
     def test_resource_configuration(self):
         f = models.ManyToManyField('user')
 
@@ -145,6 +158,22 @@ class ManyToManyFieldTests(unittest.TestCase):
         self.assertEqual(Foo.m2m_fields, [f])
         self.assertTrue(hasattr(Foo, 'associate_admin'))
         self.assertTrue(hasattr(Foo, 'disassociate_admin'))
+        self.assertTrue(hasattr(Foo, 'associate_many_admin'))
+        self.assertTrue(hasattr(Foo, 'disassociate_many_admin'))
+        self.assertTrue(hasattr(Foo, 'sync_admin'))
+
+    def test_many_only(self):
+        f = models.ManyToManyField('user', method_name='member', many_only=True)
+
+        class Foo(models.BaseResource):
+            members = f
+            endpoint = '/foos/'
+
+        self.assertFalse(hasattr(Foo, 'associate_member'))
+        self.assertFalse(hasattr(Foo, 'disassociate_member'))
+        self.assertTrue(hasattr(Foo, 'associate_many_member'))
+        self.assertTrue(hasattr(Foo, 'disassociate_many_member'))
+        self.assertTrue(hasattr(Foo, 'sync_member'))
 
     def test_method_docs(self):
         f = models.ManyToManyField('user')
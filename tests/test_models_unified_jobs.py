@@ -30,6 +30,7 @@ def project_update_registration(t):
         'failed': False,
         'status': 'successful',
     }, method='GET')
+    t.register_json('/project_updates/54/events/', {'count': 0, 'results': []}, method='GET')
 
 
 class StandardOutTests(unittest.TestCase):
@@ -57,23 +58,40 @@ class StandardOutTests(unittest.TestCase):
 
     def test_stdout(self):
         "Test that printing standard out works with project-like things."
-        with mock.patch.object(type(self.res), 'lookup_stdout') as lookup:
+        with mock.patch.object(type(self.res), 'stream_stdout') as stream:
             with mock.patch.object(type(self.res), 'last_job_data') as job:
-                with mock.patch.object(click, 'echo') as mock_echo:
-                    with mock.patch('sys.stdout', new=StringIO()) as fake_out:
-                        job.return_value = {'id': 42}
-                        lookup.return_value = 'foobar'
-                        result = self.res.stdout(42, outfile=fake_out)
-                        assert not result['changed']
-                        mock_echo.assert_called_once_with('foobar', nl=1, file=fake_out)
+                with mock.patch('sys.stdout', new=StringIO()) as fake_out:
+                    job.return_value = {'id': 42}
+                    result = self.res.stdout(42, outfile=fake_out)
+                    assert not result['changed']
+                    stream.assert_called_once_with(42, fake_out, None, None)
 
     def test_stdout_with_lookup(self):
         "Test that unified job will be automatically looked up."
-        with mock.patch.object(type(self.job_res), 'lookup_stdout'):
+        with mock.patch.object(type(self.job_res), 'stream_stdout'):
             with mock.patch.object(type(self.job_res), 'get') as get:
-                with mock.patch.object(click, 'echo'):
-                    self.job_res.stdout(pk=None, name="test-proj")
-                    get.assert_called_once_with(name="test-proj")
+                self.job_res.stdout(pk=None, name="test-proj")
+                get.assert_called_once_with(name="test-proj")
+
+    def test_stream_stdout(self):
+        "Test that standard out is downloaded and written as it arrives."
+        with client.test_mode as t:
+            t.register('/jobs/42/stdout/', u'PLAY [all]\nok: [h\u00f6st]\nPLAY RECAP'.encode('utf8'),
+                       format='ansi_download')
+            outfile = StringIO()
+            with mock.patch('tower_cli.models.base.STDOUT_CHUNK_SIZE', 3):
+                written = self.job_res.stream_stdout(42, outfile)
+            self.assertEqual(outfile.getvalue(), u'PLAY [all]\nok: [h\u00f6st]\nPLAY RECAP\n')
+            self.assertEqual(written, 32)
+
+    def test_stream_stdout_line_range(self):
+        "Test that only the lines asked for are written."
+        with client.test_mode as t:
+            t.register('/jobs/42/stdout/', b'zero\none\ntwo\nthree\n', format='ansi_download')
+            outfile = StringIO()
+            with mock.patch('tower_cli.models.base.STDOUT_CHUNK_SIZE', 4):
+                self.job_res.stream_stdout(42, outfile, start_line=1, end_line=3)
+            self.assertEqual(outfile.getvalue(), 'one\ntwo\n')
 
     def test_call_wait_with_parent(self):
         "Test auto-lookup of last job is called for wait"
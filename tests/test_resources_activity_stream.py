@@ -0,0 +1,65 @@
+# Copyright 2017, Ansible by Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import tower_cli
+from tower_cli.api import client
+
+from tests.compat import unittest
+
+
+class ActivityStreamTests(unittest.TestCase):
+    """A set of tests to establish that the activity stream resource
+    lists the newest activity first.
+    """
+    def setUp(self):
+        self.res = tower_cli.get_resource('activity_stream')
+
+    def test_list_newest_first(self):
+        """Establish that a single page is ordered by timestamp."""
+        with client.test_mode as t:
+            t.register_json('/activity_stream/?order_by=-timestamp', {'count': 1, 'results': [
+                {'id': 9, 'operation': 'create'},
+            ], 'next': None, 'previous': None})
+            result = self.res.list()
+            self.assertEqual([i['id'] for i in result['results']], [9])
+            self.assertEqual(result['results'][0]['actor'], None)
+
+    def test_list_all_pages_by_id(self):
+        """Establish that all pages are walked newest first by ID, asking
+        for the records before the last one seen.
+        """
+        with client.test_mode as t:
+            t.register_json('/activity_stream/?order_by=-id&page_size=200', {'count': 2, 'results': [
+                {'id': 9, 'operation': 'create'},
+            ], 'next': '/activity_stream/?order_by=-id&page=2', 'previous': None})
+            t.register_json('/activity_stream/?order_by=-id&id__lt=9&page_size=200', {'count': 1, 'results': [
+                {'id': 4, 'operation': 'update'},
+            ], 'next': None, 'previous': None})
+            result = self.res.list(all_pages=True)
+            self.assertEqual([i['id'] for i in result['results']], [9, 4])
+            self.assertEqual(result['count'], 2)
+
+    def test_iter_list_by_timestamp(self):
+        """Establish that an explicit timestamp order is kept, reading
+        the pages by number.
+        """
+        with client.test_mode as t:
+            t.register_json('/activity_stream/?order_by=-timestamp&page_size=200', {'count': 2, 'results': [
+                {'id': 4, 'operation': 'update'},
+            ], 'next': '/activity_stream/?order_by=-timestamp&page=2', 'previous': None})
+            t.register_json('/activity_stream/?order_by=-timestamp&page=2&page_size=200', {'count': 2, 'results': [
+                {'id': 9, 'operation': 'create'},
+            ], 'next': None, 'previous': '/activity_stream/?order_by=-timestamp'})
+            records = self.res.iter_list(query=(('order_by', '-timestamp'),))
+            self.assertEqual([i['id'] for i in records], [4, 9])
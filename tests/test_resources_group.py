@@ -127,6 +127,29 @@ class GroupTests(unittest.TestCase):
                 self.gr.list(parent="foo_group")
                 mock_list.assert_called_once_with()
 
+    def test_iter_list_root(self):
+        """Establish that streaming root groups reads them from the root
+        groups of the inventory.
+        """
+        with client.test_mode as t:
+            t.register_json('/inventories/1/root_groups/', {
+                'count': 1,
+                'results': [{'id': 1, 'name': 'Foo', 'inventory': 1}],
+                'next': None,
+                'previous': None,
+            })
+            records = self.gr.iter_list(root=True, inventory=1)
+            self.assertEqual([i['id'] for i in records], [1])
+
+    def test_iter_list_under_parent(self):
+        """Establish that streaming with a parent specified works."""
+        with mock.patch('tower_cli.models.base.BaseResource.iter_list') as mock_iter_list:
+            with mock.patch('tower_cli.resources.group.Resource.lookup_with_inventory') as lookup:
+                lookup.return_value = {'id': 5}
+                self.gr.iter_list(parent="foo_group", all_pages=True)
+                mock_iter_list.assert_called_once_with(all_pages=True)
+                self.assertEqual(self.gr.endpoint, '/groups/5/children/')
+
     def test_associate(self):
         """Establish that associate commands work."""
         with mock.patch('tower_cli.models.base.BaseResource._assoc') as mock_assoc:
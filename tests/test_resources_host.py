@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+
 import tower_cli
 from tower_cli.api import client
 
@@ -38,6 +40,12 @@ class HostTests(unittest.TestCase):
             self.host_resource.list(host_filter='foobar')
             mock_list.assert_called_once_with(query=(('host_filter', 'foobar'),))
 
+    def test_iter_list_under_group(self):
+        """Establish that a group flag is converted into query string when streaming."""
+        with mock.patch('tower_cli.models.base.BaseResource.iter_list') as mock_iter_list:
+            self.host_resource.iter_list(group=78, all_pages=True)
+            mock_iter_list.assert_called_once_with(query=(('groups__in', 78),), all_pages=True)
+
     def test_normal_list(self):
         """Establish that the group flag doesn't break the normal list."""
         with mock.patch('tower_cli.models.base.BaseResource.list') as mock_list:
@@ -57,3 +65,35 @@ class HostTests(unittest.TestCase):
             t.register_json('/hosts/42/', {'id': 42})
             t.register_json('/hosts/42/insights/', {'foo': 'bar'})
             self.assertEqual(self.host_resource.insights(pk=42), {'foo': 'bar'})
+
+    def test_bulk_write_bulk_create(self):
+        """Establish that bulk_write creates new hosts with the bulk
+        host_create endpoint when the server offers it.
+        """
+        with client.test_mode as t:
+            t.register_json('/bulk/', {'host_create': '/api/v2/bulk/host_create/'})
+            t.register_json('/hosts/', {'count': 0, 'next': None, 'results': []})
+            t.register_json('/bulk/host_create/', {'url': '/api/v2/inventories/1/hosts/', 'hosts': [
+                {'id': 11, 'name': 'web2'}, {'id': 10, 'name': 'web1'},
+            ]}, method='POST')
+            result = self.host_resource.bulk_write([
+                {'name': 'web1', 'inventory': 1},
+                {'name': 'web2', 'inventory': 1, 'variables': 'foo: bar'},
+            ])
+            self.assertEqual([(r['changed'], r['id']) for r in result], [(True, 10), (True, 11)])
+            self.assertEqual(json.loads(t.requests[-1].body), {'inventory': 1, 'hosts': [
+                {'name': 'web1'}, {'name': 'web2', 'variables': 'foo: bar'},
+            ]})
+
+    def test_bulk_create_numeric_name(self):
+        """Establish that hosts created in bulk are matched to the records
+        by name when the records give the name as a number.
+        """
+        with client.test_mode as t:
+            t.register_json('/bulk/', {'host_create': '/api/v2/bulk/host_create/'})
+            t.register_json('/hosts/', {'count': 0, 'next': None, 'results': []})
+            t.register_json('/bulk/host_create/', {'url': '/api/v2/inventories/1/hosts/', 'hosts': [
+                {'id': 10, 'name': '10'},
+            ]}, method='POST')
+            result = self.host_resource.bulk_write([{'name': 10, 'inventory': 1}])
+            self.assertEqual([(r['changed'], r['id']) for r in result], [(True, 10)])
@@ -19,6 +19,7 @@ import time
 from copy import copy
 
 import click
+from six import StringIO
 
 import tower_cli
 from tower_cli.api import client
@@ -27,6 +28,7 @@ from tower_cli.cli.resource import ResSubcommand
 
 from tests.compat import unittest, mock
 from tower_cli.conf import settings
+from tower_cli.resources import job as job_resource
 from tower_cli.constants import CUR_API_VERSION
 
 
@@ -46,17 +48,10 @@ def standard_registration(t, **kwargs):
     """ Endpoints common to launching any job with template #1 and
     is automatically assigned to job #42. kwargs is used to provide
     extra return fields of job launch"""
-
-    # A GET to the template endpoint is made to find the extra_vars to combine
-    t.register_json('/job_templates/1/', {
-        'id': 1,
-        'name': 'frobnicate',
-        'related': {'launch': '/job_templates/1/launch/'},
-    })
     register_get(t)
 
-    # A GET to the launch endpoint is needed to check if
-    # a password prompt is needed
+    # A GET to the launch endpoint tells what the template asks for
+    # and whether a password prompt is needed
     t.register_json('/job_templates/1/launch/', {}, method='GET')
 
     # A POST to the launch endpoint will launch a job, and we
@@ -72,16 +67,12 @@ def jt_vars_registration(t, extra_vars):
     1) version of Tower - 2.2.0
     2) successful job launch, id=42
     3) prompts user for variables on launch """
-    t.register_json('/job_templates/1/', {
-        'ask_variables_on_launch': True,
-        'extra_vars': extra_vars,
-        'id': 1,
-        'name': 'frobnicate',
-        'related': {'launch': '/job_templates/1/launch/'},
-    })
     register_get(t)
     t.register_json('/config/', {'version': '2.2.0'}, method='GET')
-    t.register_json('/job_templates/1/launch/', {}, method='GET')
+    t.register_json('/job_templates/1/launch/', {
+        'ask_variables_on_launch': True,
+        'defaults': {'extra_vars': extra_vars},
+    }, method='GET')
     t.register_json('/job_templates/1/launch/', {'id': 42},
                     method='POST')
 
@@ -123,7 +114,7 @@ class LaunchTests(unittest.TestCase):
             standard_registration(t)
             self.res.launch(1, tags="a, b, c")
             self.assertEqual(
-                json.loads(t.requests[2].body)['job_tags'], 'a, b, c',
+                json.loads(t.requests[1].body)['job_tags'], 'a, b, c',
             )
 
     def test_launch_w_tuple_extra_vars(self):
@@ -161,7 +152,7 @@ class LaunchTests(unittest.TestCase):
                 )
             self.assertDictContainsSubset(
                 {'foo': 'bar'},
-                json.loads(json.loads(t.requests[2].body)['extra_vars'])
+                json.loads(json.loads(t.requests[1].body)['extra_vars'])
             )
             self.assertDictContainsSubset({'changed': True, 'id': 42}, result)
 
@@ -197,8 +188,8 @@ class LaunchTests(unittest.TestCase):
             with mock.patch.object(click, 'edit') as edit:
                 edit.return_value = initial
                 self.res.launch(1, no_input=False)
-                self.assertEqual(t.requests[2].method, 'POST')
-                self.assertEqual(t.requests[2].body, '{}')
+                self.assertEqual(t.requests[1].method, 'POST')
+                self.assertEqual(t.requests[1].body, '{}')
 
     def test_job_template_variables_post_24(self):
         """ Check that in Tower versions past 2.4,
@@ -208,7 +199,7 @@ class LaunchTests(unittest.TestCase):
             jt_vars_registration(t, 'spam: eggs')
             t.register_json('/config/', {'version': '2.4'}, method='GET')
             result = self.res.launch(1, extra_vars=['foo: bar'])
-            response_json = yaml.load(t.requests[2].body, Loader=yaml.SafeLoader)
+            response_json = yaml.load(t.requests[1].body, Loader=yaml.SafeLoader)
             ev_json = yaml.load(response_json['extra_vars'], Loader=yaml.SafeLoader)
             self.assertTrue('foo' in ev_json)
             self.assertTrue('spam' not in ev_json)
@@ -219,11 +210,6 @@ class LaunchTests(unittest.TestCase):
         appropriately specified.
         """
         with client.test_mode as t:
-            t.register_json('/job_templates/1/', {
-                'id': 1,
-                'name': 'frobnicate',
-                'related': {'launch': '/job_templates/1/launch/'},
-            })
             register_get(t)
             t.register_json('/job_templates/1/launch/', {}, method='GET')
             t.register_json('/job_templates/1/launch/', {'id': 42},
@@ -232,7 +218,7 @@ class LaunchTests(unittest.TestCase):
 
             self.assertDictContainsSubset(
                 {'foo': 'bar'},
-                json.loads(json.loads(t.requests[2].body)['extra_vars'])
+                json.loads(json.loads(t.requests[1].body)['extra_vars'])
             )
             self.assertDictContainsSubset({'changed': True, 'id': 42}, result)
 
@@ -241,11 +227,6 @@ class LaunchTests(unittest.TestCase):
         appropriately specified.
         """
         with client.test_mode as t:
-            t.register_json('/job_templates/1/', {
-                'id': 1,
-                'name': 'frobnicate',
-                'related': {'launch': '/job_templates/1/launch/'},
-            })
             register_get(t)
             t.register_json('/job_templates/1/launch/', {}, method='GET')
             t.register_json('/job_templates/1/launch/', {'id': 42},
@@ -254,7 +235,7 @@ class LaunchTests(unittest.TestCase):
 
             self.assertDictContainsSubset(
                 {'foo': 'bar'},
-                json.loads(json.loads(t.requests[2].body)['extra_vars'])
+                json.loads(json.loads(t.requests[1].body)['extra_vars'])
             )
             self.assertDictContainsSubset({'changed': True, 'id': 42}, result)
 
@@ -263,11 +244,6 @@ class LaunchTests(unittest.TestCase):
         any invocation-time input.
         """
         with client.test_mode as t:
-            t.register_json('/job_templates/1/', {
-                'id': 1,
-                'name': 'frobnicate',
-                'related': {'launch': '/job_templates/1/launch/'},
-            })
             register_get(t)
             t.register_json('/job_templates/1/launch/', {
                 'passwords_needed_to_start': ['foo'],
@@ -301,6 +277,64 @@ class LaunchTests(unittest.TestCase):
                 echo_count_with_ignore = secho.call_count
         self.assertEqual(echo_count_with_ignore - echo_count, 2)
 
+    def test_launch_reads_only_launch_endpoint(self):
+        """Establish that a launch reads only the launch endpoint of the
+        job template, once for many launches in a row, and uses the job
+        that the launch answers with.
+        """
+        with client.test_mode as t:
+            t.register_json('/job_templates/1/launch/', {
+                'ask_credential_on_launch': True,
+                'defaults': {'extra_vars': '', 'credentials': [{'id': 3, 'name': 'ssh'}]},
+            }, method='GET')
+            t.register_json('/job_templates/1/launch/', {
+                'id': 42, 'job': 42, 'status': 'pending', 'ignored_fields': {},
+            }, method='POST')
+            for i in range(3):
+                result = self.res.launch(1, credential=[5])
+            self.assertEqual([r.method for r in t.requests], ['GET', 'POST', 'POST', 'POST'])
+            self.assertEqual(sorted(json.loads(t.requests[1].body)['credentials']), [3, 5])
+            self.assertEqual(result['status'], 'pending')
+            self.assertEqual(result['id'], 42)
+            self.assertNotIn('ignored_fields', result)
+            self.assertNotIn('job', result)
+
+    def test_launch_metadata_expires(self):
+        """Establish that the launch metadata of a job template is read
+        again once it is older than its time to live.
+        """
+        with client.test_mode as t:
+            standard_registration(t, status='pending')
+            with mock.patch('tower_cli.utils.cache.time.time') as now:
+                now.return_value = 1000
+                self.res.launch(1)
+                now.return_value = 1000 + job_resource.LAUNCH_METADATA_TTL + 1
+                self.res.launch(1)
+            self.assertEqual([r.method for r in t.requests], ['GET', 'POST', 'GET', 'POST'])
+
+    def test_launch_without_defaults(self):
+        """Establish that the extra variables of the job template are read
+        from the template itself on servers that give no launch defaults.
+        """
+        with client.test_mode as t:
+            standard_registration(t)
+            t.register_json('/job_templates/1/launch/', {'ask_variables_on_launch': True}, method='GET')
+            t.register_json('/job_templates/1/', {'id': 1, 'extra_vars': 'spam: eggs'})
+            with mock.patch.object(click, 'edit') as edit:
+                edit.return_value = 'foo: bar'
+                self.res.launch(1, no_input=False)
+                self.assertIn('spam: eggs', edit.mock_calls[0][1][0])
+
+    def test_no_preflight(self):
+        """Establish that a launch without preflight only posts the launch,
+        with the credentials given in place of those of the template.
+        """
+        with client.test_mode as t:
+            t.register_json('/job_templates/1/launch/', {'id': 42, 'status': 'pending'}, method='POST')
+            self.res.launch(1, credential=[5], limit='web', no_preflight=True)
+            self.assertEqual(len(t.requests), 1)
+            self.assertEqual(json.loads(t.requests[0].body), {'credentials': [5], 'limit': 'web'})
+
 
 class StatusTests(unittest.TestCase):
     """A set of tests to establish that the job status command works in the
@@ -536,8 +570,8 @@ class ListStatusesTests(unittest.TestCase):
         the entire set of jobs matching the requested statuses.
         """
         with client.test_mode as t:
-            t.register_json('/jobs/?or__status=pending&or__status=running', {
-                'count': 3,
+            t.register_json('/jobs/?or__status=pending&or__status=running&page_size=200', {
+                'count': 5,
                 'previous': None,
                 'next': '/api/%s/jobs/?or__status=pending&or__status=running&page=2' % CUR_API_VERSION,
                 'results': [{
@@ -557,8 +591,8 @@ class ListStatusesTests(unittest.TestCase):
                     'extra': 'ignored',
                 }]
             })
-            t.register_json('/jobs/?or__status=pending&or__status=running&page=2', {
-                'count': 2,
+            t.register_json('/jobs/?or__status=pending&or__status=running&page=2&page_size=200', {
+                'count': 5,
                 'previous': '/api/%s/jobs/?or__status=pending&or__status=running&page=1' % CUR_API_VERSION,
                 'next': None,
                 'results': [{
@@ -638,6 +672,7 @@ class MonitorWaitTests(unittest.TestCase):
                 'failed': False,
                 'status': 'successful',
             })
+            t.register_json('/jobs/42/job_events/', {'count': 0, 'results': []})
             # Test same for monitor
             with mock.patch.object(time, 'sleep') as sleep:
                 with mock.patch.object(type(self.res), 'wait'):
@@ -720,35 +755,128 @@ class MonitorWaitTests(unittest.TestCase):
             self.assertEqual(t.requests[0].url, t.requests[1].url)
 
     def test_monitor(self):
-        """Establish that if the first status call returns a pending job,
-        and the second a success, that both calls are made, and a success
-        finally returned.
+        """Establish that monitor writes the standard out of each new job
+        event as it arrives, and stops reading events once the playbook
+        has finished, reading the job only until it is finished as well.
         """
-        # Set up our data object.
-        data = {'elapsed': 1335024000.0, 'failed': False, 'status': 'pending'}
-
-        # Register the initial request's response.
+        data = {'elapsed': 1335024000.0, 'failed': False, 'status': 'running'}
         with client.test_mode as t:
             t.register_json('/jobs/42/', copy(data))
+            t.register_json('/jobs/42/job_events/', {'count': 2, 'results': [
+                {'counter': 1, 'event': 'playbook_on_start', 'stdout': ''},
+                {'counter': 2, 'event': 'playbook_on_play_start', 'stdout': 'PLAY [all]'},
+            ]}, counter__gt='0')
+            t.register_json('/jobs/42/job_events/', {'count': 1, 'results': [
+                {'counter': 3, 'event': 'playbook_on_stats', 'stdout': 'PLAY RECAP'},
+            ]}, counter__gt='2')
 
-            # Create a way to assign a successful data object to the request.
             def assign_success(*args):
-                t.clear()
                 t.register_json('/jobs/42/', dict(data, status='successful'))
 
-            # Make the successful state assignment occur when time.sleep()
-            # is called between requests.
+            outfile = StringIO()
             with mock.patch.object(time, 'sleep') as sleep:
                 sleep.side_effect = assign_success
-                with mock.patch.object(click, 'echo'):
-                    with mock.patch.object(type(self.res), 'wait'):
-                        with mock.patch.object(
-                                type(self.res), 'lookup_stdout'):
-                            self.res.monitor(42, min_interval=0.21)
-
-            # We should have gotten 3 requests total, to the same URL.
-            self.assertEqual(len(t.requests), 3)
-            self.assertEqual(t.requests[0].url, t.requests[1].url)
+                with mock.patch.object(type(self.res), 'wait'):
+                    result = self.res.monitor(42, outfile=outfile)
+
+            self.assertEqual(result['status'], 'successful')
+            self.assertIn('PLAY [all]\nPLAY RECAP\n', outfile.getvalue())
+            # The job is not read while events arrive, nor are events read after the last one.
+            self.assertEqual([r.url.split('?')[0] for r in t.requests],
+                             ['https://20.12.4.21/api/%s/jobs/42/job_events/' % CUR_API_VERSION] * 2 +
+                             ['https://20.12.4.21/api/%s/jobs/42/' % CUR_API_VERSION])
+            self.assertEqual(sleep.call_count, 1)
+
+    def test_monitor_quiet_backoff(self):
+        """Establish that monitor polls less often while a job writes no
+        events, and as often as asked once events arrive again.
+        """
+        data = {'elapsed': 1335024000.0, 'failed': False, 'status': 'running'}
+        with client.test_mode as t:
+            t.register_json('/jobs/42/', copy(data))
+            t.register_json('/jobs/42/job_events/', {'count': 0, 'results': []})
+
+            def tick(*args):
+                if sleep.call_count == 3:
+                    t.clear()
+                    t.register_json('/jobs/42/', dict(data, status='successful'))
+                    t.register_json('/jobs/42/job_events/', {'count': 1, 'results': [
+                        {'counter': 1, 'event': 'verbose', 'stdout': 'late'},
+                    ]}, counter__gt='0')
+                    t.register_json('/jobs/42/job_events/', {'count': 0, 'results': []}, counter__gt='1')
+
+            outfile = StringIO()
+            with mock.patch.object(time, 'sleep') as sleep:
+                sleep.side_effect = tick
+                with mock.patch.object(type(self.res), 'wait'):
+                    self.res.monitor(42, interval=0.5, outfile=outfile)
+
+            self.assertEqual([c[0][0] for c in sleep.call_args_list], [1, 2, 4, 0.5])
+            self.assertIn('late\n', outfile.getvalue())
+
+    def test_monitor_late_event(self):
+        """Establish that monitor asks again for an event that Tower saved
+        after events with higher counters, and writes it.
+        """
+        data = {'elapsed': 1335024000.0, 'failed': False, 'status': 'successful'}
+        with client.test_mode as t:
+            t.register_json('/jobs/42/', data)
+            t.register_json('/jobs/42/job_events/', {'count': 2, 'next': None, 'results': [
+                {'counter': 1, 'event': 'verbose', 'stdout': 'one'},
+                {'counter': 3, 'event': 'verbose', 'stdout': 'three'},
+            ]}, counter__gt='0')
+            t.register_json('/jobs/42/job_events/', {'count': 1, 'next': None, 'results': [
+                {'counter': 2, 'event': 'verbose', 'stdout': 'two'},
+            ]}, counter__in='2')
+            t.register_json('/jobs/42/job_events/', {'count': 1, 'next': None, 'results': [
+                {'counter': 4, 'event': 'playbook_on_stats', 'stdout': 'four'},
+            ]}, counter__gt='3')
+            outfile = StringIO()
+            with mock.patch.object(time, 'sleep'):
+                with mock.patch.object(type(self.res), 'wait'):
+                    self.res.monitor(42, outfile=outfile)
+            self.assertIn('one\nthree\ntwo\nfour\n', outfile.getvalue())
+            # Once every event up to the last is written, no more are asked for.
+            self.assertEqual([r.url.split('?')[0].rsplit('/', 2)[-2] for r in t.requests],
+                             ['job_events', 'job_events', 'job_events', '42'])
+
+    def test_monitor_capped_page(self):
+        """Establish that monitor reads the next events at once when the
+        server sends fewer than were asked for but says more remain.
+        """
+        data = {'elapsed': 1335024000.0, 'failed': False, 'status': 'running'}
+        with client.test_mode as t:
+            t.register_json('/jobs/42/', dict(data, status='successful'))
+            t.register_json('/jobs/42/job_events/', {'count': 2, 'next': '/api/v2/jobs/42/job_events/?page=2',
+                                                     'results': [{'counter': 1, 'event': 'verbose', 'stdout': 'a'}]},
+                            counter__gt='0')
+            t.register_json('/jobs/42/job_events/', {'count': 1, 'next': None, 'results': [
+                {'counter': 2, 'event': 'playbook_on_stats', 'stdout': 'b'},
+            ]}, counter__gt='1')
+            outfile = StringIO()
+            with mock.patch.object(time, 'sleep') as sleep:
+                with mock.patch.object(type(self.res), 'wait'):
+                    self.res.monitor(42, outfile=outfile)
+            self.assertIn('a\nb\n', outfile.getvalue())
+            self.assertFalse(sleep.called)
+            # The cap the server put on the first page is asked for afterwards.
+            self.assertIn('page_size=200', t.requests[0].url)
+            self.assertIn('page_size=1', t.requests[1].url)
+
+    def test_monitor_without_events(self):
+        """Establish that monitor follows the standard out of the job if
+        Tower has no events endpoint for it.
+        """
+        data = {'elapsed': 1335024000.0, 'failed': False, 'status': 'successful'}
+        with client.test_mode as t:
+            t.register_json('/jobs/42/', data)
+            t.register('/jobs/42/job_events/', '', status_code=404)
+            outfile = StringIO()
+            with mock.patch.object(type(self.res), 'wait'):
+                with mock.patch.object(type(self.res), '_monitor_stdout', return_value=data) as monitor_stdout:
+                    result = self.res.monitor(42, outfile=outfile)
+            self.assertEqual(result['status'], 'successful')
+            monitor_stdout.assert_called_once_with(42, None, 0.5, outfile)
 
     def test_timeout(self):
         """Establish that the --timeout flag is honored if sent to
@@ -799,6 +927,56 @@ class MonitorWaitTests(unittest.TestCase):
             self.assertEqual(len(t.requests), 2)
             self.assertEqual(t.requests[0].url, t.requests[1].url)
 
+    def register_unified_jobs(self, t, query, *jobs):
+        t.register_json('/unified_jobs/', {'count': len(jobs), 'next': None, 'previous': None, 'results': [
+            {'id': pk, 'status': status, 'failed': status == 'failed'} for pk, status in jobs
+        ]}, id__in=query)
+
+    def test_wait_many(self):
+        """Establish that wait_many polls all outstanding jobs with one
+        query, drops the finished ones from later polls, and reports on
+        every job.
+        """
+        with client.test_mode as t:
+            self.register_unified_jobs(t, '1,2,3', (1, 'successful'), (2, 'running'), (3, 'pending'))
+
+            def finish(*args):
+                self.register_unified_jobs(t, '2,3', (2, 'successful'), (3, 'failed'))
+
+            with mock.patch.object(time, 'sleep') as sleep:
+                sleep.side_effect = finish
+                result = self.res.wait_many([1, 2, 3], outfile=StringIO())
+            self.assertEqual(sleep.call_count, 1)
+            self.assertEqual(len(t.requests), 2)
+            self.assertIn('id__in=2%2C3', t.requests[1].url)
+            self.assertTrue(result['failed'])
+            self.assertEqual([(r['id'], r['status']) for r in result['results']],
+                             [(1, 'successful'), (2, 'successful'), (3, 'failed')])
+
+            # The wait command fails when any of the jobs failed.
+            with mock.patch.object(time, 'sleep') as sleep:
+                sleep.side_effect = finish
+                with self.assertRaises(exc.JobFailure):
+                    self.res.wait(None, pks=[1, 2, 3], outfile=StringIO())
+
+    def test_wait_many_any_and_fail_fast(self):
+        """Establish that wait_many can return when the first job
+        finishes, and raise when the first job fails.
+        """
+        with client.test_mode as t:
+            self.register_unified_jobs(t, '1,2', (1, 'running'), (2, 'successful'))
+            with mock.patch.object(time, 'sleep') as sleep:
+                result = self.res.wait_many([1, 2], mode='any', outfile=StringIO())
+                self.assertEqual(sleep.call_count, 0)
+            self.assertFalse(result['failed'])
+            self.assertEqual([r['status'] for r in result['results']], ['running', 'successful'])
+
+            self.register_unified_jobs(t, '3,4', (3, 'running'), (4, 'failed'))
+            with self.assertRaises(exc.JobFailure):
+                self.res.wait_many([3, 4], fail_fast=True, outfile=StringIO())
+            with self.assertRaises(exc.UsageError):
+                self.res.wait_many([3, 4], mode='some')
+
 
 class CancelTests(unittest.TestCase):
     """A set of tasks to establish that the job cancel command works in the
@@ -867,3 +1045,137 @@ class RelaunchTests(unittest.TestCase):
             result = self.res.relaunch(42)
             self.assertTrue(t.requests[0].url.endswith('/jobs/42/relaunch/'))
             self.assertTrue(result['changed'])
+
+
+class BulkLaunchTests(unittest.TestCase):
+    """A set of tests for establishing that the job resource launches many
+    jobs at once in the way we expect.
+    """
+    def setUp(self):
+        self.res = tower_cli.get_resource('job')
+
+    def test_bulk_endpoint(self):
+        """Establish that the jobs are launched by one request to the bulk
+        job_launch endpoint when the server offers it.
+        """
+        with client.test_mode as t:
+            t.register_json('/bulk/', {'job_launch': '/api/v2/bulk/job_launch/'})
+            t.register_json('/bulk/job_launch/', {'id': 7}, method='POST')
+            t.register_json('/workflow_jobs/7/workflow_nodes/', {'count': 2, 'next': None, 'results': [
+                {'id': 71, 'identifier': '1', 'job': None},
+                {'id': 70, 'identifier': '0', 'job': 42},
+            ]})
+            result = self.res.bulk_launch([
+                {'job_template': 1, 'limit': 'web', 'tags': 'a'},
+                {'job_template': 1, 'extra_vars': 'foo: bar'},
+            ])
+            self.assertEqual(result, [
+                {'changed': True, 'id': 42, 'workflow_job': 7, 'workflow_node': 70},
+                {'changed': True, 'id': None, 'workflow_job': 7, 'workflow_node': 71},
+            ])
+            jobs = json.loads(t.requests[1].body)['jobs']
+            self.assertEqual(jobs, [
+                {'unified_job_template': 1, 'identifier': '0', 'limit': 'web', 'job_tags': 'a'},
+                {'unified_job_template': 1, 'identifier': '1', 'extra_data': {'foo': 'bar'}},
+            ])
+
+    def test_bulk_endpoint_with_credentials(self):
+        """Establish that credentials given to a bulk launch are added to
+        those of the job template.
+        """
+        with client.test_mode as t:
+            t.register_json('/bulk/', {'job_launch': '/api/v2/bulk/job_launch/'})
+            t.register_json('/job_templates/?id__in=1', {'count': 1, 'next': None, 'results': [
+                {'id': 1, 'summary_fields': {'credentials': [{'id': 3}]}},
+            ]})
+            t.register_json('/bulk/job_launch/', {'id': 7}, method='POST')
+            t.register_json('/workflow_jobs/7/workflow_nodes/', {'count': 1, 'next': None, 'results': [
+                {'id': 70, 'identifier': '0', 'job': 42},
+            ]})
+            self.res.bulk_launch([{'job_template': 1, 'credential': 5}])
+            jobs = json.loads(t.requests[-2].body)['jobs']
+            self.assertEqual(jobs[0]['credentials'], [3, 5])
+
+    def test_fallback(self):
+        """Establish that each job is launched on its own when the server
+        has no bulk job_launch endpoint.
+        """
+        with client.test_mode as t:
+            t.register('/bulk/', '', status_code=404)
+            standard_registration(t)
+            result = self.res.bulk_launch([{'job_template': 1}, {'job_template': 1}], concurrency=1)
+            self.assertEqual([r['id'] for r in result], [42, 42])
+            self.assertTrue(all(r['changed'] for r in result))
+
+    def test_fallback_passwords_needed(self):
+        """Establish that a launch on its own that would have to ask for
+        passwords fails before any job is launched.
+        """
+        with client.test_mode as t:
+            t.register('/bulk/', '', status_code=404)
+            t.register_json('/job_templates/1/launch/', {'passwords_needed_to_start': ['ssh_password']})
+            with self.assertRaises(exc.UsageError):
+                self.res.bulk_launch([{'job_template': 1}, {'job_template': 1}])
+            self.assertFalse([r for r in t.requests if r.method == 'POST'])
+
+    def test_job_template_required(self):
+        """Establish that every launch must name a job template."""
+        with self.assertRaises(exc.UsageError):
+            self.res.bulk_launch([{'limit': 'web'}])
+
+    def test_launch_many(self):
+        """Establish that launch_many launches the jobs in a file, reads
+        the ids of the jobs launched in bulk once their workflow job has
+        made them, and waits on them together, with a summary of each
+        launch.
+        """
+        with client.test_mode as t:
+            t.register_json('/bulk/', {'job_launch': '/api/v2/bulk/job_launch/'})
+            t.register_json('/bulk/job_launch/', {'id': 7}, method='POST')
+            t.register_json('/workflow_jobs/7/', {'id': 7, 'status': 'running'})
+            t.register_json('/workflow_jobs/7/workflow_nodes/', {'count': 2, 'next': None, 'results': [
+                {'id': 70, 'identifier': '0', 'job': 42},
+                {'id': 71, 'identifier': '1', 'job': None},
+            ]})
+            t.register_json('/unified_jobs/', {'count': 2, 'next': None, 'results': [
+                {'id': 42, 'status': 'successful', 'failed': False},
+                {'id': 43, 'status': 'successful', 'failed': False},
+            ]}, id__in='42,43')
+
+            def make_job(*args):
+                t.register_json('/workflow_jobs/7/workflow_nodes/', {'count': 2, 'next': None, 'results': [
+                    {'id': 70, 'identifier': '0', 'job': 42},
+                    {'id': 71, 'identifier': '1', 'job': 43},
+                ]})
+            launches = StringIO('- {job_template: 1, limit: web}\n- {job_template: 1, limit: db}\n')
+            with mock.patch.object(time, 'sleep', side_effect=make_job) as sleep:
+                result = self.res.launch_many(launches, wait=True, outfile=StringIO())
+            self.assertEqual(sleep.call_count, 1)
+            self.assertTrue(result['changed'])
+            self.assertEqual([(r['id'], r['limit'], r['workflow_job'], r['status']) for r in result['results']],
+                             [(42, 'web', 7, 'successful'), (43, 'db', 7, 'successful')])
+
+    def test_launch_many_job_not_made(self):
+        """Establish that launch_many waits on the workflow job for a job
+        that it finished without making.
+        """
+        with client.test_mode as t:
+            t.register_json('/bulk/', {'job_launch': '/api/v2/bulk/job_launch/'})
+            t.register_json('/bulk/job_launch/', {'id': 7}, method='POST')
+            t.register_json('/workflow_jobs/7/', {'id': 7, 'status': 'failed'})
+            t.register_json('/workflow_jobs/7/workflow_nodes/', {'count': 2, 'next': None, 'results': [
+                {'id': 70, 'identifier': '0', 'job': 42},
+                {'id': 71, 'identifier': '1', 'job': None},
+            ]})
+            t.register_json('/unified_jobs/', {'count': 2, 'next': None, 'results': [
+                {'id': 42, 'status': 'failed', 'failed': True},
+                {'id': 7, 'status': 'failed', 'failed': True},
+            ]}, id__in='42,7')
+            with self.assertRaises(exc.JobFailure):
+                self.res.launch_many([{'job_template': 1, 'limit': 'web'}, {'job_template': 1}],
+                                     wait=True, outfile=StringIO())
+
+    def test_launch_many_not_a_list(self):
+        """Establish that launch_many needs a list of mappings."""
+        with self.assertRaises(exc.UsageError):
+            self.res.launch_many(StringIO('- web\n- db\n'))
@@ -119,6 +119,19 @@ class NotificationTemplateTests(unittest.TestCase):
             result = self.res.list(notification_type='irc', page=1)
             self.assertEqual(result['count'], 1)
 
+    def test_iter_list(self):
+        """Establish that configuration-related fields are not used for
+        searching when streaming a list of notification templates.
+        """
+        with client.test_mode as t:
+            t.register_json(self.endpoint,
+                            {'count': 1, 'results': [{'id': 9}],
+                             'previous': None, 'next': None},
+                            notification_type='irc', page_size='200')
+            records = self.res.iter_list(notification_type='irc', channels='["#foo"]')
+            self.assertEqual([i['id'] for i in records], [9])
+            self.assertNotIn('channels', t.requests[0].url)
+
     def test_config_fields_disabled_during_read(self):
         """Establish that configuration-related fields are not used for
         searching.
@@ -146,6 +146,13 @@ class RoleMethodTests(unittest.TestCase):
             mock_list.assert_called_once_with(role_field='read_role')
             self.assertEqual(self.res.endpoint, 'inventories/3/object_roles/')
 
+    def test_iter_list_user(self):
+        """Assure that streaming passes the same parameters as listing"""
+        with mock.patch(
+                'tower_cli.models.base.BaseResource.iter_list') as mock_iter_list:
+            self.res.iter_list(user=1, all_pages=True)
+            mock_iter_list.assert_called_once_with(members__in=1, all_pages=True)
+
     def test_get_user(self):
         """Assure that super method is called with right parameters"""
         with mock.patch(
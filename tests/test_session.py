@@ -0,0 +1,82 @@
+# Copyright 2017, Ansible by Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+import tower_cli
+from tower_cli.api import client
+from tower_cli.conf import settings
+from tower_cli.session import Session
+
+from tests.compat import unittest
+
+
+class SessionTests(unittest.TestCase):
+    """A set of tests to establish that sessions carry their own settings
+    and client.
+    """
+    def test_settings_and_client(self):
+        """Establish that a session's settings and client are used only
+        while the session is.
+        """
+        session = Session(host='tower.example.com', token='abc', verify_ssl=False)
+        with session:
+            self.assertEqual(settings.host, 'tower.example.com')
+            self.assertEqual(settings.oauth_token, 'abc')
+            self.assertIs(settings.verify_ssl, False)
+            self.assertIs(client._get_current_object(), session.client)
+        self.assertNotEqual(settings.host, 'tower.example.com')
+        self.assertIsNot(client._get_current_object(), session.client)
+
+    def test_bound_resource(self):
+        """Establish that the methods of a resource got from a session
+        make their requests within the session.
+        """
+        session = Session(host='20.12.4.21', token='abc')
+        with session.client.test_mode as t:
+            t.register_json('/users/1/', {'id': 1, 'username': 'alice'})
+            t.register_json('/users/', {'count': 1, 'next': None, 'results': [{'id': 1, 'username': 'alice'}]})
+            users = session.get_resource('user')
+            self.assertEqual(users.get(1)['username'], 'alice')
+            self.assertEqual([u['id'] for u in users.iter_list()], [1])
+            self.assertEqual(t.requests[0].headers['Authorization'], 'Bearer abc')
+
+    def test_sessions_in_threads(self):
+        """Establish that threads using different sessions at the same
+        time each see their own host.
+        """
+        sessions = [Session(host='tower%d.example.com' % i) for i in range(4)]
+        barrier = threading.Event()
+        seen = {}
+
+        def read(session):
+            with session:
+                barrier.wait()
+                seen[session] = (settings.host, client.get_prefix())
+        threads = [threading.Thread(target=read, args=(session,)) for session in sessions]
+        for thread in threads:
+            thread.start()
+        barrier.set()
+        for thread in threads:
+            thread.join()
+        for session in sessions:
+            self.assertEqual(seen[session], (session.settings['host'],
+                                             'https://%s/api/v2/' % session.settings['host']))
+
+    def test_get_resource(self):
+        """Establish that a bound resource reads attributes from the
+        resource.
+        """
+        jobs = Session(host='tower.example.com').get_resource('job')
+        self.assertEqual(jobs.endpoint, tower_cli.get_resource('job').endpoint)
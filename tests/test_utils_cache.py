@@ -0,0 +1,55 @@
+import os
+import shutil
+import tempfile
+
+from tower_cli.utils import cache
+
+from tests.compat import unittest, mock
+
+
+class CacheTests(unittest.TestCase):
+    """A set of tests to establish that the disk caches are read and
+    written as expected, and that a broken cache is taken as empty.
+    """
+    def setUp(self):
+        self.cache_dir = os.path.join(tempfile.mkdtemp(), 'tower_cli')
+        patcher = mock.patch.object(cache, 'CACHE_DIR', self.cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(shutil.rmtree, os.path.dirname(self.cache_dir))
+
+    def test_round_trip(self):
+        self.assertEqual(cache.load('foo'), {})
+        cache.save('foo', {'bar': 1})
+        self.assertEqual(cache.load('foo'), {'bar': 1})
+        self.assertEqual(os.listdir(self.cache_dir), ['foo.json'])
+
+    def test_unreadable(self):
+        os.makedirs(self.cache_dir)
+        with open(cache.cache_path('foo'), 'w') as f:
+            f.write('not json')
+        self.assertEqual(cache.load('foo'), {})
+        with open(cache.cache_path('foo'), 'w') as f:
+            f.write('[1, 2]')
+        self.assertEqual(cache.load('foo'), {})
+
+    def test_disabled(self):
+        with mock.patch.object(cache, 'enabled', False):
+            cache.save('foo', {'bar': 1})
+            self.assertEqual(cache.load('foo'), {})
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_is_fresh(self):
+        entry = cache.stamp({})
+        self.assertTrue(cache.is_fresh(entry, 60))
+        self.assertFalse(cache.is_fresh(entry, 0))
+        self.assertFalse(cache.is_fresh(None, 60))
+        entry['time'] -= 120
+        self.assertFalse(cache.is_fresh(entry, 60))
+
+    def test_clear(self):
+        self.assertEqual(cache.clear(), [])
+        cache.save('foo', {})
+        cache.save('bar', {})
+        self.assertEqual(cache.clear(), ['bar', 'foo'])
+        self.assertEqual(os.listdir(self.cache_dir), [])
@@ -0,0 +1,77 @@
+import threading
+
+from tower_cli import exceptions as exc
+from tower_cli.utils import concurrency, debug
+
+from tests.compat import unittest, mock
+
+
+class ParallelMapTests(unittest.TestCase):
+    """A set of tests to establish that the parallel_map helper keeps
+    results in input order and bubbles up errors.
+    """
+    def test_serial(self):
+        self.assertEqual(concurrency.parallel_map(lambda i: i * 2, [1, 2, 3]), [2, 4, 6])
+
+    def test_concurrent_order(self):
+        threads = set()
+
+        def double(i):
+            threads.add(threading.current_thread().name)
+            return i * 2
+        self.assertEqual(concurrency.parallel_map(double, range(20), concurrency=4), [i * 2 for i in range(20)])
+        self.assertNotIn(threading.current_thread().name, threads)
+
+    def test_concurrent_error(self):
+        def fail(i):
+            if i == 3:
+                raise exc.BadRequest('nope')
+            return i
+        with self.assertRaises(exc.BadRequest):
+            concurrency.parallel_map(fail, range(5), concurrency=2)
+
+
+class ParallelEachTests(unittest.TestCase):
+    """A set of tests to establish that parallel_each keeps the order of
+    items taken from a generator, and stops taking them after an error.
+    """
+    def test_generator_order(self):
+        def items():
+            for i in range(20):
+                yield i
+        self.assertEqual(concurrency.parallel_each(lambda i: i * 2, items(), concurrency=4),
+                         [i * 2 for i in range(20)])
+
+    def test_error_stops_taking_items(self):
+        taken = []
+
+        def items():
+            for i in range(1000):
+                taken.append(i)
+                yield i
+
+        def fail(i):
+            raise exc.BadRequest('nope')
+        with self.assertRaises(exc.BadRequest):
+            concurrency.parallel_each(fail, items(), concurrency=2)
+        self.assertLess(len(taken), 1000)
+
+
+class FetchPagesTests(unittest.TestCase):
+    """A set of tests to establish that fetch_pages works out the page
+    count from the first page and copes with a changing listing.
+    """
+    def test_page_count(self):
+        self.assertEqual(concurrency.page_count({'count': 5, 'results': [1, 2], 'next': 2}), 3)
+        self.assertEqual(concurrency.page_count({'count': 5, 'results': [1, 2], 'next': None}), 1)
+
+    def test_missing_page(self):
+        def fetch_page(number):
+            if number == 3:
+                raise exc.NotFound('Invalid page.')
+            return {'count': 5, 'results': [number], 'next': None}
+        first = {'count': 5, 'results': [1, 2], 'next': 2}
+        with mock.patch.object(debug, 'log') as log:
+            pages = concurrency.fetch_pages(first, fetch_page, concurrency=2)
+        self.assertEqual([page['results'] for page in pages], [[2]])
+        self.assertIn('Page 3 no longer exists', log.call_args[0][0])
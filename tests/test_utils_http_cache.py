@@ -0,0 +1,63 @@
+# Copyright 2017, Ansible by Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from requests.models import Response
+
+from tower_cli.conf import settings
+from tower_cli.utils.http_cache import HTTPCache, freshness_windows
+
+from tests.compat import unittest
+
+
+def response(body, **headers):
+    r = Response()
+    r.status_code = 200
+    r.headers.update(headers)
+    r._content = body.encode('utf8')
+    return r
+
+
+class HTTPCacheTests(unittest.TestCase):
+    """A set of tests to establish that the HTTP cache keeps only what it
+    can revalidate or reuse, and forgets what is written to.
+    """
+    def setUp(self):
+        self.cache = HTTPCache()
+
+    def test_freshness_windows(self):
+        with settings.runtime_values(http_cache_fresh='config=60, /settings/ =30,bogus'):
+            self.assertEqual(freshness_windows(), {'config': 60.0, 'settings': 30.0})
+
+    def test_store(self):
+        self.cache.store('a', 'https://t/api/v2/hosts/', response('{}', ETag='"1"'), 'hosts')
+        self.cache.store('b', 'https://t/api/v2/groups/', response('{}'), 'groups')
+        entry, fresh = self.cache.lookup('a', 'hosts')
+        self.assertFalse(fresh)
+        self.assertEqual(self.cache.conditional_headers(entry), {'If-None-Match': '"1"'})
+        self.assertEqual(self.cache.response(entry).json(), {})
+        self.assertEqual(self.cache.lookup('b', 'groups'), (None, False))
+
+    def test_evict(self):
+        self.cache.MAX_ENTRIES = 2
+        for key in 'abc':
+            self.cache.store(key, 'https://t/api/v2/%s/' % key, response('{}', ETag='"1"'), key)
+        self.assertEqual(sorted(self.cache.entries), ['b', 'c'])
+
+    def test_invalidate(self):
+        for key, url in (('list', 'https://t/api/v2/hosts/'), ('host', 'https://t/api/v2/hosts/1/'),
+                         ('vars', 'https://t/api/v2/hosts/1/variable_data/'),
+                         ('other', 'https://t/api/v2/hosts/2/')):
+            self.cache.store(key, url, response('{}', ETag='"1"'), 'hosts')
+        self.cache.invalidate('https://t/api/v2/hosts/1/')
+        self.assertEqual(sorted(self.cache.entries), ['other'])
@@ -0,0 +1,54 @@
+# Copyright 2017, Ansible by Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from tower_cli.conf import settings
+from tower_cli.utils.identity_map import IdentityMap
+
+from tests.compat import unittest
+
+
+class IdentityMapTests(unittest.TestCase):
+    """A set of tests to establish that the identity map remembers objects
+    only while it is switched on, and forgets those that are written to.
+    """
+    def setUp(self):
+        self.map = IdentityMap()
+
+    def test_off(self):
+        self.map.put('/hosts/1/', {'id': 1})
+        self.assertIsNone(self.map.get('/hosts/1/'))
+        self.assertEqual(self.map.stats, {'hits': 0, 'misses': 0, 'size': 0})
+
+    def test_active(self):
+        with self.map.active():
+            self.assertIsNone(self.map.get('/hosts/1/'))
+            self.map.put('/hosts/1/', {'id': 1, 'variables': {}})
+            obj = self.map.get('/hosts/1/')
+            obj['variables']['foo'] = 'bar'
+            self.assertEqual(self.map.get('/hosts/1/'), {'id': 1, 'variables': {}})
+            self.assertEqual(self.map.stats, {'hits': 2, 'misses': 1, 'size': 1})
+        self.assertEqual(self.map.stats['size'], 0)
+
+    def test_setting(self):
+        with settings.runtime_values(identity_map=True):
+            self.map.put('/hosts/1/', {'id': 1})
+            self.assertEqual(self.map.get('/hosts/1/'), {'id': 1})
+
+    def test_invalidate(self):
+        with self.map.active():
+            self.map.put('/job_templates/1/', {'id': 1})
+            self.map.put('/job_templates/10/', {'id': 10})
+            self.map.invalidate('/job_templates/1/launch/')
+            self.assertIsNone(self.map.get('/job_templates/1/'))
+            self.assertEqual(self.map.get('/job_templates/10/'), {'id': 10})
@@ -0,0 +1,57 @@
+# Copyright 2017, Ansible by Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from tower_cli.utils import debug, locking
+
+from tests.compat import unittest, mock
+
+
+class FileLockTests(unittest.TestCase):
+    """A set of tests to establish that file locks keep their holders
+    apart.
+    """
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        self.filename = os.path.join(self.temp_dir, 'foo.lock')
+
+    def test_lock_is_exclusive(self):
+        events = []
+
+        def hold(name):
+            with locking.file_lock(self.filename):
+                events.append('%s in' % name)
+                time.sleep(0.05)
+                events.append('%s out' % name)
+
+        threads = [threading.Thread(target=hold, args=(name,)) for name in ('a', 'b')]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([e.split()[1] for e in events], ['in', 'out', 'in', 'out'])
+        self.assertTrue(os.path.exists(self.filename))
+
+    def test_unlockable(self):
+        filename = os.path.join(self.temp_dir, 'missing', 'foo.lock')
+        with mock.patch.object(debug, 'log') as dlog:
+            with locking.file_lock(filename):
+                pass
+            self.assertTrue(dlog.called)
@@ -0,0 +1,114 @@
+# Copyright 2017, Ansible by Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+from tower_cli.utils import throttle
+
+from tests.compat import unittest, mock
+
+
+class TokenBucketTests(unittest.TestCase):
+    """A set of tests to establish that the token bucket lets requests
+    through at the rate it is given.
+    """
+    def test_burst_then_rate(self):
+        with mock.patch.object(throttle.time, 'time', return_value=100.0):
+            bucket = throttle.TokenBucket(2)
+            with mock.patch.object(throttle.time, 'sleep') as sleep:
+                bucket.acquire()
+                bucket.acquire()
+                self.assertFalse(sleep.called)
+                bucket.acquire()
+                sleep.assert_called_once_with(0.5)
+                bucket.acquire()
+                sleep.assert_called_with(1.0)
+
+    def test_refill(self):
+        with mock.patch.object(throttle.time, 'time', return_value=100.0) as now:
+            bucket = throttle.TokenBucket(2)
+            with mock.patch.object(throttle.time, 'sleep') as sleep:
+                bucket.acquire()
+                bucket.acquire()
+                now.return_value = 101.0
+                bucket.acquire()
+                bucket.acquire()
+                self.assertFalse(sleep.called)
+
+
+class ConcurrencyGovernorTests(unittest.TestCase):
+    """A set of tests to establish that the governor finds its limit by
+    additive increase and multiplicative decrease.
+    """
+    def test_overload_halves_limit(self):
+        governor = throttle.ConcurrencyGovernor(8)
+        governor.record(0.01, overloaded=True)
+        self.assertEqual(governor.limit, 4)
+        for _ in range(5):
+            governor.record(0.01, overloaded=True)
+        self.assertEqual(governor.limit, 1)
+
+    def test_success_raises_limit(self):
+        governor = throttle.ConcurrencyGovernor(8)
+        governor.limit = 2
+        governor.record(0.01)
+        self.assertEqual(governor.limit, 2.5)
+        for _ in range(100):
+            governor.record(0.01)
+        self.assertEqual(governor.limit, 8)
+
+    def test_slow_responses_halve_limit(self):
+        governor = throttle.ConcurrencyGovernor(8)
+        governor.record(0.2)
+        governor.record(0.2)
+        self.assertEqual(governor.limit, 8)
+        governor.record(1.0)
+        governor.record(1.0)
+        self.assertEqual(governor.limit, 8)
+        governor.record(1.0)
+        self.assertEqual(governor.limit, 4)
+
+    def test_slow_outlier_keeps_limit(self):
+        governor = throttle.ConcurrencyGovernor(8)
+        governor.record(0.2)
+        governor.limit = 4
+        governor.record(1.0)
+        self.assertEqual(governor.limit, 4)
+        self.assertEqual(governor.slow_run, 1)
+        governor.record(0.2)
+        self.assertEqual(governor.limit, 4.25)
+        self.assertEqual(governor.slow_run, 0)
+
+    def test_slot_waits_for_limit(self):
+        governor = throttle.ConcurrencyGovernor(1)
+        events = []
+
+        def request():
+            with governor.slot():
+                events.append(governor.active)
+        with governor.slot():
+            thread = threading.Thread(target=request)
+            thread.start()
+            thread.join(0.05)
+            self.assertEqual(events, [])
+        thread.join()
+        self.assertEqual(events, [1])
+        self.assertEqual(governor.active, 0)
+
+
+class BackoffTests(unittest.TestCase):
+    def test_backoff(self):
+        for attempt, ceiling in ((0, 0.5), (1, 1.0), (3, 4.0), (10, 30.0)):
+            delay = throttle.backoff(attempt)
+            self.assertTrue(ceiling / 2 <= delay <= ceiling, (attempt, delay))
@@ -0,0 +1,618 @@
+# Copyright 2017, Ansible by Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An asyncio client for the Tower API, and the asyncio versions of the
+methods of resources that use it.
+
+This module needs Python 3.5 or later, and aiohttp.
+"""
+
+import asyncio
+import contextlib
+import json
+import ssl
+import sys
+import time
+from base64 import b64decode
+
+import click
+from requests.adapters import DEFAULT_POOLSIZE
+from requests.models import PreparedRequest
+from requests.structures import CaseInsensitiveDict
+
+from tower_cli import exceptions as exc
+from tower_cli.api import (APIResponse, IDEMPOTENT_METHODS, RETRY_STATUSES, check_response, client,
+                           connection_failure, ssl_failure, ssl_verification)
+from tower_cli.conf import settings
+from tower_cli.context import ContextLocal, bind
+from tower_cli.utils import debug
+from tower_cli.utils.concurrency import page_count
+from tower_cli.utils.data_structures import OrderedDict
+
+
+class AsyncClient(object):
+    """A client for making HTTP requests to the Ansible Tower API from
+    asyncio code, with the same settings, errors and responses as
+    `tower_cli.api.client`.
+
+    The requests are made with aiohttp, over at most `pool_maxsize`
+    connections at once. The client is used by the `async_` methods of
+    resources while it is active:
+
+    >>> async with AsyncClient():
+    >>>     job = await tower_cli.get_resource('job').async_get(42)
+    """
+    def __init__(self):
+        try:
+            import aiohttp
+        except ImportError:
+            raise exc.TowerCLIError('The asyncio client needs aiohttp; install it with "pip install aiohttp".')
+        self._aiohttp = aiohttp
+        self._session = None
+        self._ssl_context = (None, None)
+        self._exits = ContextLocal('async_client', ())
+
+    @contextlib.contextmanager
+    def activate(self):
+        """Make this the client of the `async_` methods of resources in the
+        current context, until the context manager exits. Tasks started in
+        it use the client too.
+        """
+        previous = _current_client.set(self)
+        try:
+            yield self
+        finally:
+            _current_client.set(previous)
+
+    async def __aenter__(self):
+        self._exits.set(self._exits.get() + (_current_client.set(self),))
+        return self
+
+    async def __aexit__(self, *exc_info):
+        exits = self._exits.get()
+        self._exits.set(exits[:-1])
+        _current_client.set(exits[-1])
+        await self.close()
+
+    @property
+    def session(self):
+        """Return the aiohttp session that requests are made with, starting
+        it when it is first needed.
+        """
+        if self._session is None:
+            self._session = self._aiohttp.ClientSession(
+                connector=self._aiohttp.TCPConnector(limit=settings.pool_maxsize or DEFAULT_POOLSIZE),
+                timeout=self._aiohttp.ClientTimeout(total=None, sock_connect=settings.connect_timeout,
+                                                    sock_read=settings.read_timeout),
+            )
+        return self._session
+
+    async def close(self):
+        """Close the connections of the client."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def request(self, method, url, params=None, data=None, headers=None):
+        """Make a request to the Ansible Tower API, and return the response
+        as an `APIResponse` once all of it has been read.
+        """
+        method = method.upper()
+        url = client.full_url(url)
+
+        # POST and PUT requests will send JSON by default.
+        headers = dict(headers or {})
+        if method in ('PATCH', 'POST', 'PUT'):
+            headers.setdefault('Content-Type', 'application/json')
+        headers = await self._authenticate(method, url, headers)
+
+        # If debugging is on, print the URL and data being sent.
+        if settings.verbose:
+            debug.log('%s %s' % (method, url), fg='blue', bold=True)
+            if method in ('POST', 'PUT', 'PATCH'):
+                debug.log('Data: %s' % (data or {}), fg='blue', bold=True)
+            if method == 'GET' or params:
+                debug.log('Params: %s' % (params or {}), fg='blue', bold=True)
+            debug.log('')
+
+        # If this is a JSON request, encode the data value.
+        if headers.get('Content-Type', '') == 'application/json':
+            data = json.dumps(data or {})
+
+        # Send the request, sending idempotent requests again if Tower turns
+        # them away because it is overloaded, as `Client` does.
+        retries = (settings.retries or 0) if method in IDEMPOTENT_METHODS else 0
+        attempt = 0
+        while True:
+            r = await self._send(method, url, _query(params), data, headers)
+            if r.status_code not in RETRY_STATUSES or attempt >= retries:
+                break
+            delay = client._retry_delay(r, attempt)
+            debug.log('Tower answered %s %s with HTTP %d; trying again in %.1f seconds.' %
+                      (method, url, r.status_code, delay), header='details')
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        check_response(r, method, url, params, data)
+        return r
+
+    async def get(self, url, **kwargs):
+        return await self.request('GET', url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        return await self.request('POST', url, **kwargs)
+
+    async def patch(self, url, **kwargs):
+        return await self.request('PATCH', url, **kwargs)
+
+    async def put(self, url, **kwargs):
+        return await self.request('PUT', url, **kwargs)
+
+    async def delete(self, url, **kwargs):
+        return await self.request('DELETE', url, **kwargs)
+
+    async def options(self, url, **kwargs):
+        return await self.request('OPTIONS', url, **kwargs)
+
+    async def _authenticate(self, method, url, headers):
+        """Return `headers` with the authentication of `tower_cli.api.client`
+        added to them.
+        """
+        prepared = PreparedRequest()
+        prepared.prepare(method=method, url=url, headers=headers)
+        auth = client.get_auth()
+        if settings.use_token and not settings.oauth_token:
+            # Legacy tokens may have to be asked for, which blocks.
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, bind(auth), prepared)
+        else:
+            auth(prepared)
+        if 'Authorization' in prepared.headers:
+            headers['Authorization'] = prepared.headers['Authorization']
+        return headers
+
+    async def _send(self, method, url, params, data, headers):
+        rate_limiter = client.rate_limiter
+        if rate_limiter is not None:
+            await asyncio.sleep(rate_limiter.reserve())
+
+        try:
+            async with self.session.request(method, url, params=params, data=data, headers=headers,
+                                            ssl=self._ssl()) as response:
+                content = await response.read()
+        except self._aiohttp.ClientSSLError as ex:
+            raise ssl_failure(ex)
+        except self._aiohttp.ClientConnectionError as ex:
+            raise connection_failure(ex)
+
+        r = APIResponse()
+        r.status_code = response.status
+        r.reason = response.reason
+        r.headers = CaseInsensitiveDict(response.headers)
+        r.url = str(response.url)
+        r.encoding = response.charset
+        r._content = content
+        return r
+
+    def _ssl(self):
+        """Return the `ssl` argument for aiohttp that verifies certificates
+        as the settings ask: None for the default verification, False for
+        none, or a context for a certificate bundle, made again only when
+        the bundle changes.
+        """
+        verify_ssl = ssl_verification()
+        if verify_ssl is True:
+            return None
+        if verify_ssl is False:
+            return False
+        context = self._ssl_context
+        if context[0] != verify_ssl:
+            context = self._ssl_context = (verify_ssl, ssl.create_default_context(cafile=verify_ssl))
+        return context[1]
+
+
+def _query(params):
+    """Return the query parameters `params`, given as a dictionary or as
+    pairs, as pairs of strings, as requests would send them.
+    """
+    if not params:
+        return None
+    pairs = []
+    for key, value in (params.items() if isinstance(params, dict) else params):
+        for item in (value if isinstance(value, (list, tuple)) else [value]):
+            if item is not None:
+                pairs.append((str(key), str(item)))
+    return pairs
+
+
+_current_client = ContextLocal('aio_client')
+
+
+def current_client():
+    """Return the `AsyncClient` that is active in the current context."""
+    active = _current_client.get()
+    if active is None:
+        raise exc.TowerCLIError('No asyncio client is active; use "async with AsyncClient():".')
+    return active
+
+
+class AsyncResourceMixin(object):
+    """The asyncio versions of the methods of `BaseResource`, which make
+    their requests with the active `AsyncClient`.
+    """
+    async def async_read(self, pk=None, fail_on_no_results=False, fail_on_multiple_results=False, **kwargs):
+        """
+        =====API DOCS=====
+        Retrieve and return objects from the Ansible Tower API, as ``read`` does, with the active
+        ``tower_cli.aio.AsyncClient``.
+
+        :returns: loaded JSON from Tower backend response body.
+        :rtype: dict
+
+        =====API DOCS=====
+        """
+        url, params = self._read_request(pk, kwargs)
+        r = await current_client().get(url, params=params)
+        return self._read_answer(pk, r.json(), fail_on_no_results, fail_on_multiple_results)
+
+    async def async_get(self, pk=None, **kwargs):
+        """
+        =====API DOCS=====
+        Retrieve one and exactly one object, as ``get`` does, with the active ``tower_cli.aio.AsyncClient``.
+
+        :returns: loaded JSON of the retrieved resource object.
+        :rtype: dict
+
+        =====API DOCS=====
+        """
+        if kwargs.pop('include_debug_header', True):
+            debug.log('Getting the record.', header='details')
+        response = await self.async_read(pk=pk, fail_on_no_results=True, fail_on_multiple_results=True, **kwargs)
+        return response['results'][0]
+
+    async def async_list(self, all_pages=False, concurrency=None, pagination=None, **kwargs):
+        """
+        =====API DOCS=====
+        Retrieve a list of objects, as ``list`` does, with the active ``tower_cli.aio.AsyncClient``.
+
+        If ``all_pages`` is set, the pages after the first are read at the same time, at most as many at
+        once as ``concurrency`` or, by default, the ``pool_maxsize`` setting; pages walked by primary key are
+        read one after another.
+
+        :param all_pages: Flag that if set, collect all pages of content from the API when returning results.
+        :type all_pages: bool
+        :param concurrency: The most pages to read at the same time if ``all_pages`` is set.
+        :type concurrency: int
+        :param pagination: How to walk the pages if ``all_pages`` is set; either "page" or "keyset", as for
+                           ``list``.
+        :type pagination: str
+        :returns: A JSON object containing details of all resource objects returned by Tower backend.
+        :rtype: dict
+
+        =====API DOCS=====
+        """
+        self._split_statuses(kwargs)
+        if all_pages:
+            kwargs.pop('page', None)
+            self._set_all_pages_size(kwargs)
+
+        debug.log('Getting records.', header='details')
+        if all_pages and self._use_keyset(kwargs, pagination, concurrency):
+            return await self._async_keyset_list(kwargs)
+        response = await self.async_read(**kwargs)
+        if all_pages:
+            self._note_page_size(kwargs, response)
+        self._convert_pagenum(response)
+        if not all_pages or not response['next']:
+            return response
+
+        # The listing may change while it is read, so a page that no longer exists is skipped, and pages
+        # beyond those counted on the first page are read one at a time.
+        number = page_count(response)
+        slots = asyncio.Semaphore(concurrency or settings.pool_maxsize or DEFAULT_POOLSIZE)
+
+        async def read_page(page):
+            async with slots:
+                return await self._async_read_page(kwargs, page)
+        pages = await asyncio.gather(*[read_page(page) for page in range(2, number + 1)])
+        pages = [page for page in pages if page is not None]
+        cursor = pages[-1] if pages else response
+        while cursor['next']:
+            number += 1
+            cursor = await self._async_read_page(kwargs, number)
+            if cursor is None:
+                break
+            pages.append(cursor)
+        for page in pages:
+            response['results'] += page['results']
+        response['next'] = None
+        return response
+
+    async def _async_keyset_list(self, kwargs):
+        """Read all pages of a listing ordered by primary key, as `_keyset_pages` does, and collate them."""
+        order = self._keyset_order(kwargs)
+        kwargs = dict(kwargs)
+        kwargs.pop('order_by', None)
+        queries = [query for query in kwargs.pop('query', ()) if query[0] != 'order_by']
+        queries.append(('order_by', order))
+        response = await self.async_read(query=queries, **kwargs)
+        self._note_page_size(kwargs, response)
+        cursor = response
+        while cursor['results'] and cursor.get('next', None):
+            last_seen = cursor['results'][-1]['id']
+            page_queries = queries + [('id__lt' if order == '-id' else 'id__gt', last_seen)]
+            cursor = await self.async_read(query=page_queries, **kwargs)
+            response['results'] += cursor['results']
+        response['next'] = None
+        response['previous'] = None
+        return response
+
+    async def _async_read_page(self, kwargs, page):
+        try:
+            cursor = await self.async_read(**dict(kwargs, page=page))
+        except exc.NotFound:
+            return None
+        self._convert_pagenum(cursor)
+        return cursor
+
+    async def async_write(self, pk=None, create_on_missing=False, fail_on_found=False, force_on_exists=True,
+                          **kwargs):
+        """
+        =====API DOCS=====
+        Modify the given object, as ``write`` does, with the active ``tower_cli.aio.AsyncClient``.
+
+        Objects are looked up by their unique fields with a request of their own each time, rather than
+        through the name index.
+
+        :returns: A dictionary combining the JSON output of the resource, as well as two extra fields: "changed",
+                  a flag indicating if the resource is created or successfully updated; "id", an integer which
+                  is the primary key of the specified object.
+        :rtype: dict
+
+        =====API DOCS=====
+        """
+        existing_data = {}
+        self._pop_none(kwargs)
+        if not pk:
+            debug.log('Checking for an existing record.', header='details')
+            existing_data = await self._async_lookup(fail_on_found=fail_on_found,
+                                                     fail_on_missing=not create_on_missing, **kwargs)
+            if existing_data:
+                pk = existing_data['id']
+        else:
+            debug.log('Getting existing record.', header='details')
+            existing_data = await self.async_get(pk)
+
+        if not pk:
+            self._check_required(kwargs)
+        answer = self._unchanged_answer(pk, kwargs, existing_data, force_on_exists)
+        if answer is not None:
+            return answer
+
+        debug.log('Writing the record.', header='details')
+        method, url = self._write_request(pk, kwargs)
+        r = await current_client().request(method, url, data=kwargs)
+        return self._written_answer(r.json())
+
+    async def _async_lookup(self, fail_on_missing=False, fail_on_found=False, **kwargs):
+        read_params = self._identity_params(kwargs)
+        if read_params is None:
+            return {}
+        try:
+            existing_data = await self.async_get(include_debug_header=False, **read_params)
+        except exc.NotFound:
+            if fail_on_missing:
+                raise exc.NotFound('A record matching %s does not exist, and you requested a failure in that case.' %
+                                   read_params)
+            return {}
+        if fail_on_found:
+            raise exc.Found('A record matching %s already exists, and you requested a failure in that case.' %
+                            read_params)
+        return existing_data
+
+    async def async_delete(self, pk=None, fail_on_missing=False, **kwargs):
+        """
+        =====API DOCS=====
+        Remove the given object, as ``delete`` does, with the active ``tower_cli.aio.AsyncClient``.
+
+        :returns: dictionary of only one field "changed", which is a flag indicating whether the specified resource
+                  is successfully deleted.
+        :rtype: dict
+
+        =====API DOCS=====
+        """
+        if not pk:
+            existing_data = await self._async_lookup(fail_on_missing=fail_on_missing, **kwargs)
+            if not existing_data:
+                return {'changed': False}
+            pk = existing_data['id']
+
+        url = '%s%s/' % (self.endpoint, pk)
+        debug.log('DELETE %s' % url, fg='blue', bold=True)
+        try:
+            await current_client().delete(url)
+        except exc.NotFound:
+            if fail_on_missing:
+                raise
+            return {'changed': False}
+        self._forget_indexed(pk)
+        return {'changed': True}
+
+
+class AsyncMonitorableMixin(object):
+    """The asyncio versions of the methods of `MonitorableResource`."""
+    async def async_wait(self, pk, min_interval=1, max_interval=30, timeout=None, exit_on=('successful',),
+                         outfile=None):
+        """
+        =====API DOCS=====
+        Wait for a job resource object to enter certain status, as ``wait`` does, with the active
+        ``tower_cli.aio.AsyncClient``.
+
+        :param pk: Primary key of the job resource object to wait.
+        :type pk: int
+        :param min_interval: Minimum polling interval to request an update from Tower.
+        :type min_interval: float
+        :param max_interval: Maximum polling interval to request an update from Tower.
+        :type max_interval: float
+        :param timeout: Number in seconds after which this method will time out.
+        :type timeout: float
+        :param exit_on: Job resource object statuses to wait on.
+        :type exit_on: array
+        :param outfile: A file to write each status that is read to, if any.
+        :type outfile: file
+        :returns: A dictionary combining the JSON output of the status-changed job resource object, as well
+                  as two extra fields: "changed" and "id".
+        :rtype: dict
+        :raises tower_cli.exceptions.Timeout: When wait time reaches time out.
+        :raises tower_cli.exceptions.JobFailure: When the job being waited on runs into failure.
+
+        =====API DOCS=====
+        """
+        job_endpoint = '%s%s/' % (self.unified_job_type, pk)
+        interval = min_interval
+        start = time.time()
+        result = (await current_client().get(job_endpoint)).json()
+        while result['status'] not in exit_on:
+            if result['failed']:
+                raise exc.JobFailure('Job failed.')
+            elapsed = time.time() - start
+            if timeout and elapsed > timeout:
+                raise exc.Timeout('Monitoring aborted due to timeout.')
+
+            # Sleep no later than the timeout, so that the job's completion can be noted before it.
+            await asyncio.sleep(min(interval, timeout - elapsed) if timeout else interval)
+            result = (await current_client().get(job_endpoint)).json()
+            interval = min(interval * 1.5, max_interval)
+            if outfile is not None:
+                click.echo('Current status: %s' % result['status'], file=outfile)
+
+        answer = OrderedDict((('changed', True), ('id', pk)))
+        answer.update(result)
+        answer['id'] = pk
+        return answer
+
+    async def async_monitor(self, pk, timeout=None, interval=0.5, outfile=sys.stdout):
+        """
+        =====API DOCS=====
+        Stream the standard output from a job run, as ``monitor`` does, with the active
+        ``tower_cli.aio.AsyncClient``: one event at a time for jobs that have events, and otherwise by
+        reading the standard out again from the last line written.
+
+        :param pk: Primary key of the job resource object to be monitored.
+        :type pk: int
+        :param timeout: Number in seconds after which this method will time out.
+        :type timeout: float
+        :param interval: Polling interval to refresh content from Tower.
+        :type interval: float
+        :param outfile: Alternative file than stdout to write job stdout to.
+        :type outfile: file
+        :returns: A dictionary combining the JSON output of the finished job resource object, as well as
+                  two extra fields: "changed" and "id".
+        :rtype: dict
+        :raises tower_cli.exceptions.Timeout: When monitor time reaches time out.
+        :raises tower_cli.exceptions.JobFailure: When the job being monitored runs into failure.
+
+        =====API DOCS=====
+        """
+        # The resource models import this module, so their constants are imported once it is loaded.
+        from tower_cli.models.base import EVENT_ENDPOINTS
+
+        await self.async_wait(pk, exit_on=['running', 'successful'], timeout=timeout)
+        click.echo('\033[0;91m------Starting Standard Out Stream------\033[0m', nl=2, file=outfile)
+        if self.unified_job_type in EVENT_ENDPOINTS:
+            result = await self._async_monitor_events(pk, timeout, interval, outfile)
+        else:
+            result = await self._async_monitor_stdout(pk, timeout, interval, outfile)
+        click.echo('\033[0;91m------End of Standard Out Stream--------\033[0m', nl=2, file=outfile)
+
+        if result['failed']:
+            raise exc.JobFailure('Job failed.')
+        answer = OrderedDict((('changed', True), ('id', pk)))
+        answer.update(result)
+        answer['id'] = pk
+        return answer
+
+    async def _async_monitor_stdout(self, pk, timeout, interval, outfile):
+        job_endpoint = '%s%s/' % (self.unified_job_type, pk)
+        start = time.time()
+        start_line = 0
+        result = (await current_client().get(job_endpoint)).json()
+        while not result['failed'] and result['status'] != 'successful':
+            result = (await current_client().get(job_endpoint)).json()
+            await asyncio.sleep(interval)
+
+            # In the first moments of running the job, the standard out may not be available yet.
+            content = await self._async_lookup_stdout(pk, start_line)
+            if not content.startswith('Waiting for results'):
+                start_line += len(content.splitlines())
+                click.echo(content, nl=0, file=outfile)
+
+            if timeout and time.time() - start > timeout:
+                raise exc.Timeout('Monitoring aborted due to timeout.')
+
+        # Special final line for closure with workflow jobs
+        if self.endpoint == '/workflow_jobs/':
+            click.echo(await self._async_lookup_stdout(pk, start_line), nl=1)
+        return result
+
+    async def _async_monitor_events(self, pk, timeout, interval, outfile):
+        """Follow the events of a running job by their counter, as `_monitor_events` does."""
+        from tower_cli.models.base import MAX_MONITOR_INTERVAL
+
+        job_endpoint = '%s%s/' % (self.unified_job_type, pk)
+        start = time.time()
+        cursor = {'counter': 0, 'top': 0, 'seen': set(), 'terminal': False, 'finished': False}
+        poll = interval
+
+        while True:
+            if not cursor['finished']:
+                try:
+                    count, full = await self._async_write_events(pk, cursor, outfile)
+                except exc.NotFound:
+                    if cursor['top']:
+                        raise
+                    debug.log('There are no events for this job; following its standard out.', header='details')
+                    return await self._async_monitor_stdout(pk, timeout, interval, outfile)
+            else:
+                count, full = 0, False
+            if count and not cursor['finished']:
+                poll = interval
+            else:
+                result = (await current_client().get(job_endpoint)).json()
+                if result['failed'] or result['status'] == 'successful':
+                    break
+                poll = min(max(poll * 2, interval), max(MAX_MONITOR_INTERVAL, interval))
+
+            if timeout and time.time() - start > timeout:
+                raise exc.Timeout('Monitoring aborted due to timeout.')
+            if not full:
+                await asyncio.sleep(poll)
+
+        while not cursor['finished'] and (await self._async_write_events(pk, cursor, outfile))[0]:
+            pass
+        return result
+
+    async def _async_write_events(self, pk, cursor, outfile):
+        events_url, requests = self._event_requests(pk, cursor)
+        events = []
+        for params in requests:
+            response = (await current_client().get(events_url, params=params)).json()
+            events += response['results']
+        self._note_page_size(requests[-1], response)
+        return self._take_events(cursor, events, outfile), bool(response.get('next', None))
+
+    async def _async_lookup_stdout(self, pk, start_line=None, end_line=None):
+        url, payload = self._stdout_request(pk, start_line, end_line)
+        resp = (await current_client().get(url, params=payload)).json()
+        return b64decode(resp['content']).decode('utf-8', 'replace')
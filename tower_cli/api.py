@@ -15,10 +15,15 @@
 
 import contextlib
 import copy
+import email.utils
 import functools
+import hashlib
 import json
 import os
+import re
 import stat
+import threading
+import time
 import warnings
 
 try:
@@ -28,19 +33,35 @@ except Exception:
 
 from datetime import datetime as dt
 
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 from requests.exceptions import ConnectionError, SSLError
 from requests.sessions import Session
-from requests.models import Response
+from requests.models import Request, Response
 from requests.packages import urllib3
 from requests.auth import AuthBase, HTTPBasicAuth
 
 from tower_cli import exceptions as exc
 from tower_cli.conf import settings
-from tower_cli.utils import data_structures, debug, secho, supports_oauth
+from tower_cli.utils import cache, data_structures, debug, locking, secho, throttle
+from tower_cli.context import ContextLocal
+from tower_cli.utils.http_cache import HTTPCache
+from tower_cli.utils.identity_map import IdentityMap
 from tower_cli.constants import CUR_API_VERSION
 
 
 TOWER_DATETIME_FMT = r'%Y-%m-%dT%H:%M:%S.%fZ'
+TOKEN_FILENAME = os.path.expanduser('~/.tower_cli_token.json')
+API_VERSION_PATH = re.compile(r'^/?api/v[0-9]+/')
+
+# Requests that are safe to send again, and the responses with which Tower
+# says it is too busy to answer them now.
+IDEMPOTENT_METHODS = frozenset(['DELETE', 'GET', 'HEAD', 'OPTIONS', 'PUT'])
+RETRY_STATUSES = frozenset([429, 502, 503, 504])
+SAFE_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS'])
+
+# How many seconds a name to ID index kept only in memory is trusted
+# before it is started afresh.
+NAME_INDEX_TTL = 60
 
 
 class BasicTowerAuth(AuthBase):
@@ -59,7 +80,26 @@ class BasicTowerAuth(AuthBase):
         ).json()
 
     def _get_auth_token(self):
-        filename = os.path.expanduser('~/.tower_cli_token.json')
+        # Use the token held in memory until it expires.
+        key = (self.cli_client.get_prefix(), self.username)
+        cached = self.cli_client.auth_tokens.get(key, None)
+        if cached and dt.utcnow() < cached['expires']:
+            return cached['header']
+
+        # Otherwise read the token file, or acquire a new token, under a lock,
+        # so that many tower-cli processes starting at once acquire one token
+        # between them rather than one each.
+        with locking.file_lock(TOKEN_FILENAME + '.lock'):
+            token = self._read_or_acquire_token()
+        header = 'Token ' + token['token']
+        self.cli_client.auth_tokens[key] = {
+            'header': header,
+            'expires': dt.strptime(token['expires'], TOWER_DATETIME_FMT),
+        }
+        return header
+
+    def _read_or_acquire_token(self):
+        filename = TOKEN_FILENAME
         token_json = None
         try:
             with open(filename) as f:
@@ -69,7 +109,7 @@ class BasicTowerAuth(AuthBase):
                     'expires' not in token_json[self.cli_client.get_prefix()] or \
                     dt.utcnow() > dt.strptime(token_json[self.cli_client.get_prefix()]['expires'], TOWER_DATETIME_FMT):
                 raise Exception("Current token expires.")
-            return 'Token ' + token_json[self.cli_client.get_prefix()]['token']
+            return token_json[self.cli_client.get_prefix()]
         except Exception as e:
             debug.log('Acquiring and caching auth token due to:\n%s' % str(e), fg='blue', bold=True)
             if not isinstance(token_json, dict):
@@ -90,24 +130,16 @@ class BasicTowerAuth(AuthBase):
                     'Unable to set permissions on {0} - {1} '.format(filename, e),
                     UserWarning
                 )
-            return 'Token ' + token_json[self.cli_client.get_prefix()]['token']
+            return token_json[self.cli_client.get_prefix()]
 
     def __call__(self, r):
         if 'Authorization' in r.headers:
             return r
         if settings.oauth_token:
-            if supports_oauth:
-                r.headers['Authorization'] = 'Bearer {}'.format(settings.oauth_token)
-                return r
-            else:
-                warnings.warn(
-                    'This version of Tower does not support OAuth2.0'
-                )
+            r.headers['Authorization'] = 'Bearer {}'.format(settings.oauth_token)
+            return r
         if self.use_legacy_token:
-            resp = self.cli_client._make_request(
-                'OPTIONS', self.cli_client.get_prefix() + 'authtoken/', [], {}
-            )
-            if resp.ok:
+            if self.cli_client.get_capability('authtoken'):
                 r.headers['Authorization'] = self._get_auth_token()
             else:
                 warnings.warn(
@@ -133,62 +165,321 @@ class Client(Session):
     """
     def __init__(self):
         super(Client, self).__init__()
-        for adapter in self.adapters.values():
-            adapter.max_retries = 3
+
+        # The client serves the thread that created it; every other thread
+        # gets a session of its own, so that threads making requests at the
+        # same time each keep their own warm connections. The generation is
+        # bumped to retire those sessions when the adapters change.
+        self._home_thread = threading.current_thread()
+        self._local = threading.local()
+        self._session_generation = 0
+        self._test_adapter = None
+        self._mount_adapters(self)
+
+        # The largest page size that each Tower host has been seen to
+        # return, keyed by API prefix; read from the disk cache when it
+        # is first needed.
+        self.page_size_limits = None
+
+        # Legacy auth tokens, keyed by API prefix and username, and whether
+        # each Tower host offers them at all, keyed by API prefix.
+        self.auth_tokens = {}
+
+        # What each Tower host has told us about itself, such as its
+        # OPTIONS responses and capabilities: each disk cache, keyed by its
+        # name and then by API prefix, read when it is first needed. The
+        # Tower version seen on the latest response from each host is kept
+        # so that what an older Tower said is thrown away.
+        self.host_caches = {}
+        self.server_versions = {}
+
+        # The URL prefixes worked out from the `host` and `verify_ssl`
+        # settings they were last worked out from, and the auth object made
+        # from the credential settings it was last made from, so that
+        # neither is built again for each request. Threads with different
+        # settings may swap them, so each is read once into a local.
+        self._prefixes = (None, None)
+        self._auth = (None, None)
+
+        # Likewise the rate limiter and the concurrency governor, which are
+        # shared by every thread.
+        self._rate_limiter = (None, None)
+        self._governor = (None, None)
+
+        # Objects read by URL, if the identity map is switched on.
+        self.identity_map = IdentityMap()
+
+        # GET responses, if the HTTP cache is switched on.
+        self.http_cache = HTTPCache()
+
+    def get_page_size_limit(self):
+        """Return the largest page size that the current Tower host is
+        known to return, or None if it has not been seen to cap page sizes.
+        """
+        if self.page_size_limits is None:
+            self.page_size_limits = cache.load('page_sizes')
+        return self.page_size_limits.get(self.get_prefix(), None)
+
+    def set_page_size_limit(self, page_size):
+        """Remember the largest page size that the current Tower host
+        returns, for this and later runs.
+        """
+        if self.page_size_limits is None:
+            self.page_size_limits = cache.load('page_sizes')
+        self.page_size_limits[self.get_prefix()] = page_size
+        cache.save('page_sizes', self.page_size_limits)
+
+    def _note_server_version(self, response):
+        """Remember the version of Tower on the current host, if
+        `response` tells it, so that the per-host caches are kept for it.
+        """
+        if 'X-API-Product-Version' in response.headers:
+            self.server_versions[self.get_prefix()] = response.headers['X-API-Product-Version']
+
+    def _host_cache(self, name, persist=True, ttl=None):
+        """Return the current host's entry in the named disk cache,
+        starting it afresh if it is older than `ttl` seconds (by default,
+        `cache_ttl`) or was written for another version of Tower. If
+        `persist` is False, the cache is kept in memory only.
+        """
+        if name not in self.host_caches:
+            self.host_caches[name] = cache.load(name) if persist else {}
+        prefix = self.get_prefix()
+        entry = self.host_caches[name].get(prefix, None)
+        version = self.server_versions.get(prefix, None)
+        if not cache.is_fresh(entry, ttl or settings.cache_ttl) or (version and entry.get('version', None) != version):
+            entry = cache.stamp({'version': version, 'values': {}})
+            self.host_caches[name][prefix] = entry
+        return entry
+
+    def _read_through(self, name, key, fetch, persist=True):
+        """Return `key` from the named disk cache for the current host,
+        calling `fetch` and remembering the result if it is not there.
+        If `persist` is False, the cache is kept in memory only.
+        """
+        entry = self._host_cache(name, persist=persist)
+        if key not in entry['values']:
+            entry['values'][key] = fetch()
+            entry['version'] = entry['version'] or self.server_versions.get(self.get_prefix(), None)
+            if persist:
+                cache.save(name, self.host_caches[name])
+        return entry['values'][key]
+
+    def get_options(self, url):
+        """Return the JSON body of an OPTIONS request to `url` on the
+        current Tower host, as the current user, reading it from the
+        schema cache if it was fetched within the last `cache_ttl` seconds.
+
+        The schema cache is kept in memory, and on disk as well if the
+        `cache_options` setting is on. Its entries are kept per user,
+        since the fields and actions Tower describes depend on what the
+        user may do.
+        """
+        key = '%s %s' % (self._user_digest(), url)
+        return self._read_through('options', key, lambda: self.options(url).json(),
+                                  persist=settings.cache_options)
+
+    def get_recent(self, name, key, ttl, fetch):
+        """Return `key` from the named in-memory cache for the current
+        host, calling `fetch` and remembering the result if it is not
+        there or was fetched more than `ttl` seconds ago.
+        """
+        values = self._host_cache(name, persist=False)['values']
+        entry = values.get(key, None)
+        if not cache.is_fresh(entry, ttl):
+            entry = values[key] = cache.stamp({'value': fetch()})
+        return entry['value']
+
+    def get_name_index(self, endpoint):
+        """Return the current host's index of the primary keys of the
+        objects at `endpoint`, keyed by their unique fields.
+
+        The index is kept on disk for `cache_ttl` seconds if the
+        `cache_names` setting is on (see `save_name_index`), and otherwise
+        in memory for `NAME_INDEX_TTL` seconds.
+        """
+        if settings.cache_names:
+            entry = self._host_cache('names')
+        else:
+            entry = self._host_cache('names', persist=False, ttl=NAME_INDEX_TTL)
+        return entry['values'].setdefault(endpoint, {})
+
+    def save_name_index(self):
+        """Write the name indexes to disk, if the `cache_names` setting
+        is on.
+        """
+        if settings.cache_names and 'names' in self.host_caches:
+            cache.save('names', self.host_caches['names'])
+
+    def get_capability(self, name):
+        """Return what the current Tower host said when it was asked about
+        the named capability, one of the keys of `CAPABILITY_PROBES`.
+
+        Each capability is probed once per host, and remembered on disk
+        for `cache_ttl` seconds.
+        """
+        return self._read_through('capabilities', name, lambda: CAPABILITY_PROBES[name](self))
+
+    def _mount_adapters(self, session):
+        """Mount transport adapters on the given session, with connection
+        pools sized by the `pool_connections` and `pool_maxsize` settings.
+        """
+        for prefix in ('https://', 'http://'):
+            if self._test_adapter is not None:
+                session.mount(prefix, self._test_adapter)
+                continue
+            session.mount(prefix, HTTPAdapter(
+                pool_connections=settings.pool_connections or DEFAULT_POOLSIZE,
+                pool_maxsize=settings.pool_maxsize or DEFAULT_POOLSIZE,
+                max_retries=3,
+            ))
+
+    @property
+    def thread_session(self):
+        """Return the session that requests from the current thread are
+        made with: the client itself in the thread that created it, and a
+        session belonging to the current thread in any other.
+        """
+        if threading.current_thread() is self._home_thread:
+            return self
+        if getattr(self._local, 'generation', None) != self._session_generation:
+            session = Session()
+            self._mount_adapters(session)
+            self._local.session = session
+            self._local.generation = self._session_generation
+        return self._local.session
+
+    @property
+    def timeout(self):
+        """Return the timeout to make requests with, from the
+        `connect_timeout` and `read_timeout` settings, or None if neither
+        is set.
+        """
+        if settings.connect_timeout is None and settings.read_timeout is None:
+            return None
+        return (settings.connect_timeout, settings.read_timeout)
 
     def _make_request(self, method, url, args, kwargs):
-        # Decide whether to require SSL verification
-        verify_ssl = True
-        if (settings.verify_ssl is False) or (settings.insecure is True):
-            verify_ssl = False
-        elif settings.certificate:
-            verify_ssl = settings.certificate
-
-        # Call the superclass method.
+        verify_ssl = ssl_verification()
+
+        # Only send a timeout if one is configured, leaving requests to
+        # wait indefinitely otherwise.
+        timeout = self.timeout
+        if timeout is not None:
+            kwargs.setdefault('timeout', timeout)
+
+        # Send the request, sending idempotent requests again, after a
+        # growing and jittered delay, if Tower turns them away because it
+        # is overloaded.
+        retries = (settings.retries or 0) if method.upper() in IDEMPOTENT_METHODS else 0
+        attempt = 0
+        while True:
+            r = self._send(method, url, args, kwargs, verify_ssl)
+            if r.status_code not in RETRY_STATUSES or attempt >= retries:
+                return r
+            delay = self._retry_delay(r, attempt)
+            debug.log('Tower answered %s %s with HTTP %d; trying again in %.1f seconds.' %
+                      (method, url, r.status_code, delay), header='details')
+            time.sleep(delay)
+            attempt += 1
+
+    def _retry_delay(self, response, attempt):
+        """Return how many seconds to wait before retrying a request that
+        got `response`, as Tower asked in Retry-After if it did.
+
+        Retry-After may give either a number of seconds or an HTTP date to
+        retry at; either way the wait is capped like backoff's, and a value
+        that is neither falls back to backoff.
+        """
+        retry_after = response.headers.get('Retry-After', '').strip()
+        if retry_after.isdigit():
+            delay = float(retry_after)
+        else:
+            retry_at = email.utils.parsedate_tz(retry_after)
+            if retry_at is None:
+                return throttle.backoff(attempt)
+            delay = max(0.0, email.utils.mktime_tz(retry_at) - time.time())
+        return min(delay, throttle.MAX_RETRY_DELAY)
+
+    @property
+    def rate_limiter(self):
+        """Return the token bucket for the `rate_limit` setting, or None
+        if requests are not rate limited.
+        """
+        rate = settings.rate_limit
+        limiter = self._rate_limiter
+        if limiter[0] != rate:
+            limiter = self._rate_limiter = (rate, throttle.TokenBucket(rate) if rate else None)
+        return limiter[1]
+
+    @property
+    def governor(self):
+        """Return the governor of how many requests may be in flight at
+        once, which allows up to as many as there are pooled connections.
+        """
+        maximum = settings.pool_maxsize or DEFAULT_POOLSIZE
+        governor = self._governor
+        if governor[0] != maximum:
+            governor = self._governor = (maximum, throttle.ConcurrencyGovernor(maximum))
+        return governor[1]
+
+    def _send(self, method, url, args, kwargs, verify_ssl):
+        rate_limiter = self.rate_limiter
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+
         try:
-            with warnings.catch_warnings():
-                warnings.simplefilter(
-                    "ignore", urllib3.exceptions.InsecureRequestWarning)
-                return super(Client, self).request(
-                    method, url, *args, verify=verify_ssl, **kwargs)
+            # Requests made while this thread already holds a slot are the
+            # ones that authenticating the request in it makes, such as
+            # probing for and acquiring an auth token; they go straight
+            # through, since waiting for a slot of their own could wait
+            # for the slot their own thread holds.
+            if getattr(self._local, 'in_slot', False):
+                return self._send_now(method, url, args, kwargs, verify_ssl)
+            governor = self.governor
+            with governor.slot():
+                self._local.in_slot = True
+                try:
+                    started = time.time()
+                    r = self._send_now(method, url, args, kwargs, verify_ssl)
+                finally:
+                    self._local.in_slot = False
+            governor.record(time.time() - started, overloaded=r.status_code in RETRY_STATUSES)
+            return r
         except SSLError as ex:
-            # Throw error if verify_ssl not set to false and server
-            #  is not using verified certificate.
-            if settings.verbose:
-                debug.log('SSL connection failed:', fg='yellow', bold=True)
-                debug.log(str(ex), fg='yellow', bold=True, nl=2)
-            if not settings.host.startswith('http'):
-                secho('Suggestion: add the correct http:// or '
-                      'https:// prefix to the host configuration.',
-                      fg='blue', bold=True)
-            raise exc.ConnectionError(
-                'Could not establish a secure connection. '
-                'Please add the server to your certificate '
-                'authority.\nYou can run this command without verifying SSL '
-                'with the --insecure flag, or permanently disable '
-                'verification by the config setting:\n\n '
-                'tower-cli config verify_ssl false'
-            )
+            raise ssl_failure(ex)
         except ConnectionError as ex:
-            # Throw error if server can not be reached.
-            if settings.verbose:
-                debug.log('Cannot connect to Tower:', fg='yellow', bold=True)
-                debug.log(str(ex), fg='yellow', bold=True, nl=2)
-            raise exc.ConnectionError(
-                'There was a network error of some kind trying to connect '
-                'to Tower.\n\nThe most common  reason for this is a settings '
-                'issue; is your "host" value in `tower-cli config` correct?\n'
-                'Right now it is: "%s".' % settings.host
-            )
+            raise connection_failure(ex)
+
+    def _send_now(self, method, url, args, kwargs, verify_ssl):
+        # Call the superclass method, or the session for this thread.
+        session = self.thread_session
+        with warnings.catch_warnings():
+            warnings.simplefilter(
+                "ignore", urllib3.exceptions.InsecureRequestWarning)
+            if session is self:
+                return super(Client, self).request(
+                    method, url, *args, verify=verify_ssl, **kwargs)
+            return session.request(
+                method, url, *args, verify=verify_ssl, **kwargs)
 
     def get_prefix(self, include_version=True):
         """Return the appropriate URL prefix to prepend to requests,
         based on the host provided in settings.
         """
-        host = settings.host
+        key = (settings.host, settings.verify_ssl)
+        prefixes = self._prefixes
+        if prefixes[0] != key:
+            prefixes = self._prefixes = (key, self._build_prefixes(*key))
+        return prefixes[1][include_version]
+
+    def _build_prefixes(self, host, verify_ssl):
+        """Return the URL prefixes for `host`, without and with the API
+        version.
+        """
         if '://' not in host:
             host = 'https://%s' % host.strip('/')
-        elif host.startswith('http://') and settings.verify_ssl:
+        elif host.startswith('http://') and verify_ssl:
             raise exc.TowerCLIError(
                 'Can not verify ssl with non-https protocol. Change the '
                 'verify_ssl configuration setting to continue.'
@@ -199,11 +490,35 @@ class Client(Session):
             raise exc.ConnectionError('URL must be http(s), {} is not valid'.format(url_pieces[0]))
 
         prefix = urljoin(host, '/api/')
-        if include_version:
-            # We add the / to the end of {} so that our URL has the ending slash.
-            prefix = urljoin(prefix, "{}/".format(CUR_API_VERSION))
+        # We add the / to the end of {} so that our URL has the ending slash.
+        return prefix, urljoin(prefix, "{}/".format(CUR_API_VERSION))
 
-        return prefix
+    def get_auth(self):
+        """Return the auth object to authenticate requests with, made
+        again only when the credential settings change.
+        """
+        key = (settings.username, settings.password, settings.use_token)
+        auth = self._auth
+        if auth[0] != key:
+            auth = self._auth = (key, BasicTowerAuth(settings.username, settings.password, self))
+        return auth[1]
+
+    def _http_cache_key(self, url, params):
+        """Return the key that a GET of `url` is kept under in the HTTP
+        cache, which tells apart the users that read it, and the class of
+        endpoint that it belongs to, such as "config" or "job_templates".
+        """
+        if params:
+            url = Request('GET', url, params=params).prepare().url
+        endpoint_class = url[len(self.get_prefix()):].split('/', 1)[0]
+        return '%s %s' % (self._user_digest(), url), endpoint_class
+
+    def _user_digest(self):
+        """Return a digest of the credentials requests are made with, to
+        tell apart the users that cached responses were read by.
+        """
+        user = settings.oauth_token or '%s:%s' % (settings.username, settings.password)
+        return hashlib.sha256(user.encode('utf8')).hexdigest()[:16]
 
     @functools.wraps(Session.request)
     def request(self, method, url, *args, **kwargs):
@@ -211,26 +526,12 @@ class Client(Session):
         response.
         """
 
-        # If the URL has the api/vX at the front strip it off
-        # This is common to have if you are extracting a URL from an existing object.
-        # For example, any of the 'related' fields of an object will have this
-        import re
-        url = re.sub("^/?api/v[0-9]+/", "", url)
-
-        # Piece together the full URL.
-        use_version = not url.startswith('/o/')
-        url = '%s%s' % (self.get_prefix(use_version), url.lstrip('/'))
+        url = self.full_url(url)
 
         # Ansible Tower expects authenticated requests; add the authentication
         # from settings if it's provided.
-        kwargs.setdefault(
-            'auth',
-            BasicTowerAuth(
-                settings.username,
-                settings.password,
-                self
-            )
-        )
+        if 'auth' not in kwargs:
+            kwargs['auth'] = self.get_auth()
 
         # POST and PUT requests will send JSON by default; make this
         # the content_type by default.  This makes it such that we don't have
@@ -241,63 +542,48 @@ class Client(Session):
             kwargs['headers'] = headers
 
         # If debugging is on, print the URL and data being sent.
-        debug.log('%s %s' % (method, url), fg='blue', bold=True)
-        if method in ('POST', 'PUT', 'PATCH'):
-            debug.log('Data: %s' % kwargs.get('data', {}),
-                      fg='blue', bold=True)
-        if method == 'GET' or kwargs.get('params', None):
-            debug.log('Params: %s' % kwargs.get('params', {}),
-                      fg='blue', bold=True)
-        debug.log('')
+        if settings.verbose:
+            debug.log('%s %s' % (method, url), fg='blue', bold=True)
+            if method in ('POST', 'PUT', 'PATCH'):
+                debug.log('Data: %s' % kwargs.get('data', {}),
+                          fg='blue', bold=True)
+            if method == 'GET' or kwargs.get('params', None):
+                debug.log('Params: %s' % kwargs.get('params', {}),
+                          fg='blue', bold=True)
+            debug.log('')
 
         # If this is a JSON request, encode the data value.
         if headers.get('Content-Type', '') == 'application/json':
             kwargs['data'] = json.dumps(kwargs.get('data', {}))
 
-        r = self._make_request(method, url, args, kwargs)
-
-        # Sanity check: Did the server send back some kind of internal error?
-        # If so, bubble this up.
-        if r.status_code >= 500:
-            raise exc.ServerError('The Tower server sent back a server error. '
-                                  'Please try again later.')
-
-        # Sanity check: Did we fail to authenticate properly?
-        # If so, fail out now; this is always a failure.
-        if r.status_code == 401:
-            raise exc.AuthError('Invalid Tower authentication credentials (HTTP 401).')
-
-        # Sanity check: Did we get a forbidden response, which means that
-        # the user isn't allowed to do this? Report that.
-        if r.status_code == 403:
-            raise exc.Forbidden("You don't have permission to do that (HTTP 403).")
-
-        # Sanity check: Did we get a 404 response?
-        # Requests with primary keys will return a 404 if there is no response,
-        # and we want to consistently trap these.
-        if r.status_code == 404:
-            raise exc.NotFound('The requested object could not be found.')
-
-        # Sanity check: Did we get a 405 response?
-        # A 405 means we used a method that isn't allowed. Usually this
-        # is a bad request, but it requires special treatment because the
-        # API sends it as a logic error in a few situations (e.g. trying to
-        # cancel a job that isn't running).
-        if r.status_code == 405:
-            raise exc.MethodNotAllowed(
-                "The Tower server says you can't make a request with the "
-                "%s method to that URL (%s)." % (method, url),
-            )
+        # If the HTTP cache is on, reuse a response to the same GET that is
+        # fresh enough, or else ask Tower to answer 304 if it has not changed.
+        cache_key = entry = None
+        if settings.http_cache and method.upper() == 'GET' and not kwargs.get('stream', False):
+            cache_key, endpoint_class = self._http_cache_key(url, kwargs.get('params', None))
+            entry, fresh = self.http_cache.lookup(cache_key, endpoint_class)
+            if fresh:
+                if settings.verbose:
+                    debug.log('Using the cached response.', header='details')
+                r = self.http_cache.response(entry)
+                r.__class__ = APIResponse
+                return r
+            if entry is not None:
+                kwargs['headers'] = dict(headers, **self.http_cache.conditional_headers(entry))
 
-        # Sanity check: Did we get some other kind of error?
-        # If so, write an appropriate error message.
-        if r.status_code >= 400:
-            raise exc.BadRequest(
-                'The Tower server claims it was sent a bad request.\n\n'
-                '%s %s\nParams: %s\nData: %s\n\nResponse: %s' %
-                (method, url, kwargs.get('params', None),
-                 kwargs.get('data', None), r.content.decode('utf8'))
-            )
+        r = self._make_request(method, url, args, kwargs)
+        if cache_key is not None:
+            if r.status_code == 304 and entry is not None:
+                self.http_cache.refresh(cache_key)
+                r = self.http_cache.response(entry)
+            elif r.status_code == 200:
+                self.http_cache.store(cache_key, url, r, endpoint_class)
+        if method.upper() not in SAFE_METHODS:
+            self.identity_map.invalidate(url)
+            self.http_cache.invalidate(url)
+        self._note_server_version(r)
+
+        check_response(r, method, url, kwargs.get('params', None), kwargs.get('data', None))
 
         # Django REST Framework intelligently prints API keys in the
         # order that they are defined in the models and serializer.
@@ -314,6 +600,30 @@ class Client(Session):
         # Return the response object.
         return r
 
+    def full_url(self, url):
+        """Return the full URL of `url`, which is given relative to the
+        versioned API prefix of the current Tower host.
+        """
+        # If the URL has the api/vX at the front strip it off
+        # This is common to have if you are extracting a URL from an existing object.
+        # For example, any of the 'related' fields of an object will have this
+        url = API_VERSION_PATH.sub('', url)
+
+        # Piece together the full URL.
+        use_version = not url.startswith('/o/')
+        return '%s%s' % (self.get_prefix(use_version), url.lstrip('/'))
+
+    @contextlib.contextmanager
+    def activate(self):
+        """Make `tower_cli.api.client` stand for this client in the current
+        thread or asyncio task, until the context manager exits.
+        """
+        previous = _current_client.set(self)
+        try:
+            yield self
+        finally:
+            _current_client.set(previous)
+
     @property
     @contextlib.contextmanager
     def test_mode(self):
@@ -335,9 +645,158 @@ class Client(Session):
                 self.adapters.clear()
                 self.mount('https://', faux_adapter)
                 self.mount('http://', faux_adapter)
+                self._test_adapter = faux_adapter
+                self._session_generation += 1
+                cache.enabled = False
+                self.page_size_limits = {}
+                self.auth_tokens.clear()
+                self.host_caches = {}
+                self.server_versions.clear()
+                self.identity_map.reset()
+                self.http_cache.clear()
                 yield faux_adapter
             finally:
                 self.adapters = adapters
+                self._test_adapter = None
+                self._session_generation += 1
+                cache.enabled = True
+                self.page_size_limits = None
+                self.auth_tokens.clear()
+                self.host_caches = {}
+                self.server_versions.clear()
+                self.identity_map.reset()
+                self.http_cache.clear()
+
+
+def ssl_verification():
+    """Return whether to verify the certificate of Tower, or the path to
+    the certificate to verify it with.
+    """
+    # Decide whether to require SSL verification
+    if (settings.verify_ssl is False) or (settings.insecure is True):
+        return False
+    return settings.certificate or True
+
+
+def check_response(r, method, url, params=None, data=None):
+    """Raise the `tower_cli.exceptions` error for the status of the
+    response `r` to the request `method` `url`, if it is an error.
+    """
+    # Sanity check: Did the server send back some kind of internal error?
+    # If so, bubble this up.
+    if r.status_code >= 500:
+        raise exc.ServerError('The Tower server sent back a server error. '
+                              'Please try again later.')
+
+    # Sanity check: Did we fail to authenticate properly?
+    # If so, fail out now; this is always a failure.
+    if r.status_code == 401:
+        raise exc.AuthError('Invalid Tower authentication credentials (HTTP 401).')
+
+    # Sanity check: Did we get a forbidden response, which means that
+    # the user isn't allowed to do this? Report that.
+    if r.status_code == 403:
+        raise exc.Forbidden("You don't have permission to do that (HTTP 403).")
+
+    # Sanity check: Did we get a 404 response?
+    # Requests with primary keys will return a 404 if there is no response,
+    # and we want to consistently trap these.
+    if r.status_code == 404:
+        raise exc.NotFound('The requested object could not be found.')
+
+    # Sanity check: Did we get a 405 response?
+    # A 405 means we used a method that isn't allowed. Usually this
+    # is a bad request, but it requires special treatment because the
+    # API sends it as a logic error in a few situations (e.g. trying to
+    # cancel a job that isn't running).
+    if r.status_code == 405:
+        raise exc.MethodNotAllowed(
+            "The Tower server says you can't make a request with the "
+            "%s method to that URL (%s)." % (method, url),
+        )
+
+    # Sanity check: Did we get some other kind of error?
+    # If so, write an appropriate error message.
+    if r.status_code >= 400:
+        raise exc.BadRequest(
+            'The Tower server claims it was sent a bad request.\n\n'
+            '%s %s\nParams: %s\nData: %s\n\nResponse: %s' %
+            (method, url, params, data, r.content.decode('utf8'))
+        )
+
+
+def ssl_failure(ex):
+    """Return the error to raise when no secure connection to Tower could
+    be made, because of `ex`.
+    """
+    # Throw error if verify_ssl not set to false and server
+    #  is not using verified certificate.
+    if settings.verbose:
+        debug.log('SSL connection failed:', fg='yellow', bold=True)
+        debug.log(str(ex), fg='yellow', bold=True, nl=2)
+    if not settings.host.startswith('http'):
+        secho('Suggestion: add the correct http:// or '
+              'https:// prefix to the host configuration.',
+              fg='blue', bold=True)
+    return exc.ConnectionError(
+        'Could not establish a secure connection. '
+        'Please add the server to your certificate '
+        'authority.\nYou can run this command without verifying SSL '
+        'with the --insecure flag, or permanently disable '
+        'verification by the config setting:\n\n '
+        'tower-cli config verify_ssl false'
+    )
+
+
+def connection_failure(ex):
+    """Return the error to raise when Tower could not be reached, because
+    of `ex`.
+    """
+    # Throw error if server can not be reached.
+    if settings.verbose:
+        debug.log('Cannot connect to Tower:', fg='yellow', bold=True)
+        debug.log(str(ex), fg='yellow', bold=True, nl=2)
+    return exc.ConnectionError(
+        'There was a network error of some kind trying to connect '
+        'to Tower.\n\nThe most common  reason for this is a settings '
+        'issue; is your "host" value in `tower-cli config` correct?\n'
+        'Right now it is: "%s".' % settings.host
+    )
+
+
+def _probe_authtoken(client):
+    # This is asked while authenticating other requests, so it must not
+    # authenticate itself. It is often the first request made, so the
+    # version of Tower it tells is noted before the capability is cached.
+    r = client._make_request('OPTIONS', client.get_prefix() + 'authtoken/', [], {})
+    client._note_server_version(r)
+    return r.ok
+
+
+def _probe_oauth2(client):
+    try:
+        return client.head('/o/').ok
+    except exc.NotFound:
+        return False
+
+
+def _probe_bulk(client):
+    # Only newer AWX servers have bulk endpoints, such as host_create and
+    # job_launch; older ones answer 404.
+    try:
+        return sorted(client.get('/bulk/').json().keys())
+    except exc.NotFound:
+        return []
+
+
+# How to find out whether the current Tower host has each capability.
+CAPABILITY_PROBES = {
+    'ad_hoc_commands': lambda client: 'ad_hoc_commands' in client.get('/').json(),
+    'authtoken': _probe_authtoken,
+    'bulk': _probe_bulk,
+    'oauth2': _probe_oauth2,
+    'version': lambda client: client.get('/config/').json()['version'],
+}
 
 
 class APIResponse(Response):
@@ -353,4 +812,29 @@ class APIResponse(Response):
             return super(APIResponse, self).json(**kwargs)
 
 
-client = Client()
+class _ContextClient(object):
+    """Stand-in for the client of the current context: the client of the
+    `tower_cli.session.Session` being used, if any, and the process-wide
+    client otherwise. Attributes are read from and written to that client.
+    """
+    def __init__(self, default):
+        object.__setattr__(self, '_default', default)
+
+    def _get_current_object(self):
+        return _current_client.get() or self._default
+
+    def __getattr__(self, name):
+        return getattr(self._get_current_object(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._get_current_object(), name, value)
+
+    def __delattr__(self, name):
+        delattr(self._get_current_object(), name)
+
+    def __repr__(self):
+        return repr(self._get_current_object())
+
+
+_current_client = ContextLocal('client')
+client = _ContextClient(Client())
@@ -24,14 +24,15 @@ import six
 from requests.auth import HTTPBasicAuth
 from requests.exceptions import RequestException
 
+import tower_cli
 from tower_cli import __version__, exceptions as exc
 from tower_cli.api import client
 from tower_cli.conf import with_global_options, Parser, settings, _apply_runtime_setting
-from tower_cli.utils import secho, supports_oauth
+from tower_cli.utils import cache as disk_cache, secho, supports_oauth
 from tower_cli.constants import CUR_API_VERSION
 from tower_cli.cli.transfer.common import SEND_ORDER
 
-__all__ = ['version', 'config', 'login', 'logout', 'receive', 'send', 'empty']
+__all__ = ['version', 'config', 'login', 'logout', 'receive', 'send', 'empty', 'cache']
 
 
 @click.command()
@@ -311,9 +312,11 @@ def logout():
 @click.option('--job_template', required=False, multiple=True)
 @click.option('--workflow', required=False, multiple=True)
 @click.option('--all', is_flag=True)
+@click.option('--concurrency', type=click.IntRange(1), required=False,
+              help='Read the pages of each listing using this many concurrent requests.')
 def receive(organization=None, user=None, team=None, credential_type=None, credential=None,
             notification_template=None, inventory_script=None, inventory=None, project=None, job_template=None,
-            workflow=None, all=None):
+            workflow=None, all=None, concurrency=None):
     """Export assets from Tower.
 
     'tower receive' exports one or more assets from a Tower instance
@@ -325,7 +328,7 @@ def receive(organization=None, user=None, team=None, credential_type=None, crede
     """
 
     from tower_cli.cli.transfer.receive import Receiver
-    receiver = Receiver()
+    receiver = Receiver(concurrency)
     assets_to_export = {}
     for asset_type in SEND_ORDER:
         assets_to_export[asset_type] = locals()[asset_type]
@@ -403,3 +406,39 @@ def empty(organization=None, user=None, team=None, credential_type=None, credent
     for asset_type in SEND_ORDER:
         assets_to_export[asset_type] = locals()[asset_type]
     destroyer.go_ham(all=all, asset_input=assets_to_export)
+
+
+@click.group()
+def cache():
+    """Manage what tower-cli remembers about Tower servers."""
+
+
+@cache.command()
+def clear():
+    """Remove the cached API schemas, server details and name indexes.
+
+    tower-cli fetches them again from Tower when they are next needed.
+    """
+    names = disk_cache.clear()
+    if names:
+        secho('Removed cached %s from %s.' % (', '.join(names), disk_cache.CACHE_DIR), fg='green')
+    else:
+        secho('There is nothing cached in %s.' % disk_cache.CACHE_DIR, fg='green')
+
+
+@cache.command()
+@with_global_options
+@click.argument('resource')
+def warm(resource):
+    """Fill the name index of a resource from one listing of all of its objects.
+
+    The index is kept between runs only if the `cache_names` setting is on.
+    """
+    try:
+        res = tower_cli.get_resource(resource)
+    except ImportError:
+        raise exc.UsageError('There is no %s resource.' % resource)
+    count = res.warm_index()
+    secho('Indexed %d %s objects.' % (count, resource), fg='green')
+    if not settings.cache_names:
+        secho('The index is not kept between runs; turn the cache_names setting on to keep it.', fg='yellow')
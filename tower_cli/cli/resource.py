@@ -104,6 +104,14 @@ class ResSubcommand(click.MultiCommand):
             if getattr(method, 'deprecated', False):
                 debug.log('This method is deprecated in Tower 3.0.', header='warning')
 
+            # If this method can stream its records and JSON lines were asked for, write each record as soon
+            # as it arrives rather than building the whole result first.
+            stream_method = getattr(method, 'stream_method', None)
+            if stream_method and settings.format == 'jsonl':
+                for record in getattr(self.resource, stream_method)(*args, **kwargs):
+                    secho(json.dumps(record))
+                return
+
             result = method(*args, **kwargs)
 
             # If this was a request that could result in a modification
@@ -129,6 +137,14 @@ class ResSubcommand(click.MultiCommand):
         """
         return json.dumps(payload, indent=2)
 
+    def _format_jsonl(self, payload):
+        """Convert the payload into JSON lines, one line for each
+        record in the results (or for the payload itself), and return it.
+        """
+        if 'results' in payload:
+            return '\n'.join([json.dumps(record) for record in payload['results']])
+        return json.dumps(payload)
+
     def _format_yaml(self, payload):
         """Convert the payload into a YAML string with proper
         indentation and return it.
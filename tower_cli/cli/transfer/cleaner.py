@@ -38,11 +38,17 @@ class Cleaner(LoggingCommand):
                     continue
                 assets_to_remove = assets_to_remove + resources['results']
             else:
-                for name in assets_from_input[asset_type]['names']:
-                    try:
-                        resource = tower_cli.get_resource(asset_type).get(**{identifier: name})
-                        assets_to_remove.append(resource)
-                    except TowerCLIError:
+                names = assets_from_input[asset_type]['names']
+                try:
+                    resources = tower_cli.get_resource(asset_type).get_many(
+                        names, field=identifier, fail_on_missing=False, fail_on_multiple=False
+                    )
+                except TowerCLIError:
+                    resources = {}
+                for name in names:
+                    if name in resources:
+                        assets_to_remove.append(resources[name])
+                    else:
                         self.print_header_row(asset_type, name)
                         self.log_ok("Asset does not exist")
 
@@ -1,8 +1,10 @@
 import copy
 
+from six.moves.urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
 import tower_cli
 from tower_cli.api import client
-from tower_cli.utils import debug
+from tower_cli.utils import concurrency as concurrency_utils, debug
 from tower_cli.exceptions import TowerCLIError
 from tower_cli.resources.role import ACTOR_FIELDS
 
@@ -57,8 +59,7 @@ NOTIFICATION_TYPES = ['notification_templates_error', 'notification_templates_su
 def get_api_options(asset_type):
     if asset_type not in API_POST_OPTIONS:
         endpoint = tower_cli.get_resource(asset_type).endpoint
-        response = client.options(endpoint)
-        return_json = response.json()
+        return_json = client.get_options(endpoint)
         if "actions" not in return_json or "POST" not in return_json["actions"]:
             # Maybe we want to do a debug.log here
             debug.log("WARNING: Asset type {} has no API POST options no pre-checks can be performed".format(
@@ -224,13 +225,15 @@ def extract_workflow_nodes(asset):
     return workflow_nodes_extracted
 
 
-def extract_inventory_relations(asset, relation_type):
+def extract_inventory_relations(asset, relation_type, concurrency=None):
     # Get the API options for the relation
     post_options = get_api_options(relation_type)
 
     # Get all of the hosts
     try:
-        relations = tower_cli.get_resource(relation_type).list(all_pages=True, **{'inventory': asset['id']})
+        relations = tower_cli.get_resource(relation_type).list(
+            all_pages=True, concurrency=concurrency, **{'inventory': asset['id']}
+        )
     except TowerCLIError as e:
         raise TowerCLIError("Unable to get {} for {} : {}".format(relation_type, asset['id'], e))
 
@@ -286,7 +289,7 @@ def extract_inventory_relations(asset, relation_type):
     return {'items': return_relations, 'existing_name_to_id_map': name_to_id_map}
 
 
-def extract_inventory_groups(asset):
+def extract_inventory_groups(asset, concurrency=None):
     return_asset = []
     name_to_id_map = {}
 
@@ -294,7 +297,7 @@ def extract_inventory_groups(asset):
         debug.log("Asset {} does not have root_groups to process".format(asset['name']))
         return return_asset
 
-    root_groups_response = load_all_assets(asset['related']['root_groups'])
+    root_groups_response = load_all_assets(asset['related']['root_groups'], concurrency)
     for root_group in root_groups_response['results']:
         # If this groups is controlled by a source, we can skip it
         if 'has_inventory_sources' in root_group and root_group['has_inventory_sources']:
@@ -303,14 +306,14 @@ def extract_inventory_groups(asset):
             'id': root_group['id'],
             'sub_groups': {}
         }
-        process_inv_group_data = process_inventory_groups(root_group)
+        process_inv_group_data = process_inventory_groups(root_group, concurrency)
         return_asset.append(process_inv_group_data['items'])
         name_to_id_map[root_group['name']]['sub_groups'] = process_inv_group_data['name_to_id_map']
 
     return {'items': return_asset, 'existing_name_to_id_map': name_to_id_map}
 
 
-def process_inventory_groups(group_json):
+def process_inventory_groups(group_json, concurrency=None):
     group_post_options = get_api_options('group')
     group_to_return = {}
     map_node_to_post_options(group_post_options, group_json, group_to_return)
@@ -320,14 +323,14 @@ def process_inventory_groups(group_json):
     if 'related' in group_json and 'children' in group_json['related']:
         group_to_return['sub_groups'] = []
 
-        children = load_all_assets(group_json['related']['children'])
+        children = load_all_assets(group_json['related']['children'], concurrency)
         for child in children['results']:
             if 'type' not in child:
                 debug.log("Found a child without a type in group {} : {}".format(group_json['name'], child))
                 continue
 
             if child['type'] == 'group':
-                process_inv_data = process_inventory_groups(child)
+                process_inv_data = process_inventory_groups(child, concurrency)
                 group_to_return['sub_groups'].append(process_inv_data['items'])
                 name_to_id_map[child['name']] = {
                     'id': child['id'],
@@ -342,7 +345,7 @@ def process_inventory_groups(group_json):
     if 'related' in group_json and 'hosts' in group_json['related']:
         group_to_return['hosts'] = []
 
-        hosts = load_all_assets(group_json['related']['hosts'])
+        hosts = load_all_assets(group_json['related']['hosts'], concurrency)
 
         for host in hosts['results']:
             if 'name' not in host:
@@ -356,13 +359,31 @@ def process_inventory_groups(group_json):
     return {'items': group_to_return, 'name_to_id_map': name_to_id_map}
 
 
-def load_all_assets(url_to_load):
+def page_url(url, page):
+    url_parts = urlparse(url)
+    query = [(key, value) for key, value in parse_qsl(url_parts.query) if key != 'page']
+    query.append(('page', page))
+    return urlunparse(url_parts._replace(query=urlencode(query)))
+
+
+def load_all_assets(url_to_load, concurrency=None):
     keep_loading = True
     results = {
         'count': 0,
         'results': []
     }
 
+    # If we may read several pages at once, read the first page to learn how many there are, then the rest
+    if concurrency and concurrency > 1:
+        response = client.request('GET', url_to_load).json()
+        pages = [response] + concurrency_utils.fetch_pages(
+            response, lambda page: client.request('GET', page_url(url_to_load, page)).json(), concurrency
+        )
+        results['count'] = response['count']
+        for response in pages:
+            results['results'] += response['results']
+        keep_loading = False
+
     while keep_loading:
         # Assume we are done
         keep_loading = False
@@ -371,8 +392,8 @@ def load_all_assets(url_to_load):
         response_object = client.request('GET', url_to_load)
         response = response_object.json()
 
-        # Update the count and results
-        results['count'] += response['count']
+        # Update the results; every page carries the count of the whole listing
+        results['count'] = response['count']
         results['results'] += response['results']
 
         # Check if we have a next
@@ -383,10 +404,10 @@ def load_all_assets(url_to_load):
     return results
 
 
-def extract_notifications(asset, notification_type):
+def extract_notifications(asset, notification_type, concurrency=None):
     notifications = []
     if 'related' in asset and notification_type in asset['related']:
-        response = load_all_assets(asset['related'][notification_type])
+        response = load_all_assets(asset['related'][notification_type], concurrency)
         if 'results' in response:
             for notification in response['results']:
                 notifications.append(notification['name'])
@@ -422,11 +443,11 @@ def get_assets_from_input(all=False, asset_input=None):
     return return_assets
 
 
-def extract_credentials(asset):
+def extract_credentials(asset, concurrency=None):
     return_credentials = []
     name_to_id_map = {}
 
-    credentials = load_all_assets(asset['related']['credentials'])
+    credentials = load_all_assets(asset['related']['credentials'], concurrency)
     for a_credential in credentials['results']:
         name_to_id_map[a_credential['name']] = a_credential['id']
         return_credentials.append(a_credential['name'])
@@ -434,7 +455,7 @@ def extract_credentials(asset):
     return {'items': return_credentials, 'existing_name_to_id_map': name_to_id_map}
 
 
-def extract_labels(asset):
+def extract_labels(asset, concurrency=None):
     return_labels = []
     name_to_object_map = {}
 
@@ -442,7 +463,7 @@ def extract_labels(asset):
     # The first tier will be the org and the second the name
 
     label_options = get_api_options('label')
-    labels = load_all_assets(asset['related']['labels'])
+    labels = load_all_assets(asset['related']['labels'], concurrency)
     for a_label in labels['results']:
         # First take a copy of this label (this will have the org as an integer)
         pristine_label = copy.deepcopy(a_label)
@@ -463,12 +484,12 @@ def extract_labels(asset):
     return {'items': return_labels, 'existing_name_to_object_map': name_to_object_map}
 
 
-def extract_schedules(asset):
+def extract_schedules(asset, concurrency=None):
     return_schedules = []
     name_to_object_map = {}
 
     schedule_options = get_api_options('schedules')
-    schedules = load_all_assets(asset['related']['schedules'])
+    schedules = load_all_assets(asset['related']['schedules'], concurrency)
     for a_schedule in schedules['results']:
         name_to_object_map[a_schedule['name']] = a_schedule
         reduced_schedule = {}
@@ -479,7 +500,7 @@ def extract_schedules(asset):
     return {'items': return_schedules, 'existing_name_to_object_map': name_to_object_map}
 
 
-def extract_roles(existing_asset):
+def extract_roles(existing_asset, concurrency=None):
     return_roles = []
     name_to_object_map = {'role': {}}
 
@@ -487,7 +508,7 @@ def extract_roles(existing_asset):
     if 'related' not in existing_asset or 'object_roles' not in existing_asset['related']:
         return [], {}
 
-    roles = load_all_assets(existing_asset['related']['object_roles'])
+    roles = load_all_assets(existing_asset['related']['object_roles'], concurrency)
 
     if 'results' not in roles:
         return [], {}
@@ -504,7 +525,7 @@ def extract_roles(existing_asset):
             name_to_object_map[actor] = {}
 
             if plural_actor in role['related']:
-                role_items = load_all_assets(role['related'][plural_actor])
+                role_items = load_all_assets(role['related'][plural_actor], concurrency)
                 if 'results' not in role_items:
                     continue
 
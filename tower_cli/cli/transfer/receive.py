@@ -8,6 +8,9 @@ import click
 
 
 class Receiver:
+    def __init__(self, concurrency=None):
+        self.concurrency = concurrency
+
     def receive(self, all=False, asset_input=None):
         exported_objects = self.export_assets(all, asset_input)
 
@@ -39,17 +42,17 @@ class Receiver:
 
             # Now we are either going to get everything or just one item and append that to the assets_to_export
             if assets_to_export[asset_type]['all']:
-                resources = tower_cli.get_resource(asset_type).list(all_pages=True)
+                resources = tower_cli.get_resource(asset_type).list(all_pages=True, concurrency=self.concurrency)
                 if 'results' not in resources:
                     continue
                 acquired_assets_to_export = acquired_assets_to_export + resources['results']
             else:
-                for name in assets_to_export[asset_type]['names']:
-                    try:
-                        resource = tower_cli.get_resource(asset_type).get(**{identifier: name})
-                    except TowerCLIError as e:
-                        raise TowerCLIError("Unable to get {} named {} : {}".format(asset_type, name, e))
-                    acquired_assets_to_export.append(resource)
+                names = assets_to_export[asset_type]['names']
+                try:
+                    resources = tower_cli.get_resource(asset_type).get_many(names, field=identifier)
+                except TowerCLIError as e:
+                    raise TowerCLIError("Unable to get {} named {} : {}".format(asset_type, ', '.join(names), e))
+                acquired_assets_to_export.extend(resources.values())
 
             # Next we are going to loop over the objects we got from Tower
             for asset in acquired_assets_to_export:
@@ -86,34 +89,35 @@ class Receiver:
 
                     elif relation == 'host' or relation == 'inventory_source':
                         exported_asset[common.ASSET_RELATION_KEY][relation] = \
-                            common.extract_inventory_relations(asset, relation)['items']
+                            common.extract_inventory_relations(asset, relation, self.concurrency)['items']
 
                     elif relation == 'group':
                         exported_asset[common.ASSET_RELATION_KEY][relation] = \
-                            common.extract_inventory_groups(asset)['items']
+                            common.extract_inventory_groups(asset, self.concurrency)['items']
 
                     elif relation == 'notification_templates':
                         for notification_type in common.NOTIFICATION_TYPES:
                             exported_asset[common.ASSET_RELATION_KEY][notification_type] = \
-                                common.extract_notifications(asset, notification_type)
+                                common.extract_notifications(asset, notification_type, self.concurrency)
 
                     elif relation == 'credentials':
                         exported_asset[common.ASSET_RELATION_KEY][relation] =\
-                            common.extract_credentials(asset)['items']
+                            common.extract_credentials(asset, self.concurrency)['items']
 
                     elif relation == 'schedules':
                         exported_asset[common.ASSET_RELATION_KEY][relation] =\
-                            common.extract_schedules(asset)['items']
+                            common.extract_schedules(asset, self.concurrency)['items']
 
                     elif relation == 'labels':
                         exported_asset[common.ASSET_RELATION_KEY][relation] =\
-                            common.extract_labels(asset)['items']
+                            common.extract_labels(asset, self.concurrency)['items']
 
                 # If this asset type is in the RESOURCE_FIELDS of the Role object than export its roles
                 if asset_type in RESOURCE_FIELDS:
                     if common.ASSET_RELATION_KEY not in exported_asset:
                         exported_asset[common.ASSET_RELATION_KEY] = {}
-                    exported_asset[common.ASSET_RELATION_KEY]['roles'] = common.extract_roles(asset)['items']
+                    exported_asset[common.ASSET_RELATION_KEY]['roles'] = \
+                        common.extract_roles(asset, self.concurrency)['items']
 
                 # Finally add the object to the list of objects that are being exported
                 exported_objects.append(exported_asset)
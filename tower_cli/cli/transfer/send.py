@@ -495,7 +495,7 @@ class Sender(LoggingCommand):
                             continue
 
                         try:
-                            tower_cli.get_resource('notification_template').get(**{'name': notification_name})
+                            tower_cli.get_resource('notification_template').resolve(**{'name': notification_name})
                         except TowerCLIError:
                             self.log_error("Unable to resolve {} {}".format(relation, notification_name))
                             post_check_succeeded = False
@@ -510,7 +510,7 @@ class Sender(LoggingCommand):
                         if 'credential' in self.sorted_assets and credential in self.sorted_assets['credential']:
                             continue
                         try:
-                            tower_cli.get_resource('credential').get(**{'name': credential})
+                            tower_cli.get_resource('credential').resolve(**{'name': credential})
                         except TowerCLIError:
                             self.log_error("Unable to resolve credential {}".format(credential))
                             post_check_succeeded = False
@@ -531,20 +531,20 @@ class Sender(LoggingCommand):
                         # or is specified as something to import
                         for actor in ACTOR_FIELDS:
                             if actor in role:
-                                for item in role[actor]:
-                                    if actor in self.sorted_assets and item in self.sorted_assets[actor]:
-                                        continue
-                                    try:
-                                        identity_field = common.get_identity(actor)
-                                        existing_item = tower_cli.get_resource(actor).list(**{identity_field: item})
-                                        if existing_item['count'] != 1:
-                                            raise TowerCLIError("Unable to find user")
-                                        continue
-                                    except TowerCLIError:
-                                        pass
-
-                                    self.log_error("Unable to resolve {} name {} to add roles".format(actor, item))
-                                    post_check_succeeded = False
+                                items = [
+                                    item for item in role[actor]
+                                    if actor not in self.sorted_assets or item not in self.sorted_assets[actor]
+                                ]
+                                try:
+                                    existing_items = tower_cli.get_resource(actor).resolve_many(
+                                        items, fail_on_missing=False, fail_on_multiple=False
+                                    )
+                                except TowerCLIError:
+                                    existing_items = {}
+                                for item in items:
+                                    if item not in existing_items:
+                                        self.log_error("Unable to resolve {} name {} to add roles".format(actor, item))
+                                        post_check_succeeded = False
 
                 elif relation == 'labels':
                     for label in an_asset[common.ASSET_RELATION_KEY][relation]:
@@ -558,7 +558,7 @@ class Sender(LoggingCommand):
 
                         # Now lets make sure that the org resolves
                         try:
-                            tower_cli.get_resource('organization').get(**{'name': label['organization']})
+                            tower_cli.get_resource('organization').resolve(**{'name': label['organization']})
                         except TowerCLIError:
                             self.log_error("Unable to resolve organization {} for label {}".format(
                                 label['organization'], label['name']))
@@ -711,8 +711,9 @@ class Sender(LoggingCommand):
 
             identifier = common.get_identity(dependency_type)
             try:
-                dependency_object = tower_cli.get_resource(dependency_type).get(**{identifier: an_asset[a_dependency]})
-                an_asset[a_dependency] = dependency_object["id"]
+                an_asset[a_dependency] = tower_cli.get_resource(dependency_type).resolve(
+                    **{identifier: an_asset[a_dependency]}
+                )
             except TowerCLIError:
                 self.log_error("Failed to resolve {} {} for {} {}".format(
                     a_dependency, an_asset[a_dependency], asset_type, an_asset[identifier])
@@ -964,13 +965,13 @@ class Sender(LoggingCommand):
         # Creds to add is the difference between existing_creds and extra_creds
         for cred in list(set(new_creds).difference(existing_creds)):
             try:
-                new_credential = tower_cli.get_resource('credential').get(**{'name': cred})
+                new_credential_id = tower_cli.get_resource('credential').resolve(**{'name': cred})
             except TowerCLIError as e:
                 self.log_error("Unable to resolve credential {} : {}".format(cred, e))
                 continue
 
             try:
-                tower_cli.get_resource('job_template').associate_credential(existing_object['id'], new_credential['id'])
+                tower_cli.get_resource('job_template').associate_credential(existing_object['id'], new_credential_id)
                 self.log_change("Added credential {}".format(cred))
             except TowerCLIError as e:
                 self.log_error("Unable to add credential {} : ".format(cred, e))
@@ -1010,8 +1011,7 @@ class Sender(LoggingCommand):
             # This is check in post checks so this should never fail.
             # Unless someone was able to delete an org between the post check and now.
             try:
-                org = tower_cli.get_resource('organization').get(**{'name': label_org_name})
-                label_org_id = org['id']
+                label_org_id = tower_cli.get_resource('organization').resolve(**{'name': label_org_name})
             except TowerCLIError as e:
                 self.log_error("Failed to lookup organization {} for label {} : {}".format(
                     label_org_name, label_name, e
@@ -1114,15 +1114,24 @@ class Sender(LoggingCommand):
                     self.log_error('Failed to find existing role by ID : {}'.format(e))
                     continue
 
+                # Get the users or teams to add and remove
+                items_to_remove = list(set(existing_items).difference(new_items))
+                items_to_add = list(set(new_items).difference(existing_items))
+                try:
+                    actor_ids = tower_cli.get_resource(actor).resolve_many(
+                        items_to_remove + items_to_add, fail_on_missing=False, fail_on_multiple=False
+                    )
+                except TowerCLIError as e:
+                    for item in items_to_remove + items_to_add:
+                        self.log_error("Failed to get {} {} : {}".format(actor, item, e))
+                    continue
+
                 # Items to remove is the difference between new_items and existing_items
-                for item_to_remove in list(set(existing_items).difference(new_items)):
-                    # Get the user or team
-                    try:
-                        existing_item = tower_cli.get_resource(actor).get(**{
-                            common.get_identity(actor): item_to_remove
-                        })
-                    except TowerCLIError as e:
-                        self.log_error("Failed to get {} {} : {}".format(actor, item_to_remove, e))
+                for item_to_remove in items_to_remove:
+                    if item_to_remove not in actor_ids:
+                        self.log_error("Failed to get {} {} : it does not exist or is not unique".format(
+                            actor, item_to_remove
+                        ))
                         continue
 
                     # Revoke the permissions
@@ -1131,7 +1140,7 @@ class Sender(LoggingCommand):
 
                         tower_cli.get_resource('role').revoke(**{
                             'type': role_type,
-                            actor: existing_item['id'],
+                            actor: actor_ids[item_to_remove],
                             asset_type: existing_asset['id'],
                         })
                         self.log_change("Removed {} {} from {} role".format(actor, item_to_remove, role['name']))
@@ -1141,14 +1150,11 @@ class Sender(LoggingCommand):
                         )
 
                 # Items that need to be added is the difference between existing_items and new_items
-                for item_to_add in list(set(new_items).difference(existing_items)):
-                    # Get the user or team
-                    try:
-                        existing_item = tower_cli.get_resource(actor).get(**{
-                            common.get_identity(actor): item_to_add
-                        })
-                    except TowerCLIError as e:
-                        self.log_error("Failed to get {} {} : {}".format(actor, item_to_add, e))
+                for item_to_add in items_to_add:
+                    if item_to_add not in actor_ids:
+                        self.log_error("Failed to get {} {} : it does not exist or is not unique".format(
+                            actor, item_to_add
+                        ))
                         continue
 
                     # Grant the permissions
@@ -1157,7 +1163,7 @@ class Sender(LoggingCommand):
 
                         tower_cli.get_resource('role').grant(**{
                             'type': role_type,
-                            actor: existing_item['id'],
+                            actor: actor_ids[item_to_add],
                             asset_type: existing_asset['id'],
                         })
                         self.log_change("Added {} {} to {} role".format(actor, item_to_add, role['name']))
@@ -1446,8 +1452,9 @@ class Sender(LoggingCommand):
             resolve_errors = []
             if 'source_project' in item:
                 try:
-                    project = tower_cli.get_resource('project').get(**{'name': item['source_project']})
-                    item['source_project'] = project['id']
+                    item['source_project'] = tower_cli.get_resource('project').resolve(
+                        **{'name': item['source_project']}
+                    )
                 except TowerCLIError as e:
                     resolve_errors.append(
                         "Unable to resolve project {} as source project for inventory source {} : {}".format(
@@ -1457,8 +1464,9 @@ class Sender(LoggingCommand):
 
             if 'source_script' in item:
                 try:
-                    script = tower_cli.get_resource('inventory_script').get(**{'name': item['source_script']})
-                    item['source_script'] = script['id']
+                    item['source_script'] = tower_cli.get_resource('inventory_script').resolve(
+                        **{'name': item['source_script']}
+                    )
                 except TowerCLIError as e:
                     resolve_errors.append(
                         "Unable to resolve script {} as source script for inventory source {} : {}".format(
@@ -1468,8 +1476,9 @@ class Sender(LoggingCommand):
 
             if 'credential' in item:
                 try:
-                    credential = tower_cli.get_resource('credential').get(**{'name': item['credential']})
-                    item['credential'] = credential['id']
+                    item['credential'] = tower_cli.get_resource('credential').resolve(
+                        **{'name': item['credential']}
+                    )
                 except TowerCLIError as e:
                     resolve_errors.append(
                         "Unable to resolve credential {} as credential for inventory source {} : {}".format(
@@ -154,7 +154,7 @@ class Related(click.types.ParamType):
             debug.log('The %s field is given as a name; '
                       'looking it up.' % param.name, header='details')
             lookup_data = {resource.identity[-1]: value}
-            rel = resource.get(**lookup_data)
+            return resource.resolve(**lookup_data)
         except exc.MultipleResults:
             raise exc.MultipleRelatedError(
                 'Cannot look up {0} exclusively by name, because multiple {0} '
@@ -168,8 +168,5 @@ class Related(click.types.ParamType):
             raise exc.RelatedError('Could not get %s. %s' %
                                    (self.resource_name, str(ex)))
 
-        # Done! Return the ID.
-        return rel['id']
-
     def get_metavar(self, param):
         return self.resource_name.upper()
@@ -29,6 +29,8 @@ import six
 from six.moves import configparser
 from six import StringIO
 
+from tower_cli.context import ContextLocal
+
 
 __all__ = ['settings', 'with_global_options', 'pop_option']
 
@@ -37,14 +39,28 @@ tower_dir = '/etc/tower/'
 user_dir = os.path.expanduser('~')
 CONFIG_FILENAME = '.tower_cli.cfg'
 CONFIG_PARAM_TYPE = {
+    'cache_names': click.BOOL,
+    'cache_options': click.BOOL,
+    'cache_ttl': click.INT,
     'certificate': click.STRING,
     'color': click.BOOL,
+    'connect_timeout': click.FLOAT,
     'description_on': click.BOOL,
     'format': click.Choice,
     'host': click.STRING,
+    'http_cache': click.BOOL,
+    'http_cache_disk': click.BOOL,
+    'http_cache_fresh': click.STRING,
+    'identity_map': click.BOOL,
     'insecure': click.BOOL,
+    'max_page_size': click.INT,
     'oauth_token': click.STRING,
     'password': click.STRING,
+    'pool_connections': click.INT,
+    'pool_maxsize': click.INT,
+    'rate_limit': click.FLOAT,
+    'read_timeout': click.FLOAT,
+    'retries': click.INT,
     'use_token': click.BOOL,
     'username': click.STRING,
     'verbose': click.BOOL,
@@ -103,6 +119,10 @@ class Settings(object):
         - environment: Values from magic environment variables.
         - runtime: keyworded arguments provided by ``settings.runtime_values`` context manager.
 
+    Runtime values given with ``settings.runtime_values`` are local to the thread or asyncio task that gives
+    them, so that threads and tasks can talk to different Tower hosts, or as different users, at the same time.
+    The runtime values of the command line options are shared by the whole process.
+
     Note that .ini configuration file should follow the specified format in order to be correctly parsed:
 
     .. code-block:: bash
@@ -128,7 +148,11 @@ class Settings(object):
         """Create the settings object, and read from appropriate files as
         well as from `sys.argv`.
         """
-        self._cache = {}
+        # The runtime parser and cache of `runtime_values` in the current
+        # context, if there are any; otherwise the ones of the process
+        # are used.
+        self._context = ContextLocal('settings')
+        self._process_cache = {}
 
         # Initialize the data dictionary for the default level
         # precedence (that is, the bottom of the totem pole).
@@ -136,11 +160,21 @@ class Settings(object):
         for key in CONFIG_OPTIONS:
             defaults[key] = ''
         defaults.update({
+            'cache_names': 'false',
+            'cache_options': 'false',
+            'cache_ttl': '86400',
             'color': 'true',
             'description_on': 'false',
             'format': 'human',
             'host': '127.0.0.1',
+            'http_cache': 'false',
+            'http_cache_disk': 'false',
+            'identity_map': 'false',
             'insecure': 'false',
+            'max_page_size': '200',
+            'pool_connections': '10',
+            'pool_maxsize': '10',
+            'retries': '3',
             'use_token': 'false',
             'verify_ssl': 'true',
             'verbose': 'false',
@@ -210,7 +244,25 @@ class Settings(object):
             self._local.read(local_filename)
 
         # Put a stubbed runtime parser in.
-        self._runtime = self._new_parser()
+        self._process_runtime = self._new_parser()
+
+    @property
+    def _runtime(self):
+        context = self._context.get()
+        return context[0] if context else self._process_runtime
+
+    @_runtime.setter
+    def _runtime(self, parser):
+        if self._context.get():
+            self._context.set((parser, {}))
+        else:
+            self._process_runtime = parser
+            self._process_cache = {}
+
+    @property
+    def _cache(self):
+        context = self._context.get()
+        return context[1] if context else self._process_cache
 
     def __getattr__(self, key):
         """Return the approprate value, intelligently type-casted in the
@@ -233,7 +285,10 @@ class Settings(object):
 
             # We have a value; try to get its type and return it accordingly
             try:
-                if CONFIG_PARAM_TYPE[key] == click.STRING or CONFIG_PARAM_TYPE[key] == click.Choice:
+                if value == '' and CONFIG_PARAM_TYPE[key] in (click.INT, click.FLOAT):
+                    # An empty number means the setting is turned off.
+                    value = None
+                elif CONFIG_PARAM_TYPE[key] == click.STRING or CONFIG_PARAM_TYPE[key] == click.Choice:
                     value = parser.get('general', key)
                 elif CONFIG_PARAM_TYPE[key] == click.BOOL:
                     value = parser.getboolean('general', key)
@@ -270,15 +325,17 @@ class Settings(object):
         called once for each setting for each command invocation.
 
         If the setting exists, it follows that the runtime settings are
-        stale, so the entire runtime settings are reset.
+        stale, so the entire runtime settings are reset, except for those
+        given by `runtime_values`.
         """
         if self._runtime.has_option('general', key):
-            self._runtime = self._new_parser()
+            self._runtime = self._new_parser(self._runtime.defaults())
 
         if value is None:
             return
-        settings._runtime.set('general', key.replace('tower_', ''),
-                              six.text_type(value))
+        self._runtime.set('general', key.replace('tower_', ''),
+                          six.text_type(value))
+        self._cache.pop(key.replace('tower_', ''), None)
 
     @contextlib.contextmanager
     def runtime_values(self, **kwargs):
@@ -286,6 +343,10 @@ class Settings(object):
         =====API DOCS=====
         Context manager that temporarily override runtime level configurations.
 
+        The values are only seen by the current thread or asyncio task, and by the worker threads it
+        starts with ``tower_cli.utils.concurrency``. Values given by an enclosing ``runtime_values``
+        in the same context stay in effect unless they are given again.
+
         :param kwargs: Keyword arguments specifying runtime configuration settings.
         :type kwargs: arbitrary keyword arguments
         :returns: N/A
@@ -300,40 +361,34 @@ class Settings(object):
         =====API DOCS=====
         """
 
-        # Coerce all values to strings (to be coerced back by configparser
-        # later) and defenestrate any None values.
+        # Start from the values of an enclosing `runtime_values` in this
+        # context, then coerce all values to strings (to be coerced back by
+        # configparser later) and defenestrate any None values.
+        context = self._context.get()
+        values = dict(context[0].defaults()) if context else {}
         for k, v in copy.copy(kwargs).items():
             # If the value is None, just get rid of it.
             if v is None:
-                kwargs.pop(k)
                 continue
 
-            # Remove these keys from the cache, if they are present.
-            self._cache.pop(k, None)
-
             # Coerce values to strings.
-            kwargs[k] = six.text_type(v)
+            values[k] = six.text_type(v)
 
-        # Replace the `self._runtime` INI parser with a new one, using
-        # the context manager's kwargs as the "defaults" (there can never
-        # be anything other than defaults, but that isn't a problem for our
-        # purposes because we're using our own precedence system).
+        # Give this context a new INI parser, using the context manager's
+        # values as the "defaults" (there can never be anything other than
+        # defaults, but that isn't a problem for our purposes because we're
+        # using our own precedence system), and a cache of its own.
         #
         # Ensure that everything is put back to rights at the end of the
         # context manager call.
-        old_runtime_parser = self._runtime
+        runtime = Parser(defaults=values)
+        runtime.add_section('general')
+        previous = self._context.set((runtime, {}))
         try:
-            self._runtime = Parser(defaults=kwargs)
-            self._runtime.add_section('general')
             yield self
         finally:
-            # Revert the runtime configparser object.
-            self._runtime = old_runtime_parser
-
-            # Remove the keys from the cache again, since the settings
-            # have been reverted.
-            for key in kwargs:
-                self._cache.pop(k, None)
+            # Revert to the runtime values the context had before.
+            self._context.set(previous)
 
 
 def config_from_environment():
@@ -371,8 +426,9 @@ def runtime_context_manager(method):
     @wraps(method)
     def method_with_context_managed(*args, **kwargs):
         method(*args, **kwargs)
-        # Destroy the runtime settings
-        settings._runtime = settings._new_parser()
+        # Destroy the runtime settings, except for those given by
+        # `runtime_values`
+        settings._runtime = settings._new_parser(settings._runtime.defaults())
     return method_with_context_managed
 
 
@@ -428,8 +484,9 @@ def with_global_options(method):
         '-f', '--format',
         help='Output format. The "human" format is intended for humans '
              'reading output on the CLI; the "json" and "yaml" formats '
-             'provide more data, and "id" echos the object id only.',
-        type=click.Choice(['human', 'json', 'yaml', 'id']),
+             'provide more data, "jsonl" writes one JSON record per line '
+             'as records arrive, and "id" echos the object id only.',
+        type=click.Choice(['human', 'json', 'yaml', 'jsonl', 'id']),
         required=False, callback=_apply_runtime_setting,
         is_eager=True,
         expose_value=False
@@ -0,0 +1,79 @@
+# Copyright 2017, Ansible by Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Values that are local to the current thread or asyncio task."""
+
+from __future__ import absolute_import
+
+import functools
+import threading
+import weakref
+
+try:
+    import contextvars
+except ImportError:  # Python < 3.7
+    contextvars = None
+
+
+# Every context-local value, so that the values of the current context can be
+# carried over to worker threads; see `bind`.
+_locals = weakref.WeakSet()
+
+
+class ContextLocal(object):
+    """A value that is local to the current context: to the current asyncio
+    task or thread where `contextvars` is available, and to the current
+    thread otherwise.
+    """
+    def __init__(self, name, default=None):
+        self.default = default
+        if contextvars is not None:
+            self._var = contextvars.ContextVar('tower_cli.%s' % name)
+        else:
+            self._local = threading.local()
+        _locals.add(self)
+
+    def get(self):
+        if contextvars is not None:
+            return self._var.get(self.default)
+        return getattr(self._local, 'value', self.default)
+
+    def set(self, value):
+        """Set the value for the current context, and return the value it
+        replaces, to be put back with another call to `set`.
+        """
+        previous = self.get()
+        if contextvars is not None:
+            self._var.set(value)
+        else:
+            self._local.value = value
+        return previous
+
+
+def bind(func):
+    """Return a callable that calls `func` with the context-local values of
+    the current context, wherever it is called from, such as on a worker
+    thread; new threads otherwise start with the defaults.
+    """
+    values = [(local, local.get()) for local in list(_locals)]
+
+    @functools.wraps(func)
+    def bound(*args, **kwargs):
+        previous = [(local, local.set(value)) for local, value in values]
+        try:
+            return func(*args, **kwargs)
+        finally:
+            for local, value in reversed(previous):
+                local.set(value)
+    return bound
@@ -15,6 +15,8 @@
 
 from __future__ import absolute_import, division
 
+import codecs
+import collections
 import itertools
 import json
 import re
@@ -24,19 +26,58 @@ from copy import copy
 from base64 import b64decode
 
 import six
+from six.moves.urllib.parse import quote
 
 import click
 from click._compat import isatty as is_tty
 
-from tower_cli import resources, exceptions as exc
+from tower_cli import get_resource, resources, exceptions as exc
 from tower_cli.api import client
+from tower_cli.cli import types
 from tower_cli.conf import settings
 from tower_cli.constants import STATUS_CHOICES
 from tower_cli.models.fields import Field, ManyToManyField
-from tower_cli.utils import parser, debug, secho
+from tower_cli.utils import concurrency as concurrency_utils, parser, debug, secho
 from tower_cli.utils.data_structures import OrderedDict
 from tower_cli.utils.resource_decorators import disabled_getter, disabled_setter, disabled_deleter
 
+# The asyncio versions of resource methods need Python 3.5 or later.
+if sys.version_info >= (3, 5):
+    from tower_cli.aio import AsyncMonitorableMixin, AsyncResourceMixin
+else:
+    class AsyncResourceMixin(object):
+        pass
+
+    class AsyncMonitorableMixin(object):
+        pass
+
+
+# The longest list of values to send in one `__in` query, in URL-quoted characters; with the rest of the URL
+# this stays well inside the limits of Tower's web server and of common proxies.
+MAX_IN_QUERY_LENGTH = 2000
+
+# The events listing under each kind of unified job, which `monitor` follows rather than re-reading standard out.
+# Workflow jobs have no events of their own.
+EVENT_ENDPOINTS = {
+    '/ad_hoc_commands/': 'events/',
+    '/inventory_updates/': 'events/',
+    '/jobs/': 'job_events/',
+    '/project_updates/': 'events/',
+    '/system_jobs/': 'events/',
+}
+
+# The event after which a playbook run writes no more output.
+TERMINAL_EVENTS = ('playbook_on_stats',)
+
+# The longest that `monitor` waits between polls while a job is quiet.
+MAX_MONITOR_INTERVAL = 5
+
+# How much standard out to read from Tower at a time when downloading it, in bytes.
+STDOUT_CHUNK_SIZE = 64 * 1024
+
+# The statuses of jobs that have finished, one way or another.
+FINISHED_STATUSES = ('successful', 'failed', 'error', 'canceled')
+
 
 class ResourceMeta(type):
     """Metaclass for the creation of a Model subclass, which pulls fields
@@ -62,8 +103,12 @@ class ResourceMeta(type):
 
             # Add associate / disassociate methods
             for field in m2m_fields:
-                attrs[field.associate_method_name] = field.associate_method
-                attrs[field.disassociate_method_name] = field.disassociate_method
+                if not field.many_only:
+                    attrs[field.associate_method_name] = field.associate_method
+                    attrs[field.disassociate_method_name] = field.disassociate_method
+                attrs[field.associate_many_method_name] = field.associate_many_method
+                attrs[field.disassociate_many_method_name] = field.disassociate_many_method
+                attrs[field.sync_method_name] = field.sync_method
                 # tracked in m2m_fields, no longer need the field as direct attribute
                 attrs.pop(field.relationship)
 
@@ -154,7 +199,7 @@ class ResourceMeta(type):
         return super_new(cls, name, bases, newattrs)
 
 
-class BaseResource(six.with_metaclass(ResourceMeta)):
+class BaseResource(six.with_metaclass(ResourceMeta, AsyncResourceMixin)):
     """Abstract class representing resources within the Ansible Tower system, on which actions can be taken.
     Includes standard create, modify, list, get, and delete methods.
 
@@ -168,6 +213,10 @@ class BaseResource(six.with_metaclass(ResourceMeta)):
     dependencies = []
     related = []
 
+    # How to walk every page of a listing: "page" reads pages by number, and "keyset" reads them ordered by
+    # primary key, asking for records after the last one seen, which keeps deep pages of large tables fast.
+    pagination = 'page'
+
     # The basic methods for interacting with a resource are `read`, `write`,
     # and `delete`; these cover basic CRUD situations and have options
     # to handle most desired behavior.
@@ -211,17 +260,11 @@ class BaseResource(six.with_metaclass(ResourceMeta)):
                                                is on.
         =====API DOCS=====
         """
-        read_params = {}
-        for field_name in self.identity:
-            if field_name in kwargs:
-                read_params[field_name] = kwargs[field_name]
-        if 'id' in self.identity and len(self.identity) == 1:
+        read_params = self._identity_params(kwargs)
+        if read_params is None:
             return {}
-        if not read_params:
-            raise exc.BadRequest('Cannot reliably determine which record to write. Include an ID or unique '
-                                 'fields.')
         try:
-            existing_data = self.get(include_debug_header=include_debug_header, **read_params)
+            existing_data = self._get_indexed(read_params, include_debug_header=include_debug_header)
             if fail_on_found:
                 raise exc.Found('A record matching %s already exists, and you requested a failure in that case.' %
                                 read_params)
@@ -232,6 +275,234 @@ class BaseResource(six.with_metaclass(ResourceMeta)):
                                    read_params)
             return {}
 
+    def _identity_params(self, kwargs):
+        """Return the unique fields in `kwargs` by which `_lookup` finds the one object, or None if the
+        resource can only be found by primary key."""
+        read_params = {}
+        for field_name in self.identity:
+            if field_name in kwargs:
+                read_params[field_name] = kwargs[field_name]
+        if 'id' in self.identity and len(self.identity) == 1:
+            return None
+        if not read_params:
+            raise exc.BadRequest('Cannot reliably determine which record to write. Include an ID or unique '
+                                 'fields.')
+        return read_params
+
+    def _index_key(self, lookup):
+        """Return the key of the name index entry for the object with the given unique fields."""
+        return json.dumps(sorted((k, six.text_type(v)) for k, v in lookup.items()))
+
+    def _get_indexed(self, lookup, include_debug_header=True):
+        """Return the one object with the given unique fields, reading it by primary key if the name index
+        knows it, and adding it to the index otherwise."""
+        index = client.get_name_index(self.endpoint)
+        key = self._index_key(lookup)
+        if key in index:
+            try:
+                record = self.get(index[key], include_debug_header=include_debug_header)
+                if all(six.text_type(record.get(k, None)) == six.text_type(v) for k, v in lookup.items()):
+                    return record
+            except exc.NotFound:
+                pass
+            # The object was renamed or deleted behind our back.
+            index.pop(key, None)
+        record = self.get(include_debug_header=include_debug_header, **lookup)
+        index[key] = record['id']
+        client.save_name_index()
+        return record
+
+    def _forget_indexed(self, pk, record=None):
+        """Remove the name index entries made stale by writing or deleting the object with primary key `pk`:
+        those that point to it, and the one for its name alone, which may have become ambiguous."""
+        index = client.get_name_index(self.endpoint)
+        stale = [key for key, value in index.items() if value == pk]
+        name_field = self.identity[-1]
+        if record and record.get(name_field, None) is not None:
+            stale.append(self._index_key({name_field: record[name_field]}))
+        if stale:
+            for key in stale:
+                index.pop(key, None)
+            client.save_name_index()
+
+    def resolve(self, **kwargs):
+        """
+        =====API DOCS=====
+        Return the primary key of the one object matching the given unique fields, answering from the name
+        index without asking Tower if it can.
+
+        An index kept on disk by the ``cache_names`` setting may be a day old, so its entries are read back by
+        primary key to check that the object still exists and matches, as ``_lookup`` does; an index kept in
+        memory only lasts a minute, and its entries are trusted.
+
+        :param `**kwargs`: Unique fields of the resource object to look up, usually just its name.
+        :returns: The primary key of the resource object.
+        :rtype: int
+        :raises tower_cli.exceptions.NotFound: When no object matches.
+        :raises tower_cli.exceptions.MultipleResults: When more than one object matches.
+
+        =====API DOCS=====
+        """
+        if settings.cache_names:
+            return self._get_indexed(kwargs)['id']
+        index = client.get_name_index(self.endpoint)
+        key = self._index_key(kwargs)
+        if key not in index:
+            index[key] = self.get(**kwargs)['id']
+        return index[key]
+
+    def get_many(self, values, field=None, fail_on_missing=True, fail_on_multiple=True, **kwargs):
+        """
+        =====API DOCS=====
+        Retrieve the objects whose ``field`` is each of ``values``, with as few requests as possible.
+
+        The values are looked up with ``<field>__in`` queries, split into chunks that keep each URL short
+        enough for Tower and any proxy in front of it. Values that contain a comma cannot be sent that way,
+        and are looked up one at a time.
+
+        :param values: Values of ``field`` to look up, usually names.
+        :type values: list
+        :param field: Field to look the objects up by. Defaults to the last field of the resource's identity,
+                      usually ``name``; ``id`` may also be used.
+        :type field: str
+        :param fail_on_missing: Flag that if set, values that match no object raise an exception; otherwise
+                                they are left out of the result.
+        :type fail_on_missing: bool
+        :param fail_on_multiple: Flag that if set, values that match more than one object raise an exception;
+                                 otherwise they are left out of the result.
+        :type fail_on_multiple: bool
+        :param `**kwargs`: Further fields that every object must match, such as ``inventory``.
+        :returns: A dictionary of the loaded JSON of each object found, keyed by the value it was found by,
+                  in the order the values were given.
+        :rtype: dict
+        :raises tower_cli.exceptions.NotFound: When some values match no object and ``fail_on_missing`` is on.
+        :raises tower_cli.exceptions.MultipleResults: When some values match more than one object and
+                                                      ``fail_on_multiple`` is on.
+
+        =====API DOCS=====
+        """
+        field = field or self.identity[-1]
+        values = [six.text_type(value) for value in values]
+        matches = dict((value, []) for value in values)
+        for chunk in self._chunk_values([value for value in matches if ',' not in value]):
+            query = {'%s__in' % field: ','.join(chunk)}
+            query.update(kwargs)
+            for record in self.list(all_pages=True, **query)['results']:
+                value = six.text_type(record.get(field, None))
+                if value in matches:
+                    matches[value].append(record)
+        for value in matches:
+            if ',' in value:
+                query = {field: value}
+                query.update(kwargs)
+                matches[value] = self.list(all_pages=True, **query)['results']
+
+        missing = [value for value in values if not matches[value]]
+        multiple = [value for value in values if len(matches[value]) > 1]
+        if missing and fail_on_missing:
+            raise exc.NotFound('No object at %s has the %s %s.' % (
+                self.endpoint, field, ', '.join('"%s"' % value for value in missing)))
+        if multiple and fail_on_multiple:
+            raise exc.MultipleResults('More than one object at %s has the %s %s. Please tighten your criteria.' % (
+                self.endpoint, field, ', '.join('"%s"' % value for value in multiple)))
+        return OrderedDict((value, matches[value][0]) for value in values if len(matches[value]) == 1)
+
+    def _chunk_values(self, values):
+        """Split the given values into lists whose comma-separated, URL-quoted form is no longer than
+        `MAX_IN_QUERY_LENGTH` characters."""
+        chunk, length = [], 0
+        for value in values:
+            value_length = len(quote(value.encode('utf8'))) + 3
+            if chunk and length + value_length > MAX_IN_QUERY_LENGTH:
+                yield chunk
+                chunk, length = [], 0
+            chunk.append(value)
+            length += value_length
+        if chunk:
+            yield chunk
+
+    def resolve_many(self, values, fail_on_missing=True, fail_on_multiple=True, **kwargs):
+        """
+        =====API DOCS=====
+        Return the primary keys of the objects with each of the given names (or other last identity field),
+        answering from the name index where it can and looking the rest up with ``get_many``. As in
+        ``resolve``, entries of an index kept on disk are checked first, all with one ``id__in`` query.
+
+        :param values: Names of the objects to look up.
+        :type values: list
+        :param fail_on_missing: Flag that if set, names that match no object raise an exception; otherwise
+                                they are left out of the result.
+        :type fail_on_missing: bool
+        :param fail_on_multiple: Flag that if set, names that match more than one object raise an exception;
+                                 otherwise they are left out of the result.
+        :type fail_on_multiple: bool
+        :param `**kwargs`: Further unique fields that every object must match, such as ``inventory``.
+        :returns: A dictionary of primary keys keyed by name, in the order the names were given.
+        :rtype: dict
+        :raises tower_cli.exceptions.NotFound: When some names match no object and ``fail_on_missing`` is on.
+        :raises tower_cli.exceptions.MultipleResults: When some names match more than one object and
+                                                      ``fail_on_multiple`` is on.
+
+        =====API DOCS=====
+        """
+        field = self.identity[-1]
+        index = client.get_name_index(self.endpoint)
+        keys = {}
+        for value in values:
+            lookup = {field: value}
+            lookup.update(kwargs)
+            keys[six.text_type(value)] = self._index_key(lookup)
+        if settings.cache_names:
+            self._check_indexed(index, keys, **kwargs)
+        unknown = [value for value, key in keys.items() if key not in index]
+        if unknown:
+            found = self.get_many(unknown, fail_on_missing=fail_on_missing, fail_on_multiple=fail_on_multiple,
+                                  **kwargs)
+            for value, record in found.items():
+                index[keys[value]] = record['id']
+            client.save_name_index()
+        return OrderedDict((value, index[keys[value]]) for value in (six.text_type(v) for v in values)
+                           if keys[value] in index)
+
+    def _check_indexed(self, index, keys, **kwargs):
+        """Drop the entries under `keys`, a dictionary of name index keys by name, that point to objects
+        which no longer exist or no longer match."""
+        field = self.identity[-1]
+        known = dict((value, index[key]) for value, key in keys.items() if key in index)
+        if not known:
+            return
+        found = self.get_many(sorted(set(known.values())), field='id', fail_on_missing=False, **kwargs)
+        for value, pk in known.items():
+            record = found.get(six.text_type(pk), None)
+            if record is None or six.text_type(record.get(field, None)) != value:
+                index.pop(keys[value], None)
+
+    def warm_index(self):
+        """
+        =====API DOCS=====
+        Fill the name index of this resource from a single listing of all of its objects, so that later
+        calls to ``resolve`` need not ask Tower.
+
+        :returns: The number of objects listed.
+        :rtype: int
+
+        =====API DOCS=====
+        """
+        index = client.get_name_index(self.endpoint)
+        identity = [field for field in self.identity if field != 'id']
+        if not identity:
+            return 0
+        records = self.list(all_pages=True)['results']
+        name_field = identity[-1]
+        names = collections.Counter(record.get(name_field, None) for record in records)
+        for record in records:
+            lookup = dict((k, record[k]) for k in identity if record.get(k, None) is not None)
+            index[self._index_key(lookup)] = record['id']
+            if names[record.get(name_field, None)] == 1 and record.get(name_field, None) is not None:
+                index[self._index_key({name_field: record[name_field]})] = record['id']
+        client.save_name_index()
+        return len(records)
+
     def _convert_pagenum(self, kwargs):
         """
         Convert next and previous from URLs to integers
@@ -275,6 +546,23 @@ class BaseResource(six.with_metaclass(ResourceMeta)):
 
         =====API DOCS=====
         """
+        url, params = self._read_request(pk, kwargs)
+
+        # Make the request to the Ansible Tower API. Objects read by primary key alone are read through the
+        # identity map, which the client empties of any object it writes to.
+        resp = None
+        if pk and not params:
+            map_key = client.get_prefix() + url.lstrip('/')
+            resp = client.identity_map.get(map_key)
+        if resp is None:
+            r = client.get(url, params=params)
+            resp = r.json()
+            if pk and not params:
+                client.identity_map.put(map_key, resp)
+        return self._read_answer(pk, resp, fail_on_no_results, fail_on_multiple_results)
+
+    def _read_request(self, pk, kwargs):
+        """Return the URL and query parameters with which `read` asks for objects."""
         # Piece together the URL we will be hitting.
         url = self.endpoint
         if pk:
@@ -296,11 +584,11 @@ class BaseResource(six.with_metaclass(ResourceMeta)):
         params = list(kwargs.items())
         for query in queries:
             params.append((query[0], query[1]))
+        return url, params
 
-        # Make the request to the Ansible Tower API.
-        r = client.get(url, params=params)
-        resp = r.json()
-
+    def _read_answer(self, pk, resp, fail_on_no_results=False, fail_on_multiple_results=False):
+        """Return what `read` returns for the response `resp`, raising an error if the results are not
+        what was asked for."""
         # If this was a request with a primary key included, then at the
         # point that we got a good result, we know that we're done and can
         # return the result.
@@ -383,13 +671,18 @@ class BaseResource(six.with_metaclass(ResourceMeta)):
 
         # Sanity check: Are we missing required values?
         # If we don't have a primary key, then all required values must be set, and if they're not, it's an error.
-        missing_fields = []
-        for i in self.fields:
-            if i.key not in kwargs and i.name not in kwargs and i.required:
-                missing_fields.append(i.key or i.name)
-        if missing_fields and not pk:
-            raise exc.BadRequest('Missing required fields: %s' % ', '.join(missing_fields).replace('_', '-'))
+        if not pk:
+            self._check_required(kwargs)
+        answer = self._unchanged_answer(pk, kwargs, existing_data, force_on_exists)
+        if answer is not None:
+            return answer
+
+        # If debugging is on, print the URL and data being sent.
+        debug.log('Writing the record.', header='details')
+        return self._send_write(pk, kwargs)
 
+    def _unchanged_answer(self, pk, kwargs, existing_data, force_on_exists=True):
+        """Return what `write` returns if it need not write anything, or None if it must write."""
         # Sanity check: Do we need to do a write at all?
         # If `force_on_exists` is False and the record was, in fact, found, then no action is required.
         if pk and not force_on_exists:
@@ -399,33 +692,217 @@ class BaseResource(six.with_metaclass(ResourceMeta)):
             return answer
 
         # Similarly, if all existing data matches our write parameters, there's no need to do anything.
-        if all([kwargs[k] == existing_data.get(k, None) for k in kwargs.keys()]):
+        if self._is_unchanged(kwargs, existing_data):
             debug.log('All provided fields match existing data; do nothing.', header='decision', nl=2)
             answer = OrderedDict((('changed', False), ('id', pk)))
             answer.update(existing_data)
             return answer
+        return None
 
+    def _check_required(self, kwargs):
+        """Raise BadRequest if any field that is required to create an object is missing from `kwargs`."""
+        missing_fields = []
+        for i in self.fields:
+            if i.key not in kwargs and i.name not in kwargs and i.required:
+                missing_fields.append(i.key or i.name)
+        if missing_fields:
+            raise exc.BadRequest('Missing required fields: %s' % ', '.join(missing_fields).replace('_', '-'))
+
+    def _is_unchanged(self, kwargs, existing_data):
+        """Return True if writing `kwargs` over `existing_data` would change nothing."""
+        return all([kwargs[k] == existing_data.get(k, None) for k in kwargs.keys()])
+
+    def _send_write(self, pk, kwargs):
+        """POST `kwargs` as a new object, or PATCH them onto the object with primary key `pk`, and return the
+        written object with "changed" and "id" fields in front."""
+        method, url = self._write_request(pk, kwargs)
+
+        # Actually perform the write.
+        r = getattr(client, method.lower())(url, data=kwargs)
+        return self._written_answer(r.json())
+
+    def _write_request(self, pk, kwargs):
+        """Return the method and URL with which to write `kwargs`, putting back None for "null" values."""
         # Reinsert None for special case of null association
         for key in kwargs:
             if kwargs[key] == 'null':
                 kwargs[key] = None
 
         # Get the URL and method to use for the write.
-        url = self.endpoint
-        method = 'POST'
         if pk:
-            url = self._get_patch_url(url, pk)
-            method = 'PATCH'
+            return 'PATCH', self._get_patch_url(self.endpoint, pk)
+        return 'POST', self.endpoint
 
-        # If debugging is on, print the URL and data being sent.
-        debug.log('Writing the record.', header='details')
+    def _written_answer(self, data):
+        """Return the answer for the written object `data`, with "changed" and "id" fields in front."""
+        # At this point, we know the write succeeded, and we know that data was changed in the process.
+        answer = OrderedDict((('changed', True), ('id', data['id'])))
+        answer.update(data)
+        self._forget_indexed(answer['id'], answer)
+        return answer
 
-        # Actually perform the write.
-        r = getattr(client, method.lower())(url, data=kwargs)
+    def bulk_write(self, records, create_on_missing=True, fail_on_found=False, force_on_exists=True,
+                   concurrency=None):
+        """
+        =====API DOCS=====
+        Create or modify many objects at once, making only the writes that change something.
+
+        Each record is handled as ``write`` would handle it given the same keyword arguments, but the existing
+        objects are read with ``<name>__in`` listings rather than one lookup per record, related objects given
+        by name are resolved in batches, and the creates and modifications are sent on a bounded pool of
+        worker threads.
+
+        :param records: Dictionaries of fields to write, each as the ``**kwargs`` of ``write``. A record with an
+                        ``id`` is written to that object; any other is matched by the resource's identity.
+        :type records: list
+        :param create_on_missing: Flag that if set, records that match no object are created; otherwise they
+                                  raise an exception.
+        :type create_on_missing: bool
+        :param fail_on_found: Flag that if set, the operation fails if any record matches an existing object.
+        :type fail_on_found: bool
+        :param force_on_exists: Flag that if set, objects matched by their identity are updated with the other
+                                fields of the record; if unset, they are left alone.
+        :type force_on_exists: bool
+        :param concurrency: The most writes to send at the same time. Defaults to the ``pool_maxsize`` setting.
+        :type concurrency: int
+        :returns: A list with a dictionary for each record, in the order of ``records``, as ``write`` returns it:
+                  the JSON of the object with two extra fields, "changed" and "id".
+        :rtype: list
+        :raises tower_cli.exceptions.BadRequest: When a record has no identity fields, when two records are
+                                                 for the same object, or when a new record misses required
+                                                 fields.
+        :raises tower_cli.exceptions.NotFound: When a record matches no object and ``create_on_missing`` is off.
+        :raises tower_cli.exceptions.Found: When a record matches an object and ``fail_on_found`` is on.
 
-        # At this point, we know the write succeeded, and we know that data was changed in the process.
-        answer = OrderedDict((('changed', True), ('id', r.json()['id'])))
-        answer.update(r.json())
+        =====API DOCS=====
+        """
+        records = [dict(record) for record in records]
+        for record in records:
+            self._pop_none(record)
+        self._resolve_related(records)
+
+        # Find the existing object of every record, reading the objects given by primary key and those given
+        # by name with as few listings as possible.
+        debug.log('Checking for existing records.', header='details')
+        pks = [record.pop('id', None) for record in records]
+        by_pk = self.get_many([pk for pk in pks if pk], field='id') if any(pks) else {}
+        unmatched = [i for i, pk in enumerate(pks) if not pk]
+        existing = dict(zip(unmatched, self._match_existing([records[i] for i in unmatched])))
+
+        writes = []
+        seen = {}
+        for i, (pk, record) in enumerate(zip(pks, records)):
+            if pk:
+                existing_data = by_pk[six.text_type(pk)]
+            else:
+                key, existing_data = existing[i]
+                if key in seen:
+                    raise exc.BadRequest('Records %d and %d are both for the object matching %s.' %
+                                         (seen[key] + 1, i + 1, dict(key)))
+                seen[key] = i
+                if existing_data and fail_on_found:
+                    raise exc.Found('A record matching %s already exists, and you requested a failure in that '
+                                    'case.' % dict(key))
+                if not existing_data and not create_on_missing:
+                    raise exc.NotFound('A record matching %s does not exist, and you requested a failure in '
+                                       'that case.' % dict(key))
+                if not existing_data:
+                    self._check_required(record)
+            pk = existing_data.get('id', None)
+            if pk and ((not force_on_exists and not pks[i]) or self._is_unchanged(record, existing_data)):
+                answer = OrderedDict((('changed', False), ('id', pk)))
+                answer.update(existing_data)
+                writes.append(answer)
+            else:
+                writes.append((pk, record))
+
+        # Send the writes that change something, creating what the server can create in batches first, and put
+        # their answers in the place of their records.
+        pending = [i for i, write in enumerate(writes) if isinstance(write, tuple)]
+        debug.log('Writing %d of %d records.' % (len(pending), len(records)), header='details')
+        created = self._bulk_create(OrderedDict((i, writes[i][1]) for i in pending if not writes[i][0]),
+                                    concurrency or settings.pool_maxsize)
+        for i, answer in created.items():
+            writes[i] = answer
+        pending = [i for i in pending if i not in created]
+        answers = concurrency_utils.parallel_map(lambda i: self._send_write(*writes[i]), pending,
+                                                 concurrency or settings.pool_maxsize)
+        for i, answer in zip(pending, answers):
+            writes[i] = answer
+        return writes
+
+    def _bulk_create(self, records, concurrency=None):
+        """Create objects with a bulk endpoint of the server, if the resource has one that the server offers.
+
+        `records` is a dictionary of the records to create, keyed by their place among the records given to
+        ``bulk_write``. Return a dictionary of the answers for the records that were created, keyed the same
+        way; the rest are created one at a time."""
+        return {}
+
+    def _resolve_related(self, records, related=None):
+        """Replace the names of related objects in `records` with their primary keys, looking up the names of
+        each related resource together.
+
+        `related` maps the keys of the records that hold related objects to the names of their resources; it
+        defaults to the fields of this resource whose type is Related. A key may hold one object or a list."""
+        if related is None:
+            related = dict((field.key or field.name, field.type.resource_name) for field in self.fields
+                           if isinstance(field.type, types.Related))
+
+        def is_name(value):
+            return isinstance(value, six.string_types) and value != 'null' and not value.isdigit()
+
+        def pk_of(value, pks):
+            if isinstance(value, six.string_types) and value.isdigit():
+                return int(value)
+            return pks.get(value, value) if is_name(value) else value
+
+        for key, resource_name in related.items():
+            values = [record[key] for record in records if key in record]
+            values = [v for value in values for v in (value if isinstance(value, (list, tuple)) else [value])]
+            names = [value for value in values if is_name(value)]
+            pks = get_resource(resource_name).resolve_many(names) if names else {}
+            for record in records:
+                if isinstance(record.get(key, None), (list, tuple)):
+                    record[key] = [pk_of(value, pks) for value in record[key]]
+                elif key in record:
+                    record[key] = pk_of(record[key], pks)
+
+    def _match_existing(self, records):
+        """Return a (key, existing object) pair for each record, where the key is made of the record's identity
+        fields and the existing object is that of ``_lookup``, read with `__in` listings by name."""
+        name_field = self.identity[-1]
+        keys = []
+        for record in records:
+            key = tuple((field, six.text_type(record[field])) for field in self.identity if field in record)
+            if not key:
+                raise exc.BadRequest('Cannot reliably determine which record to write. Include an ID or unique '
+                                     'fields.')
+            keys.append(key)
+        if 'id' in self.identity and len(self.identity) == 1:
+            return [(key, {}) for key in keys]
+
+        # Read every object with one of the names, and keep those that match a record on all its identity fields.
+        names = set(dict(key).get(name_field, None) for key in keys)
+        candidates = collections.defaultdict(list)
+        for chunk in self._chunk_values(sorted(name for name in names if name is not None and ',' not in name)):
+            for found in self.iter_list(**{'%s__in' % name_field: ','.join(chunk)}):
+                candidates[six.text_type(found.get(name_field, None))].append(found)
+        for name in names:
+            if name is not None and ',' in name:
+                candidates[name] = list(self.iter_list(**{name_field: name}))
+
+        answer = []
+        for key, record in zip(keys, records):
+            if name_field not in record:
+                answer.append((key, self._lookup(include_debug_header=False, **record)))
+                continue
+            matches = [found for found in candidates[dict(key)[name_field]]
+                       if all(six.text_type(found.get(field, None)) == value for field, value in key)]
+            if len(matches) > 1:
+                raise exc.MultipleResults('Expected one result for %s, got %d. Please tighten your criteria.' %
+                                          (dict(key), len(matches)))
+            answer.append((key, matches[0] if matches else {}))
         return answer
 
     @resources.command
@@ -463,6 +940,7 @@ class BaseResource(six.with_metaclass(ResourceMeta)):
         debug.log('DELETE %s' % url, fg='blue', bold=True)
         try:
             client.delete(url)
+            self._forget_indexed(pk)
             return {'changed': True}
         except exc.NotFound:
             if fail_on_missing:
@@ -510,7 +988,13 @@ class BaseResource(six.with_metaclass(ResourceMeta)):
                   help='A key and value to be passed as an HTTP query string key and value to the Tower API.'
                        ' Will be run through HTTP escaping. This argument may be sent multiple times.\n'
                        'Example: `--query foo bar` would be passed to Tower as ?foo=bar')
-    def list(self, all_pages=False, **kwargs):
+    @click.option('--concurrency', type=click.IntRange(1), required=False,
+                  help='If used with --all-pages, read the remaining pages using this many concurrent requests.')
+    @click.option('--pagination', type=click.Choice(['page', 'keyset']), required=False,
+                  help='How to walk the pages with --all-pages: by page number, or by asking for records with '
+                       'a greater ID than the last one seen ("keyset"), which costs the same for every page. '
+                       'Defaults to the preferred strategy of the resource.')
+    def list(self, all_pages=False, concurrency=None, pagination=None, **kwargs):
         """Return a list of objects.
 
         If one or more filters are provided through keyword arguments, filter the results accordingly.
@@ -522,6 +1006,13 @@ class BaseResource(six.with_metaclass(ResourceMeta)):
 
         :param all_pages: Flag that if set, collect all pages of content from the API when returning results.
         :type all_pages: bool
+        :param concurrency: If set along with ``all_pages``, the number of pages to read from the API at the
+                            same time once the page count is known. Results keep their page order.
+        :type concurrency: int
+        :param pagination: How to walk the pages if ``all_pages`` is set; either "page" to read pages by number,
+                           or "keyset" to read pages ordered by primary key, each asking for records after
+                           the last one seen. Defaults to the ``pagination`` attribute of the resource.
+        :type pagination: str
         :param page: The page to show. Ignored if all_pages is set.
         :type page: int
         :param query: Contains 2-tuples used as query parameters to filter resulting resource objects.
@@ -532,30 +1023,46 @@ class BaseResource(six.with_metaclass(ResourceMeta)):
 
         =====API DOCS=====
         """
-        # TODO: Move to a field callback method to make it generic
-        # If multiple statuses where given, add OR queries for each of them
-        if kwargs.get('status', None) and ',' in kwargs['status']:
-            all_status = kwargs.pop('status').strip(',').split(',')
-            queries = list(kwargs.pop('query', ()))
-            for status in all_status:
-                if status in STATUS_CHOICES:
-                    queries.append(('or__status', status))
-                else:
-                    raise exc.TowerCLIError('This status does not exist: {}'.format(status))
-            kwargs['query'] = tuple(queries)
+        self._split_statuses(kwargs)
 
-        # If the `all_pages` flag is set, then ignore any page that might also be sent.
+        # If the `all_pages` flag is set, then ignore any page that might also be sent, and ask for pages
+        # as large as the server allows.
         if all_pages:
             kwargs.pop('page', None)
-            kwargs.pop('page_size', None)
+            self._set_all_pages_size(kwargs)
+
+        # If we can walk the pages by primary key, collate them that way. However the pages are read, the
+        # count of the first page is the count of the whole listing, so the counts of later pages are ignored.
+        if all_pages and self._use_keyset(kwargs, pagination, concurrency):
+            debug.log('Getting records.', header='details')
+            pages = self._keyset_pages(kwargs)
+            response = next(pages)
+            for cursor in pages:
+                response['results'] += cursor['results']
+            response['next'] = None
+            response['previous'] = None
+            return response
 
         # Get the response.
         debug.log('Getting records.', header='details')
         response = self.read(**kwargs)
+        if all_pages:
+            self._note_page_size(kwargs, response)
 
         # Convert next and previous to int
         self._convert_pagenum(response)
 
+        # If we were asked for all pages and told how many to read at once, work out the page count from
+        # the first page and read the rest concurrently.
+        if all_pages and response['next'] and concurrency and concurrency > 1:
+            def read_page(page):
+                cursor = self.read(**dict(kwargs, page=page))
+                self._convert_pagenum(cursor)
+                return cursor
+            for cursor in concurrency_utils.fetch_pages(response, read_page, concurrency):
+                response['results'] += cursor['results']
+            response['next'] = None
+
         # If we were asked for all pages, keep retrieving pages until we have them all.
         if all_pages and response['next']:
             cursor = copy(response)
@@ -563,12 +1070,140 @@ class BaseResource(six.with_metaclass(ResourceMeta)):
                 cursor = self.read(**dict(kwargs, page=cursor['next']))
                 self._convert_pagenum(cursor)
                 response['results'] += cursor['results']
-                response['count'] += cursor['count']
             response['next'] = None
 
         # Done; return the response
         return response
 
+    list.stream_method = 'iter_list'
+
+    def iter_list(self, all_pages=True, pagination=None, **kwargs):
+        """
+        =====API DOCS=====
+        Iterate over a list of objects, reading them from the API one page at a time.
+
+        Unlike ``list``, the records are not collated into one response, so memory use does not grow with the
+        size of the listing and the first records are available as soon as the first page arrives.
+
+        :param all_pages: Flag that if set, iterate over all pages of content from the API; otherwise only
+                          over the requested page.
+        :type all_pages: bool
+        :param pagination: How to walk the pages if ``all_pages`` is set; either "page" or "keyset", as for
+                           ``list``.
+        :type pagination: str
+        :param page: The page to read. Ignored if all_pages is set.
+        :type page: int
+        :param query: Contains 2-tuples used as query parameters to filter resulting resource objects.
+        :type query: list
+        :param `**kwargs`: Keyword arguments list of available fields used for searching resource objects.
+        :returns: A generator of the JSON objects of the resource objects returned by Tower backend.
+        :rtype: generator
+
+        =====API DOCS=====
+        """
+        kwargs.pop('concurrency', None)
+        self._split_statuses(kwargs)
+        if all_pages:
+            kwargs.pop('page', None)
+            self._set_all_pages_size(kwargs)
+
+        debug.log('Getting records.', header='details')
+        if all_pages and self._use_keyset(kwargs, pagination):
+            for cursor in self._keyset_pages(kwargs):
+                for record in cursor['results']:
+                    yield record
+            return
+
+        cursor = self.read(**kwargs)
+        if all_pages:
+            self._note_page_size(kwargs, cursor)
+        self._convert_pagenum(cursor)
+        for record in cursor['results']:
+            yield record
+        while all_pages and cursor['next']:
+            cursor = self.read(**dict(kwargs, page=cursor['next']))
+            self._convert_pagenum(cursor)
+            for record in cursor['results']:
+                yield record
+
+    def _set_all_pages_size(self, kwargs):
+        """Ask for the largest pages the server is known to accept when reading all pages of a listing, up
+        to the `max_page_size` setting; any page size that was asked for is ignored."""
+        kwargs.pop('page_size', None)
+        page_size = settings.max_page_size
+        if not page_size:
+            return
+        kwargs['page_size'] = min(page_size, client.get_page_size_limit() or page_size)
+
+    def _note_page_size(self, kwargs, response):
+        """If the server sent back a smaller first page than we asked for while more pages remain, it has
+        capped our page size; remember the cap for this host so that later listings ask for it directly."""
+        page_size = kwargs.get('page_size', None)
+        results = len(response.get('results', ()))
+        if page_size and response.get('next', None) and 0 < results < page_size:
+            debug.log('The server returns at most %d records per page.' % results, header='details')
+            client.set_page_size_limit(results)
+
+    def _keyset_order(self, kwargs):
+        """Return the primary key ordering ("id" or "-id") requested for a listing, or None if the listing
+        is ordered by anything else and so cannot be walked by primary key."""
+        orders = [value for key, value in kwargs.get('query', ()) if key == 'order_by']
+        if kwargs.get('order_by', None):
+            orders.append(kwargs['order_by'])
+        if not orders:
+            return 'id'
+        if len(orders) == 1 and orders[0] in ('id', 'pk', '-id', '-pk'):
+            return '-id' if orders[0].startswith('-') else 'id'
+        return None
+
+    def _use_keyset(self, kwargs, pagination=None, concurrency=None):
+        """Decide whether to walk all pages of a listing by primary key rather than by page number."""
+        if pagination is None:
+            # Reading pages concurrently needs page numbers, so an explicit concurrency wins over the default.
+            if concurrency and concurrency > 1:
+                return False
+            pagination = self.pagination
+        if pagination != 'keyset':
+            return False
+        if self._keyset_order(kwargs) is None:
+            debug.log('The listing is not ordered by ID; reading pages by number.', header='details')
+            return False
+        return True
+
+    def _keyset_pages(self, kwargs):
+        """Yield each page of a listing ordered by primary key, asking for every page after the first
+        only for records beyond the last primary key seen, so that deep pages cost as much as the first."""
+        order = self._keyset_order(kwargs)
+        kwargs = dict(kwargs)
+        kwargs.pop('order_by', None)
+        queries = [query for query in kwargs.pop('query', ()) if query[0] != 'order_by']
+        queries.append(('order_by', order))
+        last_seen = None
+        while True:
+            page_queries = list(queries)
+            if last_seen is not None:
+                page_queries.append(('id__lt' if order == '-id' else 'id__gt', last_seen))
+            cursor = self.read(query=page_queries, **kwargs)
+            if last_seen is None:
+                self._note_page_size(kwargs, cursor)
+            yield cursor
+            if not cursor['results'] or not cursor.get('next', None):
+                return
+            last_seen = cursor['results'][-1]['id']
+
+    def _split_statuses(self, kwargs):
+        """If multiple comma-separated statuses were given, replace them with OR queries for each of them."""
+        # TODO: Move to a field callback method to make it generic
+        if kwargs.get('status', None) and ',' in kwargs['status']:
+            all_status = kwargs.pop('status').strip(',').split(',')
+            queries = list(kwargs.pop('query', ()))
+            for status in all_status:
+                if status in STATUS_CHOICES:
+                    queries.append(('or__status', status))
+                else:
+                    raise exc.TowerCLIError('This status does not exist: {}'.format(status))
+            kwargs['query'] = tuple(queries)
+
     def _assoc(self, url_fragment, me, other):
         """Associate the `other` record with the `me` record."""
 
@@ -599,6 +1234,63 @@ class BaseResource(six.with_metaclass(ResourceMeta)):
         r = client.post(url, data={'disassociate': True, 'id': other})
         return {'changed': True}
 
+    def _assoc_many(self, url_fragment, me, others, other_name, concurrency=None):
+        """Associate each of the `others` records, given by primary key or name, with the `me` record."""
+        url = self.endpoint + '%d/%s/' % (me, url_fragment)
+        current = self._related_pks(url, concurrency)
+        wanted = [pk for pk in self._pks_of(other_name, others) if pk not in current]
+        count = self._post_assoc(url, 'associate', wanted, concurrency)
+        return OrderedDict((('changed', count > 0), ('count', count)))
+
+    def _disassoc_many(self, url_fragment, me, others, other_name, concurrency=None):
+        """Disassociate each of the `others` records, given by primary key or name, from the `me` record."""
+        url = self.endpoint + '%d/%s/' % (me, url_fragment)
+        current = self._related_pks(url, concurrency)
+        unwanted = [pk for pk in self._pks_of(other_name, others) if pk in current]
+        count = self._post_assoc(url, 'disassociate', unwanted, concurrency)
+        return OrderedDict((('changed', count > 0), ('count', count)))
+
+    def _sync_assoc(self, url_fragment, me, others, other_name, concurrency=None):
+        """Make the `others` records, given by primary key or name, the only records associated with the `me`
+        record."""
+        url = self.endpoint + '%d/%s/' % (me, url_fragment)
+        current = self._related_pks(url, concurrency)
+        wanted = self._pks_of(other_name, others)
+        associated = self._post_assoc(url, 'associate', [pk for pk in wanted if pk not in current], concurrency)
+        disassociated = self._post_assoc(url, 'disassociate', sorted(current - set(wanted)), concurrency)
+        return OrderedDict((('changed', associated + disassociated > 0), ('associated', associated),
+                            ('disassociated', disassociated)))
+
+    def _related_pks(self, url, concurrency=None):
+        """Return the set of primary keys of every record listed at `url`, reading its pages as large as the
+        server allows."""
+        params = {'page_size': settings.max_page_size} if settings.max_page_size else {}
+        first_page = client.get(url, params=params).json()
+        pages = [first_page] + concurrency_utils.fetch_pages(
+            first_page, lambda page: client.get(url, params=dict(params, page=page)).json(), concurrency
+        )
+        return set(record['id'] for page in pages for record in page['results'])
+
+    def _post_assoc(self, url, action, pks, concurrency=None):
+        """Post an association or disassociation of each of `pks` to `url` and return how many were posted."""
+        debug.log('Posting %d %ss.' % (len(pks), action[:-1] + 'ion'), header='details')
+        concurrency_utils.parallel_map(lambda pk: client.post(url, data={action: True, 'id': pk}), pks,
+                                       concurrency or settings.pool_maxsize)
+        return len(pks)
+
+    def _pks_of(self, resource_name, values):
+        """Return the primary keys of the given objects of the named resource, in order and without repeats,
+        looking up those given by name together."""
+        values = [six.text_type(value) for value in values]
+        names = [value for value in values if not value.isdigit()]
+        by_name = get_resource(resource_name).resolve_many(names) if names else {}
+        answer = []
+        for value in values:
+            pk = int(value) if value.isdigit() else by_name[value]
+            if pk not in answer:
+                answer.append(pk)
+        return answer
+
 
 class Resource(BaseResource):
     """This is the parent class for all standard resources."""
@@ -719,17 +1411,190 @@ class Resource(BaseResource):
         """
         return self.write(pk, create_on_missing=create_on_missing, force_on_exists=True, **kwargs)
 
+    @resources.command(use_fields_as_options=False)
+    @click.option('--file', 'records', type=types.File('r'), required=True,
+                  help='A JSON or YAML file holding a list of records, each a mapping of field names to values.')
+    @click.option('--concurrency', type=click.IntRange(1), required=False,
+                  help='The most writes to send at the same time. Defaults to the pool_maxsize setting.')
+    def apply(self, records, concurrency=None):
+        """Create or update every object in a file, reading the existing objects once and writing only the ones
+        that change.
+
+        Each record is matched with an existing object by its ID or the resource's identity fields, as modify
+        with --create-on-missing does for one object.
+
+        =====API DOCS=====
+        Create or update many objects, as ``bulk_write`` does.
+
+        :param records: The records to write, or a file holding them as a JSON or YAML list.
+        :type records: list
+        :param concurrency: The most writes to send at the same time.
+        :type concurrency: int
+        :returns: A dictionary of two fields: "changed", a flag indicating if any object was created or updated;
+                  and "results", the answer of ``bulk_write`` for each record, in order.
+        :rtype: dict
+
+        =====API DOCS=====
+        """
+        if hasattr(records, 'read'):
+            records = parser.string_to_dict(records.read(), allow_kv=False, require_dict=False)
+        if isinstance(records, dict):
+            records = [records]
+        if not isinstance(records, list) or not all(isinstance(record, dict) for record in records):
+            raise exc.UsageError('The records must be a list of mappings of field names to values.')
+        results = self.bulk_write(records, create_on_missing=True, force_on_exists=True, concurrency=concurrency)
+        return OrderedDict((('changed', any(result['changed'] for result in results)), ('results', results)))
+
+    @resources.command(use_fields_as_options=False, no_args_is_help=False)
+    @click.option('--filter', 'filters', multiple=True, metavar='KEY=VALUE',
+                  help='A query to match the objects by, such as name__startswith=old-. This option may be '
+                       'sent multiple times, and at least one is required.')
+    @click.option('--set', 'values', multiple=True, metavar='FIELD=VALUE', required=True,
+                  help='A field to write on every matching object. This option may be sent multiple times.')
+    @click.option('--dry-run', is_flag=True, default=False,
+                  help='Only count the matching objects; do not modify them.')
+    @click.option('--concurrency', type=click.IntRange(1), required=False,
+                  help='The most requests to send at the same time. Defaults to the pool_maxsize setting.')
+    def bulk_modify(self, filters=(), values=(), dry_run=False, concurrency=None):
+        """Modify every object that matches the given filters.
+
+        The matching objects are read by ID order, and each one whose fields differ from the values given
+        is modified, with many requests in flight at once.
+
+        =====API DOCS=====
+        Modify every object that matches the given filters.
+
+        :param filters: Queries that the objects must match, as a dictionary or as "key=value" strings.
+        :type filters: dict
+        :param values: Fields to write on every matching object, as a dictionary or as "field=value" strings.
+        :type values: dict
+        :param dry_run: Flag that if set, only count the matching objects.
+        :type dry_run: bool
+        :param concurrency: The most requests to send at the same time.
+        :type concurrency: int
+        :returns: A dictionary of two fields: "changed", a flag indicating if any object was modified; and
+                  "count", the number of objects modified, or that match if ``dry_run`` is set.
+        :rtype: dict
+        :raises tower_cli.exceptions.UsageError: When no filters or no values are given.
+
+        =====API DOCS=====
+        """
+        filters = self._parse_pairs(filters, 'filter')
+        values = self._field_values(self._parse_pairs(values, 'set'))
+        if not values:
+            raise exc.UsageError('Give at least one field to set.')
+        if dry_run:
+            return OrderedDict((('changed', False), ('count', self._count_matching(filters))))
+
+        def modify(record):
+            if self._is_unchanged(values, record):
+                return False
+            self._send_write(record['id'], dict(values))
+            return True
+        count = sum(concurrency_utils.parallel_each(modify, self._iter_matching(filters),
+                                                    concurrency or settings.pool_maxsize))
+        return OrderedDict((('changed', count > 0), ('count', count)))
+
+    @resources.command(use_fields_as_options=False, no_args_is_help=False)
+    @click.option('--filter', 'filters', multiple=True, metavar='KEY=VALUE',
+                  help='A query to match the objects by, such as name__startswith=old-. This option may be '
+                       'sent multiple times, and at least one is required.')
+    @click.option('--dry-run', is_flag=True, default=False,
+                  help='Only count the matching objects; do not delete them.')
+    @click.option('--concurrency', type=click.IntRange(1), required=False,
+                  help='The most requests to send at the same time. Defaults to the pool_maxsize setting.')
+    def bulk_delete(self, filters=(), dry_run=False, concurrency=None):
+        """Delete every object that matches the given filters.
+
+        The matching objects are read by ID order and deleted with many requests in flight at once.
+
+        =====API DOCS=====
+        Delete every object that matches the given filters.
+
+        :param filters: Queries that the objects must match, as a dictionary or as "key=value" strings.
+        :type filters: dict
+        :param dry_run: Flag that if set, only count the matching objects.
+        :type dry_run: bool
+        :param concurrency: The most requests to send at the same time.
+        :type concurrency: int
+        :returns: A dictionary of two fields: "changed", a flag indicating if any object was deleted; and
+                  "count", the number of objects deleted, or that match if ``dry_run`` is set.
+        :rtype: dict
+        :raises tower_cli.exceptions.UsageError: When no filters are given.
+
+        =====API DOCS=====
+        """
+        filters = self._parse_pairs(filters, 'filter')
+        if dry_run:
+            return OrderedDict((('changed', False), ('count', self._count_matching(filters))))
+
+        def delete(record):
+            try:
+                client.delete('%s%s/' % (self.endpoint, record['id']))
+            except exc.NotFound:
+                return False
+            self._forget_indexed(record['id'], record)
+            return True
+        count = sum(concurrency_utils.parallel_each(delete, self._iter_matching(filters),
+                                                    concurrency or settings.pool_maxsize))
+        return OrderedDict((('changed', count > 0), ('count', count)))
+
+    def _parse_pairs(self, pairs, option):
+        """Return the given "key=value" strings, or (key, value) pairs, as a dictionary."""
+        if isinstance(pairs, dict):
+            return OrderedDict(pairs)
+        answer = OrderedDict()
+        for pair in pairs:
+            if isinstance(pair, six.string_types):
+                if '=' not in pair:
+                    raise exc.UsageError('Each --%s must be of the form key=value; got "%s".' % (option, pair))
+                pair = pair.split('=', 1)
+            answer[pair[0]] = pair[1]
+        return answer
+
+    def _field_values(self, values):
+        """Convert the given field values from the strings typed on the command line to what the fields hold,
+        resolving related objects given by name."""
+        fields = dict((field.key or field.name, field) for field in self.fields)
+        for key, value in values.items():
+            field = fields.get(key, None)
+            if field is None or not isinstance(value, six.string_types) or value == 'null':
+                continue
+            if isinstance(field.type, types.Related):
+                values[key] = self._pks_of(field.type.resource_name, [value])[0]
+            else:
+                values[key] = click.types.convert_type(field.type).convert(value, None, None)
+        return values
+
+    def _iter_matching(self, filters):
+        """Yield every object that matches the given filters, walking the listing by primary key so that
+        modifying or deleting the objects as they are read does not shift the pages still to come."""
+        if not filters:
+            raise exc.UsageError('Give at least one --filter, so as not to act on every object.')
+        return self.iter_list(all_pages=True, pagination='keyset', query=list(filters.items()))
+
+    def _count_matching(self, filters):
+        """Return the number of objects that match the given filters, from a listing of one record."""
+        if not filters:
+            raise exc.UsageError('Give at least one --filter, so as not to act on every object.')
+        return self.read(page_size=1, query=list(filters.items()))['count']
+
 
 class ReadOnlyResource(BaseResource):
     abstract = True
-    disabled_methods = set(['_assoc', '_disassoc', '_get_patch_url', 'delete', 'write'])
+    disabled_methods = set(['_assoc', '_assoc_many', '_disassoc', '_disassoc_many', '_get_patch_url', '_sync_assoc',
+                            'async_delete', 'async_write', 'bulk_write', 'delete', 'write'])
 
 
-class MonitorableResource(BaseResource):
+class MonitorableResource(AsyncMonitorableMixin, BaseResource):
     """A resource that is able to be tied to a running task, such as a job or project, and thus able to be monitored.
     """
     abstract = True  # Not inherited.
 
+    # Whether `stdout` downloads the standard out of the jobs as plain text, rather than getting it from
+    # `lookup_stdout`.
+    stdout_download = True
+
     def __init__(self, *args, **kwargs):
         if not hasattr(self, 'unified_job_type'):
             self.unified_job_type = self.endpoint
@@ -759,16 +1624,21 @@ class MonitorableResource(BaseResource):
         """
         Internal utility function to return standard out. Requires the pk of a unified job.
         """
+        stdout_url, payload = self._stdout_request(pk, start_line, end_line)
+        debug.log('Requesting a copy of job standard output', header='details')
+        resp = client.get(stdout_url, params=payload).json()
+        content = b64decode(resp['content'])
+        return content.decode('utf-8', 'replace')
+
+    def _stdout_request(self, pk, start_line=None, end_line=None):
+        """Return the URL and query parameters with which `lookup_stdout` asks for standard out."""
         stdout_url = '%s%s/stdout/' % (self.unified_job_type, pk)
         payload = {'format': 'json', 'content_encoding': 'base64', 'content_format': 'ansi'}
         if start_line:
             payload['start_line'] = start_line
         if end_line:
             payload['end_line'] = end_line
-        debug.log('Requesting a copy of job standard output', header='details')
-        resp = client.get(stdout_url, params=payload).json()
-        content = b64decode(resp['content'])
-        return content.decode('utf-8', 'replace')
+        return stdout_url, payload
 
     @resources.command
     @click.option('--start-line', required=False, type=int, help='Line at which to start printing the standard out.')
@@ -812,18 +1682,81 @@ class MonitorableResource(BaseResource):
             unified_job = self.get(**kwargs)
             pk = unified_job['id']
 
-        content = self.lookup_stdout(pk, start_line, end_line)
         opened = False
         if isinstance(outfile, six.string_types):
             outfile = open(outfile, 'w')
             opened = True
-        if len(content) > 0:
-            click.echo(content, nl=1, file=outfile)
-        if opened:
-            outfile.close()
+        try:
+            if self.stdout_download:
+                self.stream_stdout(pk, outfile, start_line, end_line)
+            else:
+                content = self.lookup_stdout(pk, start_line, end_line)
+                if len(content) > 0:
+                    click.echo(content, nl=1, file=outfile)
+        finally:
+            if opened:
+                outfile.close()
 
         return {"changed": False}
 
+    def stream_stdout(self, pk, outfile=sys.stdout, start_line=None, end_line=None):
+        """
+        =====API DOCS=====
+        Write the standard out of a unified job to a file as it is downloaded, a chunk at a time, so that
+        memory use does not grow with the size of the output.
+
+        :param pk: Primary key of the job resource object whose standard out to write.
+        :type pk: int
+        :param outfile: The file to write the standard out to.
+        :type outfile: file
+        :param start_line: Line at which to start writing, counting from 0.
+        :type start_line: int
+        :param end_line: Line before which to stop writing.
+        :type end_line: int
+        :returns: The number of characters written.
+        :rtype: int
+
+        =====API DOCS=====
+        """
+        # The download formats are the only ones that Tower serves for output of any size, and it does not
+        # cut them to a range of lines, so the range is picked out here as the lines go by.
+        stdout_url = '%s%s/stdout/' % (self.unified_job_type, pk)
+        debug.log('Downloading job standard output', header='details')
+        response = client.get(stdout_url, params={'format': 'ansi_download'}, stream=True)
+        decoder = codecs.getincrementaldecoder('utf-8')('replace')
+        written, line, last = 0, 0, ''
+        try:
+            for chunk in itertools.chain(response.iter_content(STDOUT_CHUNK_SIZE), [None]):
+                text = decoder.decode(b'', final=True) if chunk is None else decoder.decode(chunk)
+                if start_line or end_line:
+                    text, line = self._line_range(text, line, start_line or 0, end_line)
+                if text:
+                    click.echo(text, nl=False, file=outfile)
+                    written, last = written + len(text), text[-1]
+                if end_line and line >= end_line:
+                    break
+        finally:
+            response.close()
+        if written and last != '\n':
+            click.echo('', file=outfile)
+        return written
+
+    def _line_range(self, text, line, start_line, end_line):
+        """Return the part of `text` that falls within the range of lines, given that it starts on line number
+        `line`, and the number of the line that the text after it starts on."""
+        kept = []
+        pos = 0
+        while pos < len(text) and (end_line is None or line < end_line):
+            newline = text.find('\n', pos)
+            stop = len(text) if newline < 0 else newline + 1
+            if line >= start_line:
+                kept.append(text[pos:stop])
+            if newline < 0:
+                break
+            line += 1
+            pos = stop
+        return ''.join(kept), line
+
     @resources.command
     @click.option('--interval', default=0.2, help='Polling interval to refresh content from Tower.')
     @click.option('--timeout', required=False, type=int,
@@ -842,7 +1775,8 @@ class MonitorableResource(BaseResource):
         :type parent_pk: int
         :param timeout: Number in seconds after which this method will time out.
         :type timeout: float
-        :param interval: Polling interval to refresh content from Tower.
+        :param interval: Polling interval to refresh content from Tower. While a job writes no output, polls
+                         slow down to one every few seconds.
         :type interval: float
         :param outfile: Alternative file than stdout to write job stdout to.
         :type outfile: file
@@ -862,18 +1796,40 @@ class MonitorableResource(BaseResource):
         # If we do not have the unified job info, infer it from parent
         if pk is None:
             pk = self.last_job_data(parent_pk, **kwargs)['id']
-        job_endpoint = '%s%s/' % (self.unified_job_type, pk)
 
         # Pause until job is in running state
         self.wait(pk, exit_on=['running', 'successful'], outfile=outfile)
 
-        # Loop initialization
+        click.echo('\033[0;91m------Starting Standard Out Stream------\033[0m', nl=2, file=outfile)
+
+        if self.unified_job_type in EVENT_ENDPOINTS:
+            result = self._monitor_events(pk, timeout, interval, outfile)
+        else:
+            result = self._monitor_stdout(pk, timeout, interval, outfile)
+
+        click.echo('\033[0;91m------End of Standard Out Stream--------\033[0m', nl=2, file=outfile)
+
+        if result['failed']:
+            raise exc.JobFailure('Job failed.')
+
+        # Return the job ID and other response data
+        answer = OrderedDict((('changed', True), ('id', pk)))
+        answer.update(result)
+        # Make sure to return ID of resource and not update number relevant for project creation and update
+        if parent_pk:
+            answer['id'] = parent_pk
+        else:
+            answer['id'] = pk
+        return answer
+
+    def _monitor_stdout(self, pk, timeout, interval, outfile):
+        """Write the standard out of a running job to the out file by reading it again from the last line
+        written on every poll, and return the finished job."""
+        job_endpoint = '%s%s/' % (self.unified_job_type, pk)
         start = time.time()
         start_line = 0
         result = client.get(job_endpoint).json()
 
-        click.echo('\033[0;91m------Starting Standard Out Stream------\033[0m', nl=2, file=outfile)
-
         # Poll the Ansible Tower instance for status and content, and print standard out to the out file
         while not result['failed'] and result['status'] != 'successful':
 
@@ -898,29 +1854,126 @@ class MonitorableResource(BaseResource):
         # Special final line for closure with workflow jobs
         if self.endpoint == '/workflow_jobs/':
             click.echo(self.lookup_stdout(pk, start_line, full=True), nl=1)
+        return result
 
-        click.echo('\033[0;91m------End of Standard Out Stream--------\033[0m', nl=2, file=outfile)
+    def _monitor_events(self, pk, timeout, interval, outfile):
+        """Write the standard out of a running job to the out file one event at a time, following the events
+        of the job by their counter, and return the finished job.
 
-        if result['failed']:
-            raise exc.JobFailure('Job failed.')
+        Only events newer than the last one written are asked for, along with any that Tower saved late below
+        it, so each poll costs one small page while the job is quiet. The job itself is read only when no
+        events arrived, as a job that is writing output is still running, or once the terminal event of the
+        playbook and every event before it have been written. The polls slow down while
+        the job is quiet, up to `MAX_MONITOR_INTERVAL` seconds, and speed up again as soon as events arrive.
 
-        # Return the job ID and other response data
-        answer = OrderedDict((('changed', True), ('id', pk)))
-        answer.update(result)
-        # Make sure to return ID of resource and not update number relevant for project creation and update
-        if parent_pk:
-            answer['id'] = parent_pk
-        else:
-            answer['id'] = pk
-        return answer
+        Versions of Tower that have no events endpoint for the job answer 404, and the job is then followed by
+        its standard out instead.
+        """
+        job_endpoint = '%s%s/' % (self.unified_job_type, pk)
+        start = time.time()
+        cursor = {'counter': 0, 'top': 0, 'seen': set(), 'terminal': False, 'finished': False}
+        poll = interval
+
+        while True:
+            if not cursor['finished']:
+                try:
+                    count, full = self._write_events(pk, cursor, outfile)
+                except exc.NotFound:
+                    if cursor['top']:
+                        raise
+                    debug.log('There are no events for this job; following its standard out.', header='details')
+                    return self._monitor_stdout(pk, timeout, interval, outfile)
+            else:
+                count, full = 0, False
+            if count and not cursor['finished']:
+                poll = interval
+            else:
+                result = client.get(job_endpoint).json()
+                if result['failed'] or result['status'] == 'successful':
+                    break
+                poll = min(max(poll * 2, interval), max(MAX_MONITOR_INTERVAL, interval))
+
+            if timeout and time.time() - start > timeout:
+                raise exc.Timeout('Monitoring aborted due to timeout.')
+
+            # A full page means that more events are waiting; read them at once.
+            if not full:
+                time.sleep(poll)
+
+        # Events are saved a little after they happen, so some may arrive after the job has finished; read
+        # until no more arrive, asking again for any that are missing.
+        while not cursor['finished'] and self._write_events(pk, cursor, outfile)[0]:
+            pass
+        return result
+
+    def _write_events(self, pk, cursor, outfile):
+        """Write the standard out of the events of a job that the cursor has not written yet, and return how
+        many events were written and whether the page of new events was full.
+
+        Tower saves events out of order, so an event may arrive after others with higher counters. The
+        cursor keeps the counter below which every event has been written, and the counters written above
+        it; the missing counters between are asked for again on every call, along with the events after the
+        highest counter written."""
+        events_url, requests = self._event_requests(pk, cursor)
+        events = []
+        for params in requests:
+            response = client.get(events_url, params=params).json()
+            events += response['results']
+        self._note_page_size(requests[-1], response)
+        return self._take_events(cursor, events, outfile), bool(response.get('next', None))
+
+    def _event_requests(self, pk, cursor):
+        """Return the URL of the events of a job, and the query parameters of the requests for the events
+        that the cursor has not written yet: one for the missing counters, if any, and one for the events
+        after the highest counter written, last."""
+        events_url = '%s%s/%s' % (self.unified_job_type, pk, EVENT_ENDPOINTS[self.unified_job_type])
+        requests = []
+        missing = [six.text_type(counter) for counter in range(cursor['counter'] + 1, cursor['top'])
+                   if counter not in cursor['seen']]
+        if missing:
+            chunk = next(self._chunk_values(missing))
+            debug.log('Requesting %d missing job events.' % len(chunk), header='details')
+            requests.append({'counter__in': ','.join(chunk), 'order_by': 'counter'})
+        params = {'counter__gt': cursor['top'], 'order_by': 'counter'}
+        self._set_all_pages_size(params)
+        debug.log('Requesting job events after %d.' % cursor['top'], header='details')
+        requests.append(params)
+        return events_url, requests
+
+    def _take_events(self, cursor, events, outfile):
+        """Write the standard out of the events that the cursor has not written yet, move the cursor past
+        them, and return how many were written."""
+        written = 0
+        for event in events:
+            counter = event['counter']
+            if counter <= cursor['counter'] or counter in cursor['seen']:
+                continue
+            cursor['seen'].add(counter)
+            cursor['top'] = max(cursor['top'], counter)
+            written += 1
+            if event.get('stdout', None):
+                click.echo(event['stdout'], file=outfile)
+            if event.get('event', None) in TERMINAL_EVENTS:
+                cursor['terminal'] = True
+        while cursor['counter'] + 1 in cursor['seen']:
+            cursor['counter'] += 1
+            cursor['seen'].remove(cursor['counter'])
+        cursor['finished'] = cursor['terminal'] and cursor['counter'] >= cursor['top']
+        return written
 
     @resources.command
     @click.option('--min-interval', default=1, help='The minimum interval to request an update from Tower.')
     @click.option('--max-interval', default=30, help='The maximum interval to request an update from Tower.')
     @click.option('--timeout', required=False, type=int,
                   help='If provided, this command (not the job) will time out after the given number of seconds.')
+    @click.option('--id', 'pks', multiple=True, type=int,
+                  help='A job to wait on, along with any other given. This option may be sent multiple times.')
+    @click.option('--mode', type=click.Choice(['all', 'any']), default='all', show_default=True,
+                  help='Whether to wait on every job given with --id to finish, or only on the first.')
+    @click.option('--fail-fast', is_flag=True, default=False,
+                  help='Stop waiting as soon as one of the jobs given with --id fails.')
     def wait(self, pk, parent_pk=None, min_interval=1, max_interval=30, timeout=None, outfile=sys.stdout,
-             exit_on=['successful'], **kwargs):
+             exit_on=['successful'], pks=(), mode='all', fail_fast=False, **kwargs):
         """
         Wait for a running job to finish. Blocks further input until the job completes (whether successfully
         or unsuccessfully) and a final status can be given.
@@ -943,17 +1996,33 @@ class MonitorableResource(BaseResource):
         :type outfile: file
         :param exit_on: Job resource object statuses to wait on.
         :type exit_on: array
+        :param pks: Primary keys of further job resource objects to wait on together with ``pk``, as
+                    ``wait_many`` does.
+        :type pks: list
+        :param mode: With ``pks``, either "all" to wait on every job to finish, or "any" to wait on the first.
+        :type mode: str
+        :param fail_fast: With ``pks``, flag that if set, stop waiting as soon as one of the jobs fails.
+        :type fail_fast: bool
         :param `**kwargs`: Keyword arguments used to look up job resource object to wait if ``pk`` is
                            not provided.
         :returns: A dictionary combining the JSON output of the status-changed job resource object, as well
                   as two extra fields: "changed", a flag indicating if the job resource object is status-changed
                   as expected; "id", an integer which is the primary key of the job resource object being
-                  status-changed.
+                  status-changed. With ``pks``, the dictionary that ``wait_many`` returns.
         :rtype: dict
         :raises tower_cli.exceptions.Timeout: When wait time reaches time out.
         :raises tower_cli.exceptions.JobFailure: When the job being waited on runs into failure.
         =====API DOCS=====
         """
+        if pks:
+            answer = self.wait_many(([pk] if pk else []) + list(pks), mode=mode, fail_fast=fail_fast,
+                                    min_interval=min_interval, max_interval=max_interval, timeout=timeout,
+                                    outfile=outfile)
+            if answer['failed']:
+                raise exc.JobFailure('Jobs %s failed.' % ', '.join(
+                    str(result['id']) for result in answer['results'] if result.get('failed', False)))
+            return answer
+
         # If we do not have the unified job info, infer it from parent
         if pk is None:
             pk = self.last_job_data(parent_pk, **kwargs)['id']
@@ -1038,6 +2107,74 @@ class MonitorableResource(BaseResource):
             answer['id'] = pk
         return answer
 
+    def wait_many(self, pks, mode='all', fail_fast=False, min_interval=1, max_interval=30, timeout=None,
+                  outfile=sys.stdout):
+        """
+        =====API DOCS=====
+        Wait for many jobs to finish at once.
+
+        Every job still running is polled with the same few ``id__in`` queries of the unified jobs listing,
+        and jobs drop out of the polls as they finish, so the number of requests grows with the number of
+        polls rather than with the number of jobs. Jobs of any kind may be waited on together.
+
+        :param pks: Primary keys of the job resource objects to wait on.
+        :type pks: list
+        :param mode: Either "all" to wait on every job to finish, or "any" to wait on the first to finish.
+        :type mode: str
+        :param fail_fast: Flag that if set, raise as soon as one of the jobs fails.
+        :type fail_fast: bool
+        :param min_interval: Minimum polling interval to request an update from Tower.
+        :type min_interval: float
+        :param max_interval: Maximum polling interval to request an update from Tower.
+        :type max_interval: float
+        :param timeout: Number in seconds after which this method will time out.
+        :type timeout: float
+        :param outfile: Alternative file than stdout to write a line on as each job finishes.
+        :type outfile: file
+        :returns: A dictionary of three fields: "changed", which is always true; "failed", a flag indicating
+                  if any job that finished failed; and "results", the unified job record of each job, in the
+                  order given, as last read.
+        :rtype: dict
+        :raises tower_cli.exceptions.UsageError: When the mode is neither "all" nor "any".
+        :raises tower_cli.exceptions.NotFound: When some of the jobs do not exist.
+        :raises tower_cli.exceptions.Timeout: When wait time reaches time out.
+        :raises tower_cli.exceptions.JobFailure: When one of the jobs fails and ``fail_fast`` is set.
+
+        =====API DOCS=====
+        """
+        if mode not in ('all', 'any'):
+            raise exc.UsageError('The mode must be "all" or "any", not "%s".' % mode)
+        unified_jobs = get_resource('unified_job')
+        records = OrderedDict((int(pk), None) for pk in pks)
+        outstanding = list(records)
+        interval = min_interval
+        start = time.time()
+
+        while outstanding:
+            found = unified_jobs.get_many(outstanding, field='id')
+            for pk in list(outstanding):
+                record = records[pk] = found[six.text_type(pk)]
+                if not record.get('failed', False) and record['status'] not in FINISHED_STATUSES:
+                    continue
+                outstanding.remove(pk)
+                click.echo('Job %d finished: %s' % (pk, record['status']), file=outfile)
+                if record.get('failed', False) and fail_fast:
+                    raise exc.JobFailure('Job %d failed.' % pk)
+            if not outstanding or (mode == 'any' and len(outstanding) < len(records)):
+                break
+            if timeout and time.time() - start > timeout:
+                raise exc.Timeout('Waiting aborted due to timeout.')
+            time.sleep(interval)
+            interval = min(interval * 1.5, max_interval)
+
+        results = []
+        for pk, record in records.items():
+            result = OrderedDict((('id', pk),))
+            result.update(record)
+            results.append(result)
+        failed = any(result.get('failed', False) for result in results if result['id'] not in outstanding)
+        return OrderedDict((('changed', True), ('failed', failed), ('results', results)))
+
 
 class ExeResource(MonitorableResource):
     """Executable resource - defines status and cancel methods"""
@@ -123,9 +123,11 @@ class ManyToManyField(BaseField):
     :param relationship: The API related name for the relationship. Example,
                          "admins" relationship from org->users
     :param method_name: The name CLI alias for the relationship in method names.
+    :param many_only: Whether to leave out the methods that associate and disassociate
+                      one object at a time, where the other resource already has them.
     """
     def __init__(self, other_name, res_name=None,
-                 relationship=None, method_name=None):
+                 relationship=None, method_name=None, many_only=False):
         # If not defined here, the following fields may be set by the
         # resource metaclass:
         # res_name - inferred from the endpoint of the resource
@@ -139,6 +141,7 @@ class ManyToManyField(BaseField):
         self.other_name = other_name
         self.res_name = res_name
         self.relationship = relationship
+        self.many_only = many_only
         self.method_name = None
         self._set_method_names(method_name, relationship)
 
@@ -173,6 +176,9 @@ class ManyToManyField(BaseField):
             return
         self.associate_method_name = 'associate{}'.format(suffix)
         self.disassociate_method_name = 'disassociate{}'.format(suffix)
+        self.associate_many_method_name = 'associate_many{}'.format(suffix)
+        self.disassociate_many_method_name = 'disassociate_many{}'.format(suffix)
+        self.sync_method_name = 'sync{}'.format(suffix)
 
     @property
     def associate_method(self):
@@ -182,6 +188,18 @@ class ManyToManyField(BaseField):
     def disassociate_method(self):
         return self._produce_method(disassociate=True)
 
+    @property
+    def associate_many_method(self):
+        return self._produce_many_method('_assoc_many', 'associate')
+
+    @property
+    def disassociate_many_method(self):
+        return self._produce_many_method('_disassoc_many', 'disassociate')
+
+    @property
+    def sync_method(self):
+        return self._produce_many_method('_sync_assoc', 'sync')
+
     def _produce_raw_method(self):
         '''
         Returns a callable which becomes the associate or disassociate
@@ -231,6 +249,87 @@ class ManyToManyField(BaseField):
             method.__doc__ = self._produce_doc()
         return method
 
+    def _produce_many_method(self, internal_name, action):
+        '''
+        Returns the associate_many, disassociate_many or sync method for
+        the related field, which changes the relationship for many
+        objects at once.
+        '''
+
+        def method(res_self, concurrency=None, **kwargs):
+            obj_pk = kwargs.get(method._res_name)
+            other_obj_pks = kwargs.get(method._other_name) or ()
+            internal_method = getattr(res_self, method._internal_name)
+            return internal_method(method._relationship, obj_pk, other_obj_pks, method._other_name,
+                                   concurrency=concurrency)
+
+        method = click.option(
+            '--concurrency', type=click.IntRange(1), required=False,
+            help='The most requests to send at the same time. Defaults to the pool_maxsize setting.'
+        )(method)
+        method = click.option(
+            '--{}'.format(self.other_name.replace('_', '-')),
+            multiple=True, required=(action != 'sync'),
+            help='Primary key or name of a {}. This option may be sent multiple times.'.format(self.other_name)
+        )(method)
+        method = click.option(
+            '--{}'.format(self.res_name.replace('_', '-')),
+            type=types.Related(self.res_name),
+            required=True
+        )(method)
+
+        method._cli_command = True
+        method._cli_command_attrs = dict(use_fields_as_options=False)
+
+        method._relationship = self.relationship
+        method._res_name = self.res_name
+        method._other_name = self.other_name
+        method._internal_name = internal_name
+        method.__doc__ = self._produce_many_doc(action)
+        return method
+
+    def _produce_many_doc(self, action):
+        doc_relation = self.method_name if self.method_name else grammar.singularize(self.relationship)
+        names = dict(
+            action=action,
+            title_action=action.title(),
+            status=doc_relation,
+            res_name=self.res_name,
+            other_name=self.other_name,
+        )
+        if action == 'sync':
+            summary = 'Make the given {status}s the only {status}s of this {res_name}.'
+            detail = 'Only the {status}s that are missing are associated, and only the others disassociated.'
+            returns = ('Dictionary of three keys: "changed", which indicates whether any {status} was '
+                       'associated or disassociated, and "associated" and "disassociated", the numbers of each.')
+        else:
+            summary = '{title_action} many {status}s with this {res_name} at once.'
+            detail = 'Only the {status}s that are not {action}d already are sent to Tower.'
+            returns = ('Dictionary of two keys: "changed", which indicates whether any {status} was {action}d, '
+                       'and "count", the number of {status}s {action}d.')
+        names.update(summary=summary.format(**names), detail=detail.format(**names), returns=returns.format(**names))
+        return """{summary}
+
+        {detail}
+
+        =====API DOCS=====
+        {summary}
+
+        The {status}s of the {res_name} are listed once, and only the changes are posted, on a pool of
+        worker threads.
+
+        :param {res_name}: Primary key or name of the {res_name}.
+        :type {res_name}: str
+        :param {other_name}: Primary keys or names of the {other_name}s.
+        :type {other_name}: list
+        :param concurrency: The most requests to send at the same time.
+        :type concurrency: int
+        :returns: {returns}
+        :rtype: dict
+
+        =====API DOCS=====
+        """.format(**names)
+
     def _produce_doc(self, action='associate'):
         doc_relation = self.method_name if self.method_name else grammar.singularize(self.relationship)
         return """{title_action} {status_article} {status} with this {res_name}.
@@ -38,11 +38,28 @@ class Resource(models.BaseResource):
             raise AttributeError
         return super(Resource, self).__getattribute__(attr)
 
+    pagination = 'keyset'
+
     def list(self, *args, **kwargs):
+        self._order_newest_first(kwargs, kwargs.get('all_pages', False))
+        return super(Resource, self).list(*args, **kwargs)
+
+    list.stream_method = 'iter_list'
+
+    def iter_list(self, *args, **kwargs):
+        self._order_newest_first(kwargs, kwargs.get('all_pages', True))
+        return super(Resource, self).iter_list(*args, **kwargs)
+
+    @staticmethod
+    def _order_newest_first(kwargs, all_pages):
+        '''
+        Show the newest activity first unless told otherwise; when walking every
+        page, order by ID (which follows the timestamp) so the pages can be read
+        by keyset
+        '''
         if ('order_by' not in kwargs and
                 ('query' not in kwargs or not kwargs['query'])):
-            kwargs['query'] = (('order_by', '-timestamp'),)
-        return super(Resource, self).list(*args, **kwargs)
+            kwargs['query'] = (('order_by', '-id' if all_pages else '-timestamp'),)
 
     @staticmethod
     def _promote_actor(d):
@@ -105,8 +105,7 @@ class Resource(models.ExeResource):
         =====API DOCS=====
         """
         # This feature only exists for versions 2.2 and up
-        r = client.get('/')
-        if 'ad_hoc_commands' not in r.json():
+        if not client.get_capability('ad_hoc_commands'):
             raise exc.TowerCLIError('Your host is running an outdated version'
                                     'of Ansible Tower that can not run '
                                     'ad-hoc commands (2.2 or earlier)')
@@ -32,6 +32,8 @@ class Resource(models.Resource):
     variables = models.Field(type=types.Variables(), required=False, display=False,
                              help_text='Group variables, use "@" to get from file.')
 
+    hosts = models.ManyToManyField('host', method_name='host', many_only=True)
+
     def lookup_with_inventory(self, group, inventory=None):
         group_res = get_resource('group')
         if isinstance(group, int) or group.isdigit():
@@ -107,6 +109,22 @@ class Resource(models.Resource):
 
         =====API DOCS=====
         """
+        self._prepare_list(root, kwargs)
+        # If we are tasked with getting root groups, do that.
+        if root:
+            return self._root_groups(kwargs['inventory'])
+        # Return the superclass implementation.
+        return super(Resource, self).list(**kwargs)
+
+    list.stream_method = 'iter_list'
+
+    def iter_list(self, root=False, **kwargs):
+        self._prepare_list(root, kwargs)
+        if root:
+            return iter(self._root_groups(kwargs['inventory'])['results'])
+        return super(Resource, self).iter_list(**kwargs)
+
+    def _prepare_list(self, root, kwargs):
         # Option to list children of a parent group
         if kwargs.get('parent', None):
             self.set_child_endpoint(parent=kwargs['parent'], inventory=kwargs.get('inventory', None))
@@ -114,13 +132,10 @@ class Resource(models.Resource):
         # Sanity check: If we got `--root` and no inventory, that's an error.
         if root and not kwargs.get('inventory', None):
             raise exc.UsageError('The --root option requires specifying an inventory also.')
-        # If we are tasked with getting root groups, do that.
-        if root:
-            inventory_id = kwargs['inventory']
-            r = client.get('/inventories/%d/root_groups/' % inventory_id)
-            return r.json()
-        # Return the superclass implementation.
-        return super(Resource, self).list(**kwargs)
+
+    def _root_groups(self, inventory_id):
+        r = client.get('/inventories/%d/root_groups/' % inventory_id)
+        return r.json()
 
     @resources.command(use_fields_as_options=False)
     @click.option('--group', help='The group to move.')
@@ -13,11 +13,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+
 import click
+import six
 
 from tower_cli import models, resources
 from tower_cli.cli import types
 from tower_cli.api import client
+from tower_cli.utils import concurrency as concurrency_utils, debug
+from tower_cli.utils.data_structures import OrderedDict
+
+
+# The fields that the bulk host_create endpoint accepts for each host, and the most hosts that AWX accepts in
+# one request by default.
+BULK_HOST_FIELDS = frozenset(['name', 'description', 'enabled', 'variables', 'instance_id'])
+BULK_HOST_CREATE_LIMIT = 100
 
 
 class Resource(models.Resource):
@@ -59,11 +70,55 @@ class Resource(models.Resource):
 
         =====API DOCS=====
         """
+        self._add_host_queries(kwargs, group, host_filter)
+        return super(Resource, self).list(**kwargs)
+
+    list.stream_method = 'iter_list'
+
+    def iter_list(self, group=None, host_filter=None, **kwargs):
+        self._add_host_queries(kwargs, group, host_filter)
+        return super(Resource, self).iter_list(**kwargs)
+
+    def _add_host_queries(self, kwargs, group=None, host_filter=None):
         if group:
             kwargs['query'] = kwargs.get('query', ()) + (('groups__in', group),)
         if host_filter:
             kwargs['query'] = kwargs.get('query', ()) + (('host_filter', host_filter),)
-        return super(Resource, self).list(**kwargs)
+
+    def _bulk_create(self, records, concurrency=None):
+        """Create hosts with the bulk host_create endpoint, if the server offers it, in batches of hosts of one
+        inventory each."""
+        if 'host_create' not in client.get_capability('bulk'):
+            return {}
+        batches = collections.defaultdict(list)
+        for i, record in records.items():
+            if record.get('inventory', None) and set(record) - set(['inventory']) <= BULK_HOST_FIELDS and \
+                    'null' not in record.values():
+                batches[record['inventory']].append(i)
+        chunks = [(inventory, positions[start:start + BULK_HOST_CREATE_LIMIT])
+                  for inventory, positions in batches.items()
+                  for start in range(0, len(positions), BULK_HOST_CREATE_LIMIT)]
+
+        def create(chunk):
+            inventory, positions = chunk
+            hosts = [dict((k, v) for k, v in records[i].items() if k != 'inventory') for i in positions]
+            debug.log('Creating %d hosts in inventory %s at once.' % (len(hosts), inventory), header='details')
+            created = client.post('/bulk/host_create/', data={'inventory': inventory, 'hosts': hosts}).json()
+            by_name = dict((six.text_type(host['name']), host) for host in created['hosts'])
+            answers = {}
+            for i in positions:
+                host = by_name[six.text_type(records[i]['name'])]
+                answer = OrderedDict((('changed', True), ('id', host['id'])))
+                answer.update(host)
+                answer['inventory'] = inventory
+                self._forget_indexed(answer['id'], answer)
+                answers[i] = answer
+            return answers
+
+        answers = {}
+        for chunk_answers in concurrency_utils.parallel_map(create, chunks, concurrency):
+            answers.update(chunk_answers)
+        return answers
 
     @resources.command(ignore_defaults=True)
     def list_facts(self, pk=None, **kwargs):
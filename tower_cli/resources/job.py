@@ -14,19 +14,46 @@
 # limitations under the License.
 
 from __future__ import absolute_import, unicode_literals
+import collections
+import json
+import sys
+import time
 from getpass import getpass
 from distutils.version import LooseVersion
 
 import click
+import six
 
 from tower_cli import models, get_resource, resources, exceptions as exc
 from tower_cli.api import client
+from tower_cli.conf import settings
 from tower_cli.cli import types
-from tower_cli.utils import debug, parser
+from tower_cli.models.base import FINISHED_STATUSES
+from tower_cli.utils import concurrency as concurrency_utils, debug, parser
+from tower_cli.utils.data_structures import OrderedDict
 
 
 PROMPT_LIST = ['diff_mode', 'limit', 'tags', 'skip_tags', 'job_type', 'verbosity', 'inventory', 'credential']
 
+# The fields of a job in a request to the bulk job_launch endpoint, keyed by the `launch` options they come
+# from, and the most jobs that AWX launches from one request by default.
+BULK_LAUNCH_FIELDS = {
+    'credential': 'credentials',
+    'diff_mode': 'diff_mode',
+    'extra_vars': 'extra_data',
+    'inventory': 'inventory',
+    'job_type': 'job_type',
+    'limit': 'limit',
+    'skip_tags': 'skip_tags',
+    'tags': 'job_tags',
+    'verbosity': 'verbosity',
+}
+BULK_JOB_LAUNCH_LIMIT = 100
+
+# How long the launch metadata of a job template (its defaults, ask_*_on_launch flags and needed passwords) is
+# reused for, in seconds, so that many launches of one template in a row read it once.
+LAUNCH_METADATA_TTL = 30
+
 
 class Resource(models.ExeResource):
     """A resource for jobs.
@@ -76,8 +103,11 @@ class Resource(models.ExeResource):
                   help='Specify inventory for job template to run.')
     @click.option('--credential', required=False, multiple=True, type=types.Related('credential'),
                   help='Specify any type of credential(s) for job template to run.')
+    @click.option('--no-preflight', is_flag=True, default=False,
+                  help='Launch with exactly the options given, without reading the launch requirements of the '
+                       'job template first. Credentials given replace those of the job template.')
     def launch(self, job_template=None, monitor=False, wait=False,
-               timeout=None, no_input=True, extra_vars=None, **kwargs):
+               timeout=None, no_input=True, extra_vars=None, no_preflight=False, **kwargs):
         """Launch a new job based on a job template.
 
         Creates a new job in Ansible Tower, immediately starts it, and
@@ -116,17 +146,25 @@ class Resource(models.ExeResource):
         :type inventory: str
         :param credential: Specify machine credential for job template to run.
         :type credential: str
+        :param no_preflight: Flag that if set, launch with exactly the options given, without reading the launch
+                             requirements of the job template first; there are no prompts, and credentials
+                             given replace those of the job template.
+        :type no_preflight: bool
         :returns: Result of subsequent ``monitor`` call if ``monitor`` flag is on; Result of subsequent
-                  ``wait`` call if ``wait`` flag is on; Result of subsequent ``status`` call if none of
-                  the two flags are on.
+                  ``wait`` call if ``wait`` flag is on; otherwise the loaded JSON of the launched job, as
+                  ``status`` with ``detail`` on returns it, along with the extra field "changed". Tower
+                  versions that answer the launch with the job are not asked for it again, and the job is
+                  then given as the launch answered.
         :rtype: dict
 
         =====API DOCS=====
         """
-        # Get the job template from Ansible Tower.
-        # This is used as the baseline for starting the job.
-        jt_resource = get_resource('job_template')
-        jt = jt_resource.get(job_template)
+        # Everything the launch needs to know about the job template, its defaults, the options it asks for on
+        # launch and the passwords it needs, comes from one read of its launch endpoint.
+        jt_id = self._job_template_id(job_template)
+        endpoint = '/job_templates/%d/launch/' % jt_id
+        launch_info = {} if no_preflight else self._launch_metadata(jt_id)
+        defaults = launch_info.get('defaults', None)
 
         # Update the job data for special treatment of certain fields
         # Special case for job tags, historically just called --tags
@@ -141,11 +179,13 @@ class Resource(models.ExeResource):
         else:
             credentials = [cred_arg]
         if credentials:
-            if 'credentials' in jt['related']:
+            if no_preflight:
+                kwargs['credentials'] = list(credentials)
+            elif defaults is not None and 'credentials' in defaults:
                 # Has Tower 3.3 / multi-cred support
                 # combine user-provided credentials with JT credentials
                 jt_creds = set(
-                    c['id'] for c in jt['summary_fields']['credentials']
+                    c['id'] for c in defaults['credentials']
                 )
                 kwargs['credentials'] = list(set(credentials) | jt_creds)
             else:
@@ -162,8 +202,7 @@ class Resource(models.ExeResource):
         if 'extra_vars' in data and len(data['extra_vars']) > 0:
             # But only do this for versions before 2.3
             debug.log('Getting version of Tower.', header='details')
-            r = client.get('/config/')
-            if LooseVersion(r.json()['version']) < LooseVersion('2.4'):
+            if LooseVersion(client.get_capability('version')) < LooseVersion('2.4'):
                 extra_vars_list = [data['extra_vars']]
 
         # Add the runtime extra_vars to this list
@@ -172,11 +211,14 @@ class Resource(models.ExeResource):
 
         # If the job template requires prompting for extra variables,
         # do so (unless --no-input is set).
-        if jt.get('ask_variables_on_launch', False) and not no_input \
+        if launch_info.get('ask_variables_on_launch', False) and not no_input \
                 and not extra_vars:
-            # If JT extra_vars are JSON, echo them to user as YAML
+            # If JT extra_vars are JSON, echo them to user as YAML; servers
+            # that give no launch defaults only have them on the template.
+            if defaults is None:
+                defaults = get_resource('job_template').get(jt_id)
             initial = parser.process_extra_vars(
-                [jt['extra_vars']], force_json=False
+                [defaults.get('extra_vars', '')], force_json=False
             )
             initial = '\n'.join((
                 '# Specify extra variables (if any) here as YAML.',
@@ -194,7 +236,7 @@ class Resource(models.ExeResource):
         # Replace/populate data fields if prompted.
         modified = set()
         for resource in PROMPT_LIST:
-            if jt.pop('ask_' + resource + '_on_launch', False) and not no_input:
+            if launch_info.get('ask_' + resource + '_on_launch', False) and not no_input:
                 resource_object = kwargs.get(resource, None)
                 if type(resource_object) == types.Related:
                     resource_class = get_resource(resource)
@@ -214,7 +256,6 @@ class Resource(models.ExeResource):
 
         # Create the new job in Ansible Tower.
         start_data = {}
-        endpoint = '/job_templates/%d/launch/' % jt['id']
         if 'extra_vars' in data and len(data['extra_vars']) > 0:
             start_data['extra_vars'] = data['extra_vars']
         if tags:
@@ -228,10 +269,7 @@ class Resource(models.ExeResource):
         # rely on passwords entered at run-time.
         #
         # If there are any such passwords on this job, ask for them now.
-        debug.log('Asking for information necessary to start the job.',
-                  header='details')
-        job_start_info = client.get(endpoint).json()
-        for password in job_start_info.get('passwords_needed_to_start', []):
+        for password in launch_info.get('passwords_needed_to_start', []):
             start_data[password] = getpass('Password for %s: ' % password)
 
         # Actually start the job.
@@ -258,8 +296,16 @@ class Resource(models.ExeResource):
                     has_ignored_fields = True
                 debug.log('{0}: {1}'.format(key, value))
 
-        # Get some information about the running job to print
-        result = self.status(pk=job_id, detail=True)
+        # Get some information about the running job to print; newer servers
+        # answer the launch with the job itself, which saves reading it.
+        # The launch answer adds the fields "job", the ID again, and
+        # "ignored_fields" to those of the job, which are dropped to give
+        # the same result as reading the job.
+        result = job_started.json() if job_started.text else {}
+        result.pop('ignored_fields', None)
+        result.pop('job', None)
+        if 'status' not in result:
+            result = self.status(pk=job_id, detail=True)
         result['changed'] = True
 
         # If we were told to monitor the job once it started, then call
@@ -270,3 +316,228 @@ class Resource(models.ExeResource):
             return self.wait(job_id, timeout=timeout)
 
         return result
+
+    def _job_template_id(self, job_template):
+        """Return the primary key of the job template given by primary key or name."""
+        if isinstance(job_template, six.integer_types) or six.text_type(job_template).isdigit():
+            return int(job_template)
+        jt_resource = get_resource('job_template')
+        if job_template:
+            return jt_resource.resolve(name=job_template)
+        return jt_resource.get()['id']
+
+    def _launch_metadata(self, jt_id):
+        """Return what the launch endpoint of a job template says about launching it, reading it again only
+        once it is more than `LAUNCH_METADATA_TTL` seconds old."""
+        def fetch():
+            debug.log('Asking for information necessary to start the job.', header='details')
+            return client.get('/job_templates/%d/launch/' % jt_id).json()
+        return client.get_recent('launch', jt_id, LAUNCH_METADATA_TTL, fetch)
+
+    def bulk_launch(self, launches, concurrency=None):
+        """
+        =====API DOCS=====
+        Launch many jobs, with the bulk job_launch endpoint if the server offers it.
+
+        The job templates, inventories and credentials given by name are looked up together. If the server
+        has the bulk job_launch endpoint, the jobs are launched by as few requests as possible, as the nodes
+        of workflow jobs that the server makes for them. Otherwise each job is launched with ``launch``, with
+        up to ``concurrency`` launches at the same time, and without prompts; a job template that needs
+        passwords to start cannot be launched this way.
+
+        :param launches: Dictionaries of the options to launch each job with, as the keyword arguments of
+                         ``launch``: ``job_template`` and optionally ``extra_vars``, ``diff_mode``, ``limit``,
+                         ``tags``, ``skip_tags``, ``job_type``, ``verbosity``, ``inventory`` and ``credential``.
+        :type launches: list
+        :param concurrency: The most requests to send at the same time. Defaults to the ``pool_maxsize``
+                            setting.
+        :type concurrency: int
+        :returns: A list with a dictionary for each launch, in the order of ``launches``. Each has the fields
+                  "changed" and "id", the primary key of the job. Jobs launched in bulk also have
+                  "workflow_job" and "workflow_node", the workflow job that launches them and its node for
+                  the job; their "id" is None if that workflow job had not made them yet.
+        :rtype: list
+
+        =====API DOCS=====
+        """
+        launches = [dict(launch) for launch in launches]
+        for launch in launches:
+            self._pop_none(launch)
+            if not launch.get('job_template', None):
+                raise exc.UsageError('Every launch needs a job template.')
+            if isinstance(launch.get('extra_vars', None), six.string_types):
+                launch['extra_vars'] = [launch['extra_vars']]
+        self._resolve_related(launches, related={
+            'job_template': 'job_template', 'inventory': 'inventory', 'credential': 'credential',
+        })
+        concurrency = concurrency or settings.pool_maxsize
+        supported = set(BULK_LAUNCH_FIELDS) | set(['job_template'])
+        if 'job_launch' in client.get_capability('bulk') and all(set(launch) <= supported for launch in launches):
+            return self._bulk_job_launch(launches, concurrency)
+        # Launches run on other threads, where no one can be asked for passwords; the launch metadata read
+        # here on the main thread is also the one those launches reuse.
+        for jt_id in sorted(set(launch['job_template'] for launch in launches if not launch.get('no_preflight'))):
+            passwords = self._launch_metadata(self._job_template_id(jt_id)).get('passwords_needed_to_start', [])
+            if passwords:
+                raise exc.UsageError('Job template %s needs passwords to start (%s), which a bulk launch cannot '
+                                     'ask for.' % (jt_id, ', '.join(passwords)))
+        debug.log('Launching %d jobs one at a time.' % len(launches), header='details')
+        return concurrency_utils.parallel_map(lambda launch: self.launch(no_input=True, **launch), launches,
+                                              concurrency)
+
+    def _bulk_job_launch(self, launches, concurrency=None):
+        """Launch jobs with the bulk job_launch endpoint, and return the answer for each of them."""
+        # A launch adds the credentials it is given to those of its job template, rather than replacing them.
+        with_credentials = set(launch['job_template'] for launch in launches if launch.get('credential', None))
+        job_templates = get_resource('job_template').get_many(sorted(with_credentials), field='id') \
+            if with_credentials else {}
+
+        jobs = []
+        for i, launch in enumerate(launches):
+            job = OrderedDict((('unified_job_template', launch['job_template']), ('identifier', six.text_type(i))))
+            for key, value in launch.items():
+                if key == 'job_template':
+                    continue
+                if key == 'credential':
+                    jt = job_templates[six.text_type(launch['job_template'])]
+                    value = sorted(set(value if isinstance(value, (list, tuple)) else [value]) |
+                                   set(c['id'] for c in jt['summary_fields'].get('credentials', [])))
+                elif key == 'extra_vars' and not isinstance(value, dict):
+                    value = json.loads(parser.process_extra_vars(list(value), force_json=True) or '{}')
+                job[BULK_LAUNCH_FIELDS[key]] = value
+            jobs.append(job)
+
+        def launch_chunk(start):
+            chunk = jobs[start:start + BULK_JOB_LAUNCH_LIMIT]
+            debug.log('Launching %d jobs at once.' % len(chunk), header='details')
+            workflow_job = client.post('/bulk/job_launch/', data={'name': 'tower-cli bulk launch',
+                                                                  'jobs': chunk}).json()
+            nodes = client.get('/workflow_jobs/%d/workflow_nodes/' % workflow_job['id'],
+                               params={'page_size': len(chunk)}).json()['results']
+            by_identifier = dict((node['identifier'], node) for node in nodes)
+            answers = []
+            for job in chunk:
+                node = by_identifier.get(job['identifier'], {})
+                answers.append(OrderedDict((('changed', True), ('id', node.get('job', None)),
+                                            ('workflow_job', workflow_job['id']),
+                                            ('workflow_node', node.get('id', None)))))
+            return answers
+
+        chunks = concurrency_utils.parallel_map(launch_chunk, range(0, len(jobs), BULK_JOB_LAUNCH_LIMIT),
+                                                concurrency)
+        return [answer for answers in chunks for answer in answers]
+
+    def _resolve_bulk_jobs(self, answers, timeout=None, interval=1):
+        """Fill in the ids of the jobs launched in bulk that their workflow jobs had not made yet, reading the
+        nodes of the workflow jobs again until they have. A job whose workflow job finished without making it
+        keeps no id."""
+        start = time.time()
+        while True:
+            waiting = collections.defaultdict(dict)
+            for answer in answers:
+                if answer['id'] is None and answer.get('workflow_node', None):
+                    waiting[answer['workflow_job']][answer['workflow_node']] = answer
+            for workflow_job in list(waiting):
+                nodes = client.get('/workflow_jobs/%d/workflow_nodes/' % workflow_job,
+                                   params={'page_size': BULK_JOB_LAUNCH_LIMIT}).json()['results']
+                for node in nodes:
+                    if node['id'] in waiting[workflow_job] and node.get('job', None):
+                        waiting[workflow_job].pop(node['id'])['id'] = node['job']
+                if waiting[workflow_job] and \
+                        client.get('/workflow_jobs/%d/' % workflow_job).json()['status'] in FINISHED_STATUSES:
+                    for answer in waiting[workflow_job].values():
+                        answer['workflow_node'] = None
+                    waiting[workflow_job].clear()
+                if not waiting[workflow_job]:
+                    del waiting[workflow_job]
+            if not waiting:
+                return
+            if timeout and time.time() - start > timeout:
+                raise exc.Timeout('Waiting for the jobs launched in bulk to start timed out.')
+            debug.log('Waiting for the workflow jobs to make %d jobs.' % sum(len(w) for w in waiting.values()),
+                      header='details')
+            time.sleep(interval)
+
+    @resources.command(use_fields_as_options=False)
+    @click.option('--file', 'launches', type=types.File('r'), required=True,
+                  help='A JSON or YAML file holding a list of launches, each a mapping of the options of launch '
+                       'to values, such as job_template, limit and extra_vars.')
+    @click.option('--concurrency', type=click.IntRange(1), required=False,
+                  help='The most launches to send at the same time. Defaults to the pool_maxsize setting.')
+    @click.option('--wait', is_flag=True, default=False,
+                  help='Wait for all of the launched jobs to finish.')
+    @click.option('--fail-fast', is_flag=True, default=False,
+                  help='With --wait, stop waiting as soon as one of the jobs fails.')
+    @click.option('--timeout', required=False, type=int,
+                  help='If provided with --wait, this command (not the jobs) will time out after the given '
+                       'number of seconds.')
+    def launch_many(self, launches, concurrency=None, wait=False, fail_fast=False, timeout=None,
+                    outfile=sys.stdout):
+        """Launch every job in a file at once, and print a summary of the launches.
+
+        Job templates, inventories and credentials given by name are looked up together, and the jobs are
+        launched with many requests in flight at once.
+
+        =====API DOCS=====
+        Launch many jobs, as ``bulk_launch`` does, and optionally wait for all of them to finish with
+        ``wait_many``.
+
+        :param launches: The launches, each a dictionary of the keyword arguments of ``launch``, or a file
+                         holding them as a JSON or YAML list.
+        :type launches: list
+        :param concurrency: The most launches to send at the same time.
+        :type concurrency: int
+        :param wait: Flag that if set, wait for all of the launched jobs to finish. The ids of jobs launched
+                     in bulk are read from the workflow job that launches them first, once it has made them;
+                     a job that the workflow job finished without making is waited on through the workflow
+                     job instead.
+        :type wait: bool
+        :param fail_fast: Flag that if set with ``wait``, stop waiting as soon as one of the jobs fails.
+        :type fail_fast: bool
+        :param timeout: Number in seconds after which waiting will time out.
+        :type timeout: float
+        :param outfile: Alternative file than stdout to write a line on as each job finishes.
+        :type outfile: file
+        :returns: A dictionary of two fields: "changed", a flag indicating if any job was launched; and
+                  "results", a dictionary for each launch, in order, with the fields "id", "job_template",
+                  "limit", "workflow_job" and "status" of its job.
+        :rtype: dict
+        :raises tower_cli.exceptions.UsageError: When the launches are not a list of mappings, or one has no
+                                                 job template.
+        :raises tower_cli.exceptions.JobFailure: When ``wait`` is set and any of the jobs failed.
+        :raises tower_cli.exceptions.Timeout: When waiting times out.
+
+        =====API DOCS=====
+        """
+        if hasattr(launches, 'read'):
+            launches = parser.string_to_dict(launches.read(), allow_kv=False, require_dict=False)
+        if isinstance(launches, dict):
+            launches = [launches]
+        if not isinstance(launches, list) or not all(isinstance(launch, dict) for launch in launches):
+            raise exc.UsageError('The launches must be a list of mappings of launch options to values.')
+
+        answers = self.bulk_launch(launches, concurrency=concurrency)
+        if wait:
+            self._resolve_bulk_jobs(answers, timeout=timeout)
+        results = []
+        for launch, answer in zip(launches, answers):
+            results.append(OrderedDict((
+                ('id', answer['id']),
+                ('job_template', launch['job_template']),
+                ('limit', launch.get('limit', None)),
+                ('workflow_job', answer.get('workflow_job', None)),
+                ('status', answer.get('status', 'pending')),
+            )))
+
+        if wait and results:
+            waited = self.wait_many([result['id'] or result['workflow_job'] for result in results],
+                                    fail_fast=fail_fast, timeout=timeout, outfile=outfile)
+            statuses = dict((record['id'], record) for record in waited['results'])
+            for result in results:
+                record = statuses[result['id'] or result['workflow_job']]
+                result['status'] = record['status']
+                result['failed'] = record.get('failed', False)
+            if waited['failed']:
+                raise exc.JobFailure('Jobs %s failed.' % ', '.join(
+                    str(result['id'] or result['workflow_job']) for result in results if result['failed']))
+        return OrderedDict((('changed', bool(results)), ('results', results)))
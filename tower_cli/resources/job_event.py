@@ -22,6 +22,7 @@ class Resource(models.BaseResource):
     cli_help = 'View events from jobs.'
     endpoint = '/job_events/'
     internal = True
+    pagination = 'keyset'
 
     job = models.Field(
         type=types.Related('job'), display=True
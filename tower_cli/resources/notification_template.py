@@ -393,6 +393,12 @@ class Resource(models.Resource):
         self._separate(kwargs)
         return super(Resource, self).list(all_pages=all_pages, **kwargs)
 
+    list.stream_method = 'iter_list'
+
+    def iter_list(self, all_pages=True, **kwargs):
+        self._separate(kwargs)
+        return super(Resource, self).iter_list(all_pages=all_pages, **kwargs)
+
     @resources.command
     def get(self, pk=None, **kwargs):
         """Return one and exactly one notification template.
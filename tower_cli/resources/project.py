@@ -114,8 +114,8 @@ class Resource(models.Resource, models.MonitorableResource):
         if organization:
             # Processing the organization flag depends on version
             debug.log('Checking Organization Relationship.', header='details')
-            r = client.options('/projects/')
-            if 'organization' in r.json().get('actions', {}).get('POST', {}):
+            options = client.get_options('/projects/')
+            if 'organization' in options.get('actions', {}).get('POST', {}):
                 kwargs['organization'] = organization
             else:
                 post_associate = True
@@ -310,6 +310,12 @@ class Resource(models.Resource):
         self.configure_display(r)
         return r
 
+    list.stream_method = 'iter_list'
+
+    def iter_list(self, **kwargs):
+        data, self.endpoint = self.data_endpoint(kwargs)
+        return super(Resource, self).iter_list(**data)
+
     @resources.command(
         use_fields_as_options=ACTOR_FIELDS+RESOURCE_FIELDS+['type'])
     def get(self, pk=None, **kwargs):
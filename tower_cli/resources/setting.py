@@ -149,11 +149,11 @@ class Resource(models.Resource):
     def coerce_type(self, key, value):
         if key == 'LICENSE':
             return json.loads(value)
-        r = client.options(self.endpoint)
-        if key not in r.json()['actions']['PUT']:
+        options = client.get_options(self.endpoint)
+        if key not in options['actions']['PUT']:
             raise exc.TowerCLIError('You are trying to modify value of a '
                                     'Read-Only field, which is not allowed')
-        to_type = r.json()['actions']['PUT'].get(key, {}).get('type')
+        to_type = options['actions']['PUT'].get(key, {}).get('type')
         if to_type == 'integer':
             if value != 'null':
                 return int(value)
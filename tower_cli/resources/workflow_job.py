@@ -39,6 +39,9 @@ class Resource(models.ExeResource):
     created = models.Field(required=False, display=True)
     status = models.Field(required=False, display=True)
 
+    # The summary of a workflow job is a table of its jobs, built by `lookup_stdout`.
+    stdout_download = False
+
     def __getattribute__(self, attr):
         """Alias the stdout to `summary` specially for workflow"""
         if attr == 'summary':
@@ -0,0 +1,125 @@
+# Copyright 2017, Ansible by Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import contextlib
+import functools
+import types
+
+from tower_cli import get_resource
+from tower_cli.api import Client
+from tower_cli.conf import settings
+from tower_cli.context import ContextLocal
+
+
+class Session(object):
+    """A connection to one Tower host, as one user, with settings and a
+    client of its own, so that one process can talk to several Tower hosts
+    at the same time.
+
+    The settings of a session are runtime values (see ``settings.runtime_values``) that are in effect
+    only while the session is used, and only in the thread or asyncio task that uses it; other
+    settings are read as usual. Requests are made with the session's own client, and so with its own
+    connection pools and caches.
+
+    :param host: The Tower host to talk to.
+    :type host: str
+    :param token: An OAuth2 token to authenticate with.
+    :type token: str
+    :param username: The username to authenticate with, if no token is given.
+    :type username: str
+    :param password: The password to authenticate with, if no token is given.
+    :type password: str
+    :param `**kwargs`: Any other settings, such as ``verify_ssl``.
+
+    :Example:
+
+    >>> import tower_cli
+    >>> from tower_cli.session import Session
+    >>> staging = Session(host='https://tower-staging', token='...')
+    >>> production = Session(host='https://tower', token='...')
+    >>> staging.get_resource('job_template').list()
+    >>> with production:
+    >>>     print(tower_cli.get_resource('job').list(status='running'))
+    """
+    def __init__(self, host=None, token=None, username=None, password=None, **kwargs):
+        self.settings = dict(kwargs, host=host, oauth_token=token, username=username, password=password)
+        for key, value in list(self.settings.items()):
+            if value is None:
+                self.settings.pop(key)
+        self.client = Client()
+        self._exits = ContextLocal('session', ())
+
+    @contextlib.contextmanager
+    def activate(self):
+        """Use this session in the current thread or asyncio task, until
+        the context manager exits.
+        """
+        with settings.runtime_values(**self.settings):
+            with self.client.activate():
+                yield self
+
+    def __enter__(self):
+        manager = self.activate()
+        manager.__enter__()
+        self._exits.set(self._exits.get() + (manager,))
+        return self
+
+    def __exit__(self, *exc_info):
+        exits = self._exits.get()
+        self._exits.set(exits[:-1])
+        return exits[-1].__exit__(*exc_info)
+
+    def get_resource(self, name):
+        """Return the named resource, with every method called within this
+        session.
+        """
+        return BoundResource(get_resource(name), self)
+
+
+class BoundResource(object):
+    """A resource whose methods are called within a session. Generators
+    that the methods return, such as that of ``iter_list``, are advanced
+    within the session as well.
+    """
+    def __init__(self, resource, session):
+        self.resource = resource
+        self.session = session
+
+    def __getattr__(self, name):
+        attr = getattr(self.resource, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def call(*args, **kwargs):
+            with self.session:
+                result = attr(*args, **kwargs)
+            if isinstance(result, types.GeneratorType):
+                return self._iterate(result)
+            return result
+        return call
+
+    def _iterate(self, generator):
+        while True:
+            with self.session:
+                try:
+                    item = next(generator)
+                except StopIteration:
+                    return
+            yield item
+
+    def __repr__(self):
+        return '<%s bound to %r>' % (type(self.resource).__name__, self.session)
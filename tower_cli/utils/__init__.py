@@ -39,8 +39,4 @@ def secho(message, **kwargs):
 def supports_oauth():
     # Import here to avoid a circular import
     from tower_cli.api import client
-    try:
-        resp = client.head('/o/')
-    except exceptions.NotFound:
-        return False
-    return resp.ok
+    return client.get_capability('oauth2')
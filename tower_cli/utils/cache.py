@@ -0,0 +1,105 @@
+# Copyright 2017, Ansible by Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Small JSON files that keep what tower-cli learns about a Tower server between runs.
+
+Each cache is a JSON object stored in its own file under `CACHE_DIR`. The caches only ever hold
+things that can be learned again, so a cache that cannot be read or written is treated as empty.
+"""
+
+import json
+import os
+import time
+
+from tower_cli.utils import debug
+from tower_cli.utils.data_structures import OrderedDict
+
+
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')), 'tower_cli')
+
+# Disk caches are switched off while the client is in test mode.
+enabled = True
+
+
+def cache_path(name):
+    """Return the path of the file that holds the named cache."""
+    return os.path.join(CACHE_DIR, '%s.json' % name)
+
+
+def load(name):
+    """Return the contents of the named cache, or an empty dict if it does not exist or cannot be read."""
+    if not enabled:
+        return {}
+    try:
+        with open(cache_path(name)) as f:
+            data = json.load(f, object_pairs_hook=OrderedDict)
+    except (IOError, OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return data
+
+
+def save(name, data):
+    """Write `data` to the named cache.
+
+    The file is written under a temporary name and then moved into place, so that another tower-cli
+    process never reads half of it.
+    """
+    if not enabled:
+        return
+    filename = cache_path(name)
+    temp_filename = '%s.%d.tmp' % (filename, os.getpid())
+    try:
+        if not os.path.isdir(CACHE_DIR):
+            os.makedirs(CACHE_DIR, 0o700)
+        with open(temp_filename, 'w') as f:
+            json.dump(data, f)
+        if os.name == 'nt' and os.path.exists(filename):
+            os.remove(filename)
+        os.rename(temp_filename, filename)
+    except (IOError, OSError) as e:
+        debug.log('Unable to write the %s cache: %s' % (name, e), header='details')
+
+
+def is_fresh(entry, ttl):
+    """Return whether a cache entry stamped by `stamp` is younger than `ttl` seconds."""
+    if not isinstance(entry, dict) or not ttl:
+        return False
+    return 0 <= time.time() - entry.get('time', 0) < ttl
+
+
+def stamp(entry):
+    """Mark a cache entry as written now, and return it."""
+    entry['time'] = time.time()
+    return entry
+
+
+def clear():
+    """Remove every cache file, and return the names of the caches that were removed."""
+    try:
+        filenames = sorted(os.listdir(CACHE_DIR))
+    except OSError:
+        return []
+    names = []
+    for filename in filenames:
+        if not filename.endswith('.json'):
+            continue
+        try:
+            os.remove(os.path.join(CACHE_DIR, filename))
+        except OSError as e:
+            debug.log('Unable to remove %s: %s' % (filename, e), header='details')
+            continue
+        names.append(filename[:-len('.json')])
+    return names
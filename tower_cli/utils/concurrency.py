@@ -0,0 +1,126 @@
+# Copyright 2017, Ansible by Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division
+
+import math
+import threading
+from multiprocessing.pool import ThreadPool
+
+from tower_cli import context, exceptions as exc
+from tower_cli.utils import debug
+
+
+def parallel_map(func, items, concurrency=None):
+    """Apply `func` to each of `items` and return the results as a list, in the order of `items`.
+
+    If `concurrency` is greater than one, up to that many calls are run at the same time on a
+    bounded pool of worker threads; otherwise the calls are made one after another. An exception
+    raised by any call is re-raised in the calling thread.
+
+    Requests that the workers make through `tower_cli.api.client` go through a session of each
+    worker's own (see `Client.thread_session`). The workers run with the runtime values and the
+    client of the calling thread (see `tower_cli.context.bind`).
+    """
+    items = list(items)
+    if not concurrency or concurrency <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    func = context.bind(func)
+    pool = ThreadPool(min(concurrency, len(items)))
+    try:
+        return pool.map(func, items, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def parallel_each(func, items, concurrency=None):
+    """Apply `func` to each of `items` as the items are produced, and return the results as a list, in the
+    order of `items`.
+
+    Unlike `parallel_map`, `items` may be a generator that makes requests of its own, such as one that walks
+    the pages of a listing: the calls for the items of one page are made while the next page is read. At most
+    twice `concurrency` items are taken ahead of the calls. Once a call has raised an exception, no more items
+    are taken, and the exception is re-raised in the calling thread.
+    """
+    if not concurrency or concurrency <= 1:
+        return [func(item) for item in items]
+    func = context.bind(func)
+    pool = ThreadPool(concurrency)
+    slots = threading.BoundedSemaphore(concurrency * 2)
+    failed = threading.Event()
+
+    def call(item):
+        try:
+            return func(item)
+        except Exception:
+            failed.set()
+            raise
+        finally:
+            slots.release()
+
+    try:
+        results = []
+        for item in items:
+            slots.acquire()
+            if failed.is_set():
+                break
+            results.append(pool.apply_async(call, (item,)))
+        return [result.get() for result in results]
+    finally:
+        pool.close()
+        pool.join()
+
+
+def page_count(response):
+    """Return the number of pages of a paginated listing, judging by the `count` and size of its
+    first page.
+    """
+    if not response.get('next') or not response.get('results'):
+        return 1
+    return int(math.ceil(response['count'] / len(response['results'])))
+
+
+def fetch_pages(first_page, fetch_page, concurrency=None):
+    """Return every page that follows `first_page` of a paginated listing, in page order.
+
+    `fetch_page` is a callable that takes a page number and returns the decoded response for that
+    page. The number of pages is worked out from the first page, and the remaining pages are fetched
+    on up to `concurrency` worker threads.
+
+    The listing may change while it is being read, so a page that no longer exists is skipped, and
+    if the last page still points to a next page, the pages after it are fetched one at a time.
+    Pages are addressed by offset, so records can still be missed or read twice if records are
+    added or removed while the pages are being read; walk the listing by primary key if that matters.
+    """
+    def fetch(number):
+        try:
+            return fetch_page(number)
+        except exc.NotFound:
+            debug.log('Page %d no longer exists; the listing shrank while it was being read, '
+                      'so some records may be missing.' % number, header='details')
+            return None
+
+    numbers = range(2, page_count(first_page) + 1)
+    pages = [page for page in parallel_map(fetch, numbers, concurrency) if page is not None]
+
+    number = page_count(first_page)
+    last_page = pages[-1] if pages else first_page
+    while last_page.get('next'):
+        number += 1
+        last_page = fetch(number)
+        if last_page is None:
+            break
+        pages.append(last_page)
+    return pages
@@ -0,0 +1,136 @@
+# Copyright 2017, Ansible by Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A cache of GET responses, which are revalidated with Tower using their ETag and Last-Modified headers,
+or reused without asking Tower at all for a short while for the endpoints given in `http_cache_fresh`.
+"""
+
+import threading
+import time
+
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+from tower_cli.conf import settings
+from tower_cli.utils import cache
+from tower_cli.utils.data_structures import OrderedDict
+
+
+# The response headers that are kept with a cached body.
+KEPT_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'X-API-Product-Version')
+
+
+def freshness_windows():
+    """Return the seconds for which responses of each endpoint class may be reused without asking Tower, from
+    the `http_cache_fresh` setting, which reads like "config=60,settings=30"."""
+    windows = {}
+    for item in (settings.http_cache_fresh or '').split(','):
+        name, _, seconds = item.partition('=')
+        if name.strip() and seconds.strip():
+            windows[name.strip().strip('/')] = float(seconds)
+    return windows
+
+
+class HTTPCache(object):
+    """GET responses keyed by the credentials and URL that they were read with.
+
+    The cache is kept in memory, and on disk as well if the `http_cache_disk` setting is on. It holds at most
+    `MAX_ENTRIES` responses, dropping the least recently stored first.
+    """
+    MAX_ENTRIES = 500
+
+    def __init__(self):
+        self.entries = None
+        self.lock = threading.Lock()
+
+    def _entries(self):
+        if self.entries is None:
+            self.entries = cache.load('http') if settings.http_cache_disk else OrderedDict()
+        return self.entries
+
+    def lookup(self, key, endpoint_class):
+        """Return the cached entry for `key` and whether it is still fresh enough to use without asking
+        Tower, or (None, False) if there is none.
+        """
+        with self.lock:
+            entry = self._entries().get(key, None)
+        if entry is None:
+            return None, False
+        window = freshness_windows().get(endpoint_class, 0)
+        return entry, time.time() - entry['time'] < window
+
+    def conditional_headers(self, entry):
+        """Return the headers that ask Tower to answer 304 if the cached entry is still current."""
+        headers = {}
+        if entry['headers'].get('ETag', None):
+            headers['If-None-Match'] = entry['headers']['ETag']
+        if entry['headers'].get('Last-Modified', None):
+            headers['If-Modified-Since'] = entry['headers']['Last-Modified']
+        return headers
+
+    def store(self, key, url, response, endpoint_class):
+        """Keep `response` if Tower can revalidate it or it may be reused for a while."""
+        headers = dict((name, response.headers[name]) for name in KEPT_HEADERS if name in response.headers)
+        if 'ETag' not in headers and 'Last-Modified' not in headers and \
+                not freshness_windows().get(endpoint_class, 0):
+            return
+        with self.lock:
+            entries = self._entries()
+            entries.pop(key, None)
+            entries[key] = {
+                'url': url, 'time': time.time(), 'headers': headers,
+                'body': response.content.decode('utf8'),
+            }
+            while len(entries) > self.MAX_ENTRIES:
+                del entries[next(iter(entries))]
+        self.save()
+
+    def refresh(self, key):
+        """Mark the entry for `key` as confirmed current by Tower just now."""
+        with self.lock:
+            entry = self._entries().get(key, None)
+            if entry is not None:
+                entry['time'] = time.time()
+        self.save()
+
+    def response(self, entry):
+        """Return a response built from a cached entry."""
+        response = Response()
+        response.status_code = 200
+        response.url = entry['url']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.encoding = 'utf-8'
+        response._content = entry['body'].encode('utf8')
+        return response
+
+    def invalidate(self, url):
+        """Forget the responses that a write to `url` may have made stale: those read from `url` or from
+        URLs below it, and those read from URLs that `url` is below, such as the listing it belongs to."""
+        if not self.entries:
+            return
+        with self.lock:
+            stale = [key for key, entry in self.entries.items()
+                     if url.startswith(entry['url']) or entry['url'].startswith(url)]
+            for key in stale:
+                del self.entries[key]
+        if stale:
+            self.save()
+
+    def save(self):
+        if settings.http_cache_disk and self.entries is not None:
+            cache.save('http', self.entries)
+
+    def clear(self):
+        with self.lock:
+            self.entries = None
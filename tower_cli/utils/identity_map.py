@@ -0,0 +1,93 @@
+# Copyright 2017, Ansible by Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+import copy
+import threading
+
+from tower_cli.conf import settings
+
+
+class IdentityMap(object):
+    """Objects read from Tower by their URL, so that one command or library session reads each object once.
+
+    The map is used only while it is switched on, by the `identity_map` setting or by the `active` context
+    manager. Any write to an object's URL, or to a URL below it, removes the object from the map.
+    """
+    def __init__(self):
+        self.objects = {}
+        self.hits = 0
+        self.misses = 0
+        self.depth = 0
+        self.lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.depth > 0 or bool(settings.identity_map)
+
+    @contextlib.contextmanager
+    def active(self):
+        """Use the map for the duration of the block, and empty it at the end of the outermost block."""
+        with self.lock:
+            self.depth += 1
+        try:
+            yield self
+        finally:
+            with self.lock:
+                self.depth -= 1
+                if not self.depth:
+                    self.objects.clear()
+
+    def get(self, url):
+        """Return a copy of the object read from `url`, or None if it is not in the map."""
+        if not self.enabled:
+            return None
+        with self.lock:
+            obj = self.objects.get(url, None)
+            if obj is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return copy.deepcopy(obj)
+
+    def put(self, url, obj):
+        """Remember a copy of the object read from `url`."""
+        if self.enabled:
+            obj = copy.deepcopy(obj)
+            with self.lock:
+                self.objects[url] = obj
+
+    def invalidate(self, url):
+        """Forget the objects that a write to `url` may have changed: the one at `url` and those at URLs
+        that `url` is below, such as the job template that a launch URL belongs to."""
+        if not self.objects:
+            return
+        with self.lock:
+            for key in [key for key in self.objects if url.startswith(key)]:
+                del self.objects[key]
+
+    def clear(self):
+        with self.lock:
+            self.objects.clear()
+
+    @property
+    def stats(self):
+        """Return the hits, misses and size of the map."""
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self.objects)}
+
+    def reset(self):
+        """Forget every object and zero the counters."""
+        with self.lock:
+            self.objects.clear()
+            self.hits = self.misses = 0
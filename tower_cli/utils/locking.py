@@ -0,0 +1,60 @@
+# Copyright 2017, Ansible by Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+import os
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+from tower_cli.utils import debug
+
+
+@contextlib.contextmanager
+def file_lock(filename):
+    """Hold an exclusive lock on `filename` for the duration of the block, waiting for any other
+    holder to let go of it first.
+
+    The lock is advisory: it only keeps out other tower-cli processes and threads that take the same
+    lock. The file is created if it does not exist. If it cannot be opened, the block runs without
+    the lock, since none of our locks guard anything that cannot be fetched from Tower again.
+    """
+    try:
+        fd = os.open(filename, os.O_RDWR | os.O_CREAT, 0o600)
+    except OSError as e:
+        debug.log('Unable to lock %s: %s' % (filename, e), header='details')
+        fd = None
+
+    if fd is not None:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+    try:
+        yield
+    finally:
+        if fd is not None:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            os.close(fd)
@@ -0,0 +1,126 @@
+# Copyright 2017, Ansible by Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Ways of keeping the requests tower-cli sends within what Tower can take."""
+
+import contextlib
+import random
+import threading
+import time
+
+
+class TokenBucket(object):
+    """Let requests through at no more than `rate` per second on average,
+    allowing bursts of up to `capacity` requests.
+    """
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = capacity or max(1.0, self.rate)
+        self.tokens = self.capacity
+        self.updated = time.time()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Take a token, sleeping until one is due if there are none left.
+
+        Tokens are handed out in the order they are asked for: a caller that
+        finds the bucket empty takes the next token due, and sleeps until it
+        is.
+        """
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+
+    def reserve(self):
+        """Take a token, and return how many seconds to wait until it is
+        due, for callers that wait in some other way than sleeping.
+        """
+        with self.lock:
+            now = time.time()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return -self.tokens / self.rate if self.tokens < 0 else 0
+
+
+class ConcurrencyGovernor(object):
+    """Limit how many requests are in flight at once, finding the limit by
+    additive increase and multiplicative decrease.
+
+    Each request that Tower answers promptly raises the limit by a little,
+    up to `maximum`; each that it answers as being overloaded, or a run of
+    several it answers much more slowly than usual, halves it, down to
+    `minimum`.
+    """
+    # A response this many times slower than the running average counts as
+    # slow, once responses take long enough to matter; this many slow
+    # responses in a row count as a sign of overload, so that one outlier
+    # does not.
+    SLOW_FACTOR = 2.0
+    SLOW_FLOOR = 0.1
+    SLOW_RUN = 3
+
+    def __init__(self, maximum, minimum=1):
+        self.maximum = maximum
+        self.minimum = minimum
+        self.limit = float(maximum)
+        self.active = 0
+        self.latency = None
+        self.slow_run = 0
+        self.condition = threading.Condition()
+
+    @contextlib.contextmanager
+    def slot(self):
+        """Hold one of the in-flight slots for the duration of the block,
+        waiting for one to come free first.
+        """
+        with self.condition:
+            while self.active >= int(self.limit):
+                self.condition.wait()
+            self.active += 1
+        try:
+            yield
+        finally:
+            with self.condition:
+                self.active -= 1
+                self.condition.notify()
+
+    def record(self, latency, overloaded=False):
+        """Adjust the limit after a request that took `latency` seconds."""
+        with self.condition:
+            slow = self.latency is not None and latency > max(self.SLOW_FACTOR * self.latency, self.SLOW_FLOOR)
+            self.slow_run = self.slow_run + 1 if slow else 0
+            if overloaded or self.slow_run >= self.SLOW_RUN:
+                self.limit = max(self.minimum, self.limit / 2)
+                self.slow_run = 0
+            elif not slow:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            if self.latency is None:
+                self.latency = latency
+            else:
+                self.latency += (latency - self.latency) / 8
+            self.condition.notify_all()
+
+
+# The longest wait between retries, however many there have been or however
+# long Tower asks for.
+MAX_RETRY_DELAY = 30.0
+
+
+def backoff(attempt, base=0.5, cap=MAX_RETRY_DELAY):
+    """Return how many seconds to wait before retry number `attempt`
+    (counting from 0): exponential in `attempt`, with random jitter so
+    that clients that failed together do not retry together.
+    """
+    return random.uniform(0.5, 1.0) * min(cap, base * 2 ** attempt)